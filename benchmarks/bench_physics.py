@@ -0,0 +1,87 @@
+# benchmarks/bench_physics.py
+"""
+Physics systems: scalar World vs columnar World (`World(columns=True)`).
+
+Builds N fish with random state in one tank and times a tick of each
+system on both engines. Run from the repo root:
+
+    python -m benchmarks.bench_physics
+"""
+from __future__ import annotations
+
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from world import World
+from game_context import GameContext
+from ecs.columns import HAVE_NUMPY
+from ecs.components.core.bounds_component import Bounds
+from ecs.components.core.position_component import Position
+from ecs.components.core.sprite_component import Sprite
+from ecs.components.core.tank_component import Tank
+from ecs.components.core.tank_ref_component import TankRef
+from ecs.components.core.velocity_component import Velocity
+from ecs.components.fish.motion_component import MotionParams
+from ecs.components.fish.speed_intent_component import SpeedIntent
+from ecs.components.fish.steering_intent_component import SteeringIntent
+from ecs.components.fish.target_intent_component import TargetIntent
+from ecs.components.tags.dead_component import DeadFlag
+from ecs.systems.core.avoidance_system import AvoidanceSystem
+from ecs.systems.core.collision_system import CollisionSystem
+from ecs.systems.core.movement_system import MovementSystem
+
+SIZES = (1_000, 10_000, 50_000)
+TICKS = 10
+DT = 1.0 / 60.0
+
+
+def build_world(n: int, columns: bool, seed: int = 1337) -> World:
+    rng = random.Random(seed)
+    world = World(columns=columns)
+    tank = world.create_entity()
+    world.add_component(tank, Tank())
+    world.add_component(tank, Position(0, 0))
+    world.add_component(tank, Bounds(1000, 600))
+    for i in range(n):
+        e = world.create_entity()
+        world.add_component(e, TankRef(tank))
+        # Some fish start outside the walls so every band/clamp branch runs
+        world.add_component(e, Position(rng.uniform(-30, 1030), rng.uniform(-30, 630)))
+        world.add_component(e, Velocity(rng.uniform(-40, 40), rng.uniform(-40, 40)))
+        world.add_component(e, Sprite("goldfish", base_w=60, base_h=40))
+        world.add_component(e, MotionParams(max_speed=60.0, acceleration=120.0, turn_speed=4.0))
+        world.add_component(e, TargetIntent(rng.uniform(0, 1000), rng.uniform(0, 600)))
+        world.add_component(e, SteeringIntent())
+        world.add_component(e, SpeedIntent(rng.uniform(10, 60)))
+        if i % 20 == 0:
+            world.add_component(e, DeadFlag())
+    return world
+
+
+def time_system(system, world: World, ticks: int = TICKS) -> float:
+    """Mean ms per tick (first call excluded: it builds query/index caches)."""
+    system.update(world, DT)
+    t0 = time.perf_counter()
+    for _ in range(ticks):
+        system.update(world, DT)
+    return (time.perf_counter() - t0) * 1000.0 / ticks
+
+
+def main() -> None:
+    ctx = GameContext()
+    systems = [("Avoidance", AvoidanceSystem), ("Movement", MovementSystem),
+               ("Collision", CollisionSystem)]
+    engines = [("scalar", False)] + ([("numpy", True)] if HAVE_NUMPY else [])
+    print(f"{'system':<10} {'fish':>7} " + " ".join(f"{name:>9}" for name, _ in engines) + "   (ms/tick)")
+    for n in SIZES:
+        worlds = {name: build_world(n, cols) for name, cols in engines}
+        for label, cls in systems:
+            cells = [time_system(cls(ctx), worlds[name]) for name, _ in engines]
+            print(f"{label:<10} {n:>7} " + " ".join(f"{ms:>9.2f}" for ms in cells))
+
+
+if __name__ == "__main__":
+    main()
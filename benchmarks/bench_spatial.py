@@ -0,0 +1,68 @@
+# benchmarks/bench_spatial.py
+"""
+Food search: brute-force pellet scan vs the uniform grid (utils/spatial.py).
+
+Times one LookForFood-style nearest-visible-pellet query (radius 250) and one
+ChaseFood-style nearest-pellet query per fish, with growing pellet counts. Run from the repo
+root:
+
+    python -m benchmarks.bench_spatial
+"""
+from __future__ import annotations
+
+import random
+import time
+from math import hypot
+
+from utils.spatial import UniformGrid
+
+FISH = 200
+PELLETS = (100, 1_000, 10_000)
+TANK_W, TANK_H = 1000.0, 600.0
+VISION = 250.0
+
+
+def _brute(fish, pellets):
+    for fx, fy in fish:
+        best = None
+        for i, (px, py) in enumerate(pellets):
+            d = hypot(px - fx, py - fy)
+            if d <= VISION + 8.0 and (best is None or d < best[0]):
+                best = (d, i)
+        nearest = min(range(len(pellets)), key=lambda i: hypot(pellets[i][0] - fx, pellets[i][1] - fy))
+        yield best, nearest
+
+
+def _grid(fish, grid, pellets):
+    for fx, fy in fish:
+        hit = grid.nearest(fx, fy, k=1, max_dist=VISION + 8.0)
+        yield (hit[0] if hit else None), grid.nearest(fx, fy)[0][1]
+
+
+def bench(n_pellets: int, seed: int = 1337) -> dict:
+    rng = random.Random(seed)
+    fish = [(rng.uniform(0, TANK_W), rng.uniform(0, TANK_H)) for _ in range(FISH)]
+    pellets = [(rng.uniform(0, TANK_W), rng.uniform(0, TANK_H)) for _ in range(n_pellets)]
+    grid = UniformGrid(cell_size=64.0)
+    for i, (x, y) in enumerate(pellets):
+        grid.update(i, x, y, 8.0, 8.0)
+
+    t0 = time.perf_counter()
+    brute = list(_brute(fish, pellets))
+    t_brute = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    fast = list(_grid(fish, grid, pellets))
+    t_grid = time.perf_counter() - t0
+    assert [(b and b[1], n) for b, n in brute] == [(b and b[1], n) for b, n in fast]
+    return {"pellets": n_pellets, "brute_us": t_brute * 1e6 / FISH, "grid_us": t_grid * 1e6 / FISH}
+
+
+def main() -> None:
+    print(f"{'pellets':>8} {'brute':>10} {'grid':>10}   (µs per fish, {FISH} fish)")
+    for n in PELLETS:
+        r = bench(n)
+        print(f"{r['pellets']:>8} {r['brute_us']:>10.1f} {r['grid_us']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# benchmarks/bench_sprites.py
+"""
+SpriteCache variant transforms: per-pixel loops vs pygame.surfarray.
+
+Times a cold SpriteCache.get for the dead look (grayscale + flip) and the
+senior look (desaturate + tint + outline) at 64px and 512px, with the loop
+fallback and the NumPy path, and checks both give the same pixels. Run from
+the repo root:
+
+    python -m benchmarks.bench_sprites
+"""
+from __future__ import annotations
+
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from ecs.columns import HAVE_NUMPY
+from ecs.systems.renderers.cache import SpriteCache
+
+SIZES = (64, 512)
+SPRITE = os.path.join("assets", "sprites", "goldfish.png")
+VARIANTS = {"dead": dict(dead=True), "senior": dict(variant="senior")}
+
+
+def _time_get(img: pygame.Surface, size: int, use_numpy: bool, kw: dict):
+    cache = SpriteCache()
+    cache.use_numpy = use_numpy
+    t0 = time.perf_counter()
+    out = cache.get(img, size, size, **kw)
+    return time.perf_counter() - t0, pygame.image.tobytes(out, "RGBA")
+
+
+def bench(img: pygame.Surface, size: int, variant: str) -> dict:
+    kw = VARIANTS[variant]
+    t_loop, loop_px = _time_get(img, size, False, kw)
+    t_np, np_px = min(_time_get(img, size, True, kw) for _ in range(5))
+    assert loop_px == np_px, f"{variant} {size}px: surfarray output differs"
+    return {"size": size, "variant": variant, "loop_ms": t_loop * 1e3, "numpy_ms": t_np * 1e3}
+
+
+def main() -> None:
+    if not HAVE_NUMPY:
+        raise SystemExit("NumPy is not installed: only the loop path is available")
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    img = pygame.image.load(SPRITE).convert_alpha()
+    print(f"{'size':>6} {'variant':>8} {'loop':>10} {'surfarray':>10} {'speedup':>8}   (ms per cold get)")
+    for size in SIZES:
+        for variant in VARIANTS:
+            r = bench(img, size, variant)
+            print(f"{r['size']:>6} {r['variant']:>8} {r['loop_ms']:>10.2f} {r['numpy_ms']:>10.2f}"
+                  f" {r['loop_ms'] / r['numpy_ms']:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
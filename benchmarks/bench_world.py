@@ -0,0 +1,76 @@
+# benchmarks/bench_world.py
+"""
+World storage throughput: create / add / query / destroy at growing sizes.
+
+Per-operation cost should stay flat as the entity count grows (sparse-set
+storage is O(1) per add/remove/destroy). Run from the repo root:
+
+    python -m benchmarks.bench_world
+"""
+from __future__ import annotations
+
+import random
+import time
+
+from world import World
+from ecs.components.core.position_component import Position
+from ecs.components.core.velocity_component import Velocity
+from ecs.components.tags.food_pellet_component import FoodPellet
+
+SIZES = (1_000, 10_000, 50_000)
+
+
+def _per_op_us(seconds: float, ops: int) -> float:
+    return seconds * 1e6 / max(1, ops)
+
+
+def bench(n: int, seed: int = 1337) -> dict:
+    rng = random.Random(seed)
+    world = World()
+    # Systems register their queries up front; adds/destroys keep them current.
+    query = world.query(Position, Velocity)
+
+    t0 = time.perf_counter()
+    ents = [world.create_entity() for _ in range(n)]
+    t_create = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for i, e in enumerate(ents):
+        world.add_component(e, Position(float(i), 0.0))
+        world.add_component(e, Velocity(1.0, 0.0))
+        if i % 50 == 0:
+            world.add_component(e, FoodPellet())
+    t_add = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    hits = sum(1 for _ in query)
+    t_query = time.perf_counter() - t0
+    assert hits == n
+
+    # Destroy a random half (worst case for list-backed storage)
+    victims = rng.sample(ents, n // 2)
+    t0 = time.perf_counter()
+    for e in victims:
+        world.destroy_entity(e)
+    t_destroy = time.perf_counter() - t0
+    world.maintain()
+
+    return {
+        "n": n,
+        "create_us": _per_op_us(t_create, n),
+        "add_us": _per_op_us(t_add, n * 2 + n // 50),
+        "query_us_per_row": _per_op_us(t_query, n),
+        "destroy_us": _per_op_us(t_destroy, len(victims)),
+    }
+
+
+def main() -> None:
+    print(f"{'entities':>9} {'create':>9} {'add':>9} {'query/row':>10} {'destroy':>9}   (µs/op)")
+    for n in SIZES:
+        r = bench(n)
+        print(f"{r['n']:>9} {r['create_us']:>9.3f} {r['add_us']:>9.3f} "
+              f"{r['query_us_per_row']:>10.3f} {r['destroy_us']:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+# benchmarks/headless_sim.py
+"""
+Headless simulation runner: no window, no audio, no frame cap.
+
+Builds TankScene's world, update systems and AI pipeline (TankScene with
+headless=True), stocks the tank with a given fish count and species mix,
+drops pellets at a fixed rate (pellets per simulated second, random x, from
+the surface) and steps a fixed number of ticks as fast as possible. Reports
+ticks/sec, the FrameProfiler per-system breakdown and peak memory.
+
+Run from the repo root:
+
+    python -m benchmarks.headless_sim --fish 500 --species goldfish:3,guppy:1 --feed-rate 2
+    python -m benchmarks.headless_sim --fish 2000 --engine numpy --ticks 600 --json
+    python -m benchmarks.headless_sim --schedule     # dump the system stages and exit
+
+Peak memory is the process' max RSS (resource.getrusage, where available);
+--trace-mem additionally reports the tracemalloc peak of the tick loop, at
+a noticeable cost in ticks/sec.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+# No display/audio device needed (must be set before pygame is imported)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import const
+from ecs.components.fish.brain_component import Brain
+from ecs.components.tags.food_pellet_component import FoodPellet
+from ecs.factories.fish_factory import create_fish
+from ecs.profiler import FrameProfiler
+from game_context import GameContext
+from scenes.tank_scene import TankScene
+from utils.rng import SPAWNING
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def parse_species_mix(spec: Optional[str], species_config: Dict[str, dict]) -> Dict[str, float]:
+    """
+    "goldfish:3,guppy:1" -> {"goldfish": 3.0, "guppy": 1.0}; a bare name has
+    weight 1. None/empty means every configured species, equally weighted.
+    """
+    if not spec:
+        return {sid: 1.0 for sid in species_config}
+    mix: Dict[str, float] = {}
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, weight = part.partition(":")
+        name = name.strip()
+        if name not in species_config:
+            raise ValueError(f"unknown species '{name}' (known: {', '.join(sorted(species_config))})")
+        mix[name] = mix.get(name, 0.0) + (float(weight) if weight else 1.0)
+    if not mix or sum(mix.values()) <= 0.0:
+        raise ValueError(f"species mix '{spec}' has no positive weights")
+    return mix
+
+
+def allocate(total: int, mix: Dict[str, float]) -> Dict[str, int]:
+    """Split `total` fish over the mix by weight (largest remainder, exact total)."""
+    weight_sum = sum(mix.values())
+    shares = {sid: total * w / weight_sum for sid, w in mix.items()}
+    counts = {sid: int(s) for sid, s in shares.items()}
+    rest = total - sum(counts.values())
+    for sid in sorted(shares, key=lambda k: counts[k] - shares[k])[:rest]:
+        counts[sid] += 1
+    return counts
+
+
+def _peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024.0 * 1024.0) if sys.platform == "darwin" else peak / 1024.0
+
+
+def build(fish: int, species: Optional[str] = None, engine: str = "scalar",
+          seed: int = 1337, profile: bool = True, ticks: int = 0, workers: int = 0) -> TankScene:
+    """A populated headless TankScene; the profiler window covers `ticks` ticks."""
+    ctx = GameContext()
+    ctx.rng.reseed(seed)
+    ctx.balancing["physics_engine"] = engine
+    ctx.balancing["system_workers"] = workers
+    ctx.profiler = FrameProfiler(window=max(120, ticks), enabled=profile)
+
+    scene = TankScene(ctx, headless=True, populate=False)
+    counts = allocate(fish, parse_species_mix(species, ctx.species_config or {}))
+    W = float(ctx.logical_tank_w)
+    H = float(ctx.logical_tank_h)
+    rng = ctx.rng.stream(SPAWNING)
+    for sid, n in counts.items():
+        data = ctx.species_config[sid]
+        for _ in range(n):
+            create_fish(scene.world, ctx, scene.tank_entity, sid, data,
+                        rng.uniform(0, W), rng.uniform(0, H))
+    scene.world.update(0.0)
+    return scene
+
+
+def run(fish: int = 200, species: Optional[str] = None, feed_rate: float = 1.0,
+        ticks: int = 1800, dt: float = const.TICK_TIME, engine: str = "scalar",
+        seed: int = 1337, profile: bool = True, trace_mem: bool = False, workers: int = 0) -> dict:
+    """
+    Step a headless tank `ticks` times and return the report dict
+    (see `format_report` for the fields).
+    """
+    scene = build(fish, species, engine=engine, seed=seed, profile=profile, ticks=ticks, workers=workers)
+    ctx = scene.context
+    world = scene.world
+    W = float(ctx.logical_tank_w)
+    rng = ctx.rng.stream(SPAWNING)
+
+    ctx.profiler.reset()  # drop the warm-up update from the breakdown
+    if trace_mem:
+        tracemalloc.start()
+    feed_due = 0.0
+    pellets_dropped = 0
+    t0 = time.perf_counter()
+    for _ in range(ticks):
+        feed_due += feed_rate * dt
+        while feed_due >= 1.0:
+            feed_due -= 1.0
+            if scene.placement.spawn_pellet_at(world, rng.uniform(0, W), 0.0) is not None:
+                pellets_dropped += 1
+        scene.update(dt)
+    elapsed = time.perf_counter() - t0
+    traced_peak = None
+    if trace_mem:
+        traced_peak = tracemalloc.get_traced_memory()[1] / (1024.0 * 1024.0)
+        tracemalloc.stop()
+
+    systems: List[dict] = [
+        {"name": s.name, "calls": s.calls, "mean_ms": s.mean_ms, "p95_ms": s.p95_ms,
+         "max_ms": s.max_ms, "entities": s.entities}
+        for s in ctx.profiler.summaries(phase="update")
+    ] if profile else []
+
+    return {
+        "fish": fish,
+        "species": species or "all",
+        "feed_rate": feed_rate,
+        "engine": "numpy" if world.columns is not None else "scalar",
+        "ticks": ticks,
+        "dt": dt,
+        "seconds": elapsed,
+        "ticks_per_sec": ticks / elapsed if elapsed > 0 else float("inf"),
+        "realtime_factor": ticks * dt / elapsed if elapsed > 0 else float("inf"),
+        "systems": systems,
+        "alive_fish": sum(1 for _ in world.query(Brain)),
+        "pellets_dropped": pellets_dropped,
+        "pellets_left": sum(1 for _ in world.query(FoodPellet)),
+        "entities": len(world.entities),
+        "peak_rss_mb": _peak_rss_mb(),
+        "traced_peak_mb": traced_peak,
+    }
+
+
+def format_report(r: dict) -> str:
+    lines = [
+        f"{r['fish']} fish ({r['species']}), feed {r['feed_rate']:g}/s, engine {r['engine']}, "
+        f"{r['ticks']} ticks @ dt {r['dt']:.4f}",
+        f"  {r['ticks_per_sec']:.1f} ticks/sec  ({r['seconds']:.2f} s wall, "
+        f"{r['realtime_factor']:.1f}x realtime)",
+        f"  end: {r['alive_fish']} fish, {r['pellets_left']} pellets "
+        f"({r['pellets_dropped']} dropped), {r['entities']} entities",
+    ]
+    mem = []
+    if r["peak_rss_mb"] is not None:
+        mem.append(f"peak RSS {r['peak_rss_mb']:.1f} MB")
+    if r["traced_peak_mb"] is not None:
+        mem.append(f"traced peak {r['traced_peak_mb']:.1f} MB")
+    if mem:
+        lines.append("  " + ", ".join(mem))
+    if r["systems"]:
+        lines.append(f"  {'system':<24}{'mean ms':>9}{'p95 ms':>9}{'max ms':>9}{'rows':>9}")
+        for s in r["systems"]:
+            lines.append(f"  {s['name']:<24}{s['mean_ms']:>9.3f}{s['p95_ms']:>9.3f}"
+                         f"{s['max_ms']:>9.3f}{s['entities']:>9.0f}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0],
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--fish", type=int, default=200, help="fish to stock (default 200)")
+    ap.add_argument("--species", default=None,
+                    help="mix as name[:weight],... (default: every species, equal weights)")
+    ap.add_argument("--feed-rate", type=float, default=1.0, help="pellets per simulated second")
+    ap.add_argument("--ticks", type=int, default=1800, help="ticks to step (default 1800)")
+    ap.add_argument("--dt", type=float, default=const.TICK_TIME, help="seconds per tick")
+    ap.add_argument("--sim-hz", type=float, default=None, help="ticks per simulated second (overrides --dt)")
+    ap.add_argument("--engine", choices=("scalar", "numpy"), default="scalar")
+    ap.add_argument("--seed", type=int, default=1337)
+    ap.add_argument("--no-profile", action="store_true", help="skip the per-system breakdown")
+    ap.add_argument("--trace-mem", action="store_true", help="also report the tracemalloc peak")
+    ap.add_argument("--workers", type=int, default=0,
+                    help="threads for independent systems (0 = serial; profiling forces serial)")
+    ap.add_argument("--schedule", action="store_true", help="print the resolved system schedule and exit")
+    ap.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = ap.parse_args(argv)
+    dt = 1.0 / args.sim_hz if args.sim_hz else args.dt
+    if args.schedule:
+        print(build(0, engine=args.engine, workers=args.workers).world.describe_schedule())
+        return
+
+    try:
+        report = run(fish=args.fish, species=args.species, feed_rate=args.feed_rate,
+                     ticks=args.ticks, dt=dt, engine=args.engine, seed=args.seed,
+                     profile=not args.no_profile, trace_mem=args.trace_mem, workers=args.workers)
+    except ValueError as exc:
+        ap.error(str(exc))
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,343 @@
+# benchmarks/suite.py
+"""
+Benchmark suite with regression budgets.
+
+Every case times one operation (an entity op, a system tick, a cache get, a
+frame…) as best-of-N calibrated rounds and reports microseconds per op. Results are
+compared against benchmarks/baseline.json; any case that got slower than the
+threshold (default 25%) is flagged and the run exits with status 1. Run from
+the repo root:
+
+    python -m benchmarks.suite                      # compare against baseline
+    python -m benchmarks.suite --threshold 10       # stricter budget
+    python -m benchmarks.suite --only physics.      # subset (substring match)
+    python -m benchmarks.suite --update-baseline    # record new baseline
+
+Baselines are machine-specific: record one on the machine that checks it.
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from benchmarks.bench_physics import build_world as build_physics_world
+from benchmarks.headless_sim import build as build_headless_tank
+from ecs.columns import HAVE_NUMPY
+from ecs.components.core.position_component import Position
+from ecs.components.core.velocity_component import Velocity
+from ecs.components.fish.brain_component import Brain
+from ecs.fsm import FSM_STATES
+from ecs.systems.core.avoidance_system import AvoidanceSystem
+from ecs.systems.core.collision_system import CollisionSystem
+from ecs.systems.core.movement_system import MovementSystem
+from ecs.systems.renderers.cache import SpriteCache
+from game_context import GameContext
+from utils.rng import SPAWNING
+from world import World
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+DEFAULT_THRESHOLD_PCT = 25.0
+DT = 1.0 / 60.0
+
+# A case's setup returns (fn, ops): fn() is one timed round covering `ops` operations.
+Setup = Callable[[], Tuple[Callable[[], None], int]]
+CASES: Dict[str, Tuple[Setup, str]] = {}
+
+
+def case(name: str, unit: str = "op"):
+    def deco(setup: Setup) -> Setup:
+        CASES[name] = (setup, unit)
+        return setup
+    return deco
+
+
+# ---------------------------------------------------------------------------
+# World storage
+# ---------------------------------------------------------------------------
+WORLD_N = 10_000
+
+
+@case("world.create_add_destroy", "entity")
+def _world_churn():
+    def fn():
+        world = World()
+        query = world.query(Position, Velocity)
+        ents = [world.create_entity() for _ in range(WORLD_N)]
+        for i, e in enumerate(ents):
+            world.add_component(e, Position(float(i), 0.0))
+            world.add_component(e, Velocity(1.0, 0.0))
+        for e in ents:
+            world.destroy_entity(e)
+        world.maintain()
+        assert len(query) == 0
+    return fn, WORLD_N
+
+
+@case("world.query_iter", "row")
+def _world_query():
+    world = World()
+    for i in range(WORLD_N):
+        e = world.create_entity()
+        world.add_component(e, Position(float(i), 0.0))
+        world.add_component(e, Velocity(1.0, 0.0))
+
+    def fn():
+        for _ in world.query(Position, Velocity):
+            pass
+    return fn, WORLD_N
+
+
+# ---------------------------------------------------------------------------
+# Physics systems (one tick at scale, per engine)
+# ---------------------------------------------------------------------------
+PHYSICS_N = 5_000
+
+
+def _physics_case(system_cls, columns: bool):
+    def setup():
+        world = build_physics_world(PHYSICS_N, columns)
+        system = system_cls(GameContext())
+        system.update(world, DT)  # build query/row caches
+
+        def fn():
+            system.update(world, DT)
+        return fn, PHYSICS_N
+    return setup
+
+
+for _label, _cls in (("movement", MovementSystem), ("collision", CollisionSystem),
+                     ("avoidance", AvoidanceSystem)):
+    case(f"physics.{_label}.scalar", "fish")(_physics_case(_cls, False))
+    if HAVE_NUMPY:
+        case(f"physics.{_label}.numpy", "fish")(_physics_case(_cls, True))
+
+
+# ---------------------------------------------------------------------------
+# FSM: BehaviorSystem tick with every fish held in one state
+# ---------------------------------------------------------------------------
+FSM_FISH = 300
+FSM_PELLETS = 60
+
+
+def _fsm_case(state: str):
+    def setup():
+        scene = build_headless_tank(FSM_FISH, seed=7)
+        ctx = scene.context
+        rng = ctx.rng.stream(SPAWNING)
+        for _ in range(FSM_PELLETS):
+            scene.placement.spawn_pellet_at(scene.world, rng.uniform(0, ctx.logical_tank_w),
+                                            rng.uniform(0, ctx.logical_tank_h))
+        for _e, brain in scene.world.query(Brain):
+            brain.state = state
+        scene.update(DT)  # perception, spatial index and enter() calls
+        for _e, brain in scene.world.query(Brain):
+            brain.state = state  # Behavior only proposes: the state now stays put
+
+        def fn():
+            scene.behavior.update(scene.world, DT)
+            scene.world.commands.clear()  # drop eats so every round sees the same pellets
+        return fn, FSM_FISH
+    return setup
+
+
+for _state in FSM_STATES:
+    case(f"fsm.{_state}", "fish")(_fsm_case(_state))
+
+
+# ---------------------------------------------------------------------------
+# SpriteCache
+# ---------------------------------------------------------------------------
+CACHE_W, CACHE_H = 64, 42
+WARM_GETS = 2_000
+
+
+def _sprite_image() -> pygame.Surface:
+    try:
+        return pygame.image.load(os.path.join("assets", "sprites", "goldfish.png")).convert_alpha()
+    except (pygame.error, FileNotFoundError):
+        surf = pygame.Surface((128, 84), pygame.SRCALPHA)
+        surf.fill((230, 140, 40, 255))
+        return surf
+
+
+def _cache_cold_case(**kwargs):
+    def setup():
+        img = _sprite_image()
+
+        def fn():
+            SpriteCache().get(img, CACHE_W, CACHE_H, **kwargs)
+        return fn, 1
+    return setup
+
+
+case("sprite_cache.cold.normal", "get")(_cache_cold_case())
+case("sprite_cache.cold.dead", "get")(_cache_cold_case(dead=True))
+case("sprite_cache.cold.senior", "get")(_cache_cold_case(variant="senior"))
+
+
+@case("sprite_cache.warm", "get")
+def _cache_warm():
+    img = _sprite_image()
+    cache = SpriteCache()
+    variants = [dict(), dict(hflip=True), dict(dead=True), dict(variant="senior")]
+    for kw in variants:
+        cache.get(img, CACHE_W, CACHE_H, **kw)
+
+    def fn():
+        get = cache.get
+        for i in range(WARM_GETS):
+            get(img, CACHE_W, CACHE_H, **variants[i & 3])
+    return fn, WARM_GETS
+
+
+# ---------------------------------------------------------------------------
+# Full render frame (all render systems) to an offscreen surface
+# ---------------------------------------------------------------------------
+RENDER_SIZE = (1280, 800)
+RENDER_FISH = 120
+
+
+@case("render.frame", "frame")
+def _render_frame():
+    from scenes.tank_scene import TankScene
+    from ecs.factories.fish_factory import create_fish
+
+    ctx = GameContext()
+    ctx.rng.reseed(11)
+    rng = ctx.rng.stream(SPAWNING)
+    ctx.assets.load_folder(os.path.join("assets", "sprites"))
+    screen = pygame.Surface(RENDER_SIZE)
+    scene = TankScene(ctx, screen, populate=False)
+    ids = list(ctx.species_config)
+    for i in range(RENDER_FISH):
+        sid = ids[i % len(ids)]
+        create_fish(scene.world, ctx, scene.tank_entity, sid, ctx.species_config[sid],
+                    rng.uniform(0, ctx.logical_tank_w), rng.uniform(0, ctx.logical_tank_h))
+    for _ in range(3):
+        scene.update(DT)
+        scene.render(screen)  # warm sprite/label caches
+
+    def fn():
+        scene.render(screen)
+    return fn, 1
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+def measure(name: str, repeat: int = 7, min_round: float = 0.05) -> dict:
+    """
+    Best-of-`repeat` microseconds per op for one case. Like timeit, each
+    round loops fn() until it lasts at least `min_round` seconds, and the
+    garbage collector is off while timing.
+    """
+    setup, unit = CASES[name]
+    fn, ops = setup()
+    t0 = time.perf_counter()
+    fn()  # warm-up round, also sizes the loop
+    loops = max(1, int(min_round / max(time.perf_counter() - t0, 1e-9)) + 1)
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        best = float("inf")
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            for _ in range(loops):
+                fn()
+            best = min(best, (time.perf_counter() - t0) / loops)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return {"us_per_op": best * 1e6 / ops, "unit": unit}
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict],
+            threshold_pct: float) -> List[Tuple[str, Optional[float], bool]]:
+    """(name, % change vs baseline or None if new, regressed?) per result."""
+    rows = []
+    for name, res in results.items():
+        base = baseline.get(name)
+        if not base or base.get("us_per_op", 0.0) <= 0.0:
+            rows.append((name, None, False))
+            continue
+        pct = (res["us_per_op"] / base["us_per_op"] - 1.0) * 100.0
+        rows.append((name, pct, pct > threshold_pct))
+    return rows
+
+
+def load_baseline(path: str = BASELINE_PATH) -> Dict[str, dict]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f).get("results", {})
+    except FileNotFoundError:
+        return {}
+
+
+def save_baseline(results: Dict[str, dict], path: str = BASELINE_PATH) -> None:
+    data = {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "platform": platform.platform(terse=True),
+            "numpy": HAVE_NUMPY,
+        },
+        "results": {k: results[k] for k in sorted(results)},
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Benchmark suite with regression budgets")
+    ap.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD_PCT,
+                    help=f"flag cases slower than baseline by more than this %% (default {DEFAULT_THRESHOLD_PCT:g})")
+    ap.add_argument("--only", default="", help="run cases whose name contains this substring")
+    ap.add_argument("--repeat", type=int, default=7, help="timed rounds per case (best is kept)")
+    ap.add_argument("--baseline", default=BASELINE_PATH)
+    ap.add_argument("--update-baseline", action="store_true",
+                    help="write results into the baseline (merged with cases not run)")
+    args = ap.parse_args(argv)
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))  # convert_alpha() needs a display surface
+
+    names = [n for n in CASES if args.only in n]
+    baseline = load_baseline(args.baseline)
+    results: Dict[str, dict] = {}
+    print(f"{'case':<30}{'µs/op':>12}{'baseline':>12}{'change':>9}")
+    for name in names:
+        results[name] = measure(name, args.repeat)
+        (_n, pct, bad), = compare({name: results[name]}, baseline, args.threshold)
+        base = baseline.get(name, {}).get("us_per_op")
+        print(f"{name:<30}{results[name]['us_per_op']:>12.3f}"
+              f"{(f'{base:.3f}' if base else '-'):>12}"
+              f"{(f'{pct:+.1f}%' if pct is not None else 'new'):>9}"
+              f"{'  << REGRESSION' if bad else ''}")
+
+    if args.update_baseline:
+        save_baseline({**baseline, **results}, args.baseline)
+        print(f"baseline written: {args.baseline}")
+        return 0
+
+    regressed = [n for n, _pct, bad in compare(results, baseline, args.threshold) if bad]
+    if regressed:
+        print(f"{len(regressed)} case(s) slower than baseline by more than {args.threshold:g}%: "
+              + ", ".join(regressed))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,6 +6,8 @@ DEFAULT_CONFIG = {
     "screen_width": 1500,
     "screen_height": 1000,
     "fullscreen": False,
+    "rng_seed": None,  # int → reproducible runs (all RNG streams derive from it)
+    "sim_hz": 60,      # simulation steps/sec, independent of render FPS
     "audio": {
         "enabled": True,
         "master_volume": 0.8,
@@ -49,6 +51,9 @@ def load_config():
         final["screen_width"]  = int(final["screen_width"])
         final["screen_height"] = int(final["screen_height"])
         final["fullscreen"]    = bool(final["fullscreen"])
+        final["sim_hz"]        = max(1.0, float(final["sim_hz"]))
+        if final.get("rng_seed") is not None:
+            final["rng_seed"] = int(final["rng_seed"])
         a = final.get("audio", {}) or {}
         a["enabled"]       = bool(a.get("enabled", True))
         a["master_volume"] = float(a.get("master_volume", 0.8))
@@ -6,6 +6,23 @@ User settings should NOT be stored here.
 # === Display & Timing ===
 FPS = 60
 TICK_TIME = 1.0 / FPS
+# Simulation rate (fixed steps/sec) — independent of FPS; settings.json "sim_hz"
+# overrides it. Per-tick tuning values are authored for SIM_REFERENCE_HZ and
+# rescaled to the real step (utils/timestep.py).
+SIM_HZ = 60
+SIM_REFERENCE_HZ = 60
+# Max fixed-step updates per rendered frame; a slower frame drops the backlog
+# instead of snowballing (spiral of death)
+MAX_SUBSTEPS = 5
+# Largest dt a single update may take (seconds). A step scaled by time_scale
+# beyond it is split into equal substeps so avoidance bands, turn limits and
+# target arrival stay stable at 10x-100x.
+MAX_STEP_DT = 1.0 / 30.0
+# time_scale presets cycled with ',' / '.'; at FAST_FORWARD_SCALE and above
+# rendering drops to FAST_FORWARD_RENDER_HZ and the frame goes to the sim
+TIME_SCALE_STEPS = (1.0, 2.0, 5.0, 10.0, 25.0, 100.0)
+FAST_FORWARD_SCALE = 5.0
+FAST_FORWARD_RENDER_HZ = 8
 
 # === Colors ===
 WHITE        = (255, 255, 255)
@@ -0,0 +1,215 @@
+# ecs/columns.py
+"""
+Optional NumPy column storage for the physics components.
+
+With `World(columns=True)` the fields of Position, Velocity, MotionParams,
+TargetIntent, SteeringIntent and SpeedIntent live in contiguous float64
+arrays (one row per entity) instead of on the dataclass instances. Batched
+systems (MovementSystem) then run one vectorized pass over those arrays.
+
+The per-object API is unchanged: when a component is attached to a columnar
+World its instance is re-classed to a thin view subclass whose fields read
+and write its entity's row. `isinstance`, `==`, `repr` and every
+`pos.x += ...` in scalar code keep working. When the component is detached
+(or its entity destroyed) the current values are copied back onto the
+instance, so stale references keep their last state.
+
+NumPy is optional: without it `HAVE_NUMPY` is False and the World stays on
+the scalar path.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+try:  # optional dependency
+    import numpy as np
+    HAVE_NUMPY = True
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+    HAVE_NUMPY = False
+
+from ecs.components.core.position_component import Position
+from ecs.components.core.velocity_component import Velocity
+from ecs.components.fish.motion_component import MotionParams
+from ecs.components.fish.target_intent_component import TargetIntent
+from ecs.components.fish.steering_intent_component import SteeringIntent
+from ecs.components.fish.speed_intent_component import SpeedIntent
+
+__all__ = ["HAVE_NUMPY", "COLUMN_SPECS", "PhysicsColumns", "RowCache"]
+
+# Component type -> ((field, column), ...). Column names are unique across
+# types (Velocity.dx and SteeringIntent.dx must not share storage).
+COLUMN_SPECS: Dict[Type[Any], Tuple[Tuple[str, str], ...]] = {
+    Position:       (("x", "pos_x"), ("y", "pos_y")),
+    Velocity:       (("dx", "vel_dx"), ("dy", "vel_dy")),
+    MotionParams:   (("max_speed", "max_speed"), ("acceleration", "acceleration"),
+                     ("turn_speed", "turn_speed"), ("dart_multiplier", "dart_multiplier")),
+    TargetIntent:   (("tx", "target_x"), ("ty", "target_y")),
+    SteeringIntent: (("dx", "steer_dx"), ("dy", "steer_dy")),
+    SpeedIntent:    (("desired_speed", "desired_speed"),),
+}
+
+_INITIAL_CAPACITY = 64
+
+
+def _column_property(field: str, column: str) -> property:
+    def fget(self):
+        return getattr(self._cols, column).item(self._row)
+
+    def fset(self, value):
+        getattr(self._cols, column)[self._row] = value
+
+    return property(fget, fset, doc=f"{field} (column '{column}')")
+
+
+def _make_view(base: Type[Any], spec: Tuple[Tuple[str, str], ...]) -> Type[Any]:
+    """Subclass of `base` whose fields are properties onto a PhysicsColumns row."""
+    names = tuple(f for f, _ in spec)
+
+    def __eq__(self, other):
+        if not isinstance(other, base):
+            return NotImplemented
+        return all(getattr(self, n) == getattr(other, n) for n in names)
+
+    ns: Dict[str, Any] = {
+        "__eq__": __eq__,
+        "__hash__": None,
+        "__qualname__": base.__qualname__,
+        "__module__": base.__module__,
+        "_column_base": base,
+    }
+    for field, column in spec:
+        ns[field] = _column_property(field, column)
+    return type(base.__name__, (base,), ns)
+
+
+class PhysicsColumns:
+    """Row-per-entity float64 columns for the physics components."""
+
+    def __init__(self, capacity: int = _INITIAL_CAPACITY) -> None:
+        if not HAVE_NUMPY:
+            raise RuntimeError("PhysicsColumns requires numpy")
+        self.capacity = max(1, int(capacity))
+        self.column_names: List[str] = [c for spec in COLUMN_SPECS.values() for _, c in spec]
+        for name in self.column_names:
+            setattr(self, name, np.zeros(self.capacity, dtype=np.float64))
+        self._views: Dict[Type[Any], Type[Any]] = {
+            base: _make_view(base, spec) for base, spec in COLUMN_SPECS.items()
+        }
+        self._row_of: Dict[int, int] = {}
+        self._free_rows: List[int] = []
+        self._next_row = 0
+
+    def __len__(self) -> int:
+        return len(self._row_of)
+
+    def __contains__(self, component_type: object) -> bool:
+        """True if `component_type` is stored in columns."""
+        return component_type in COLUMN_SPECS
+
+    @staticmethod
+    def component_type(cls: Type[Any]) -> Type[Any]:
+        """Map a view class back to its dataclass (identity for other types)."""
+        return getattr(cls, "_column_base", cls)
+
+    # ---- rows ----------------------------------------------------------------
+    def row_of(self, entity: int) -> Optional[int]:
+        return self._row_of.get(entity)
+
+    def rows_for(self, entities) -> "np.ndarray":
+        """Row indices for the given entities (all must be bound), in order."""
+        row_of = self._row_of
+        return np.fromiter((row_of[e] for e in entities), dtype=np.intp)
+
+    def _ensure_row(self, entity: int) -> int:
+        row = self._row_of.get(entity)
+        if row is not None:
+            return row
+        if self._free_rows:
+            row = self._free_rows.pop()
+        else:
+            row = self._next_row
+            self._next_row += 1
+            if row >= self.capacity:
+                self._grow(row + 1)
+        self._row_of[entity] = row
+        return row
+
+    def _grow(self, needed: int) -> None:
+        cap = self.capacity
+        while cap < needed:
+            cap *= 2
+        for name in self.column_names:
+            old = getattr(self, name)
+            new = np.zeros(cap, dtype=np.float64)
+            new[: self.capacity] = old
+            setattr(self, name, new)
+        self.capacity = cap
+
+    # ---- binding (World only) ------------------------------------------------
+    def bind(self, entity: int, component: Any) -> None:
+        """Move `component`'s field values into `entity`'s row; re-class it as a view."""
+        owner = component.__dict__.get("_cols")
+        if owner is not None:
+            if owner is self and component._row == self._row_of.get(entity):
+                return  # already bound here
+            owner.unbind(component)
+        base = type(component)
+        spec = COLUMN_SPECS[base]
+        row = self._ensure_row(entity)
+        d = component.__dict__
+        for field, column in spec:
+            getattr(self, column)[row] = d.pop(field)
+        d["_cols"] = self
+        d["_row"] = row
+        component.__class__ = self._views[base]
+
+    def unbind(self, component: Any) -> None:
+        """Copy the row's values back onto `component` and make it a plain dataclass again."""
+        d = component.__dict__
+        if d.get("_cols") is not self:
+            return
+        base = type(component)._column_base
+        row = d.pop("_row")
+        del d["_cols"]
+        for field, column in COLUMN_SPECS[base]:
+            d[field] = getattr(self, column).item(row)
+        component.__class__ = base
+
+    def release(self, entity: int) -> None:
+        """Free `entity`'s row (its components must already be unbound)."""
+        row = self._row_of.pop(entity, None)
+        if row is not None:
+            self._free_rows.append(row)
+
+
+class RowCache:
+    """
+    Column rows for one query's entities (optionally minus those with a tag),
+    in query order. Batched systems call `refresh(world)` each tick; the
+    entity list and row array are rebuilt only when either query changed.
+    """
+    __slots__ = ("types", "without", "entities", "rows", "_key")
+
+    def __init__(self, types: Tuple[Type[Any], ...], without: Optional[Type[Any]] = None) -> None:
+        self.types = tuple(types)
+        self.without = without
+        self.entities: List[int] = []
+        self.rows = None
+        self._key = None
+
+    def refresh(self, world) -> bool:
+        """Bring `entities`/`rows` up to date. True if they were rebuilt."""
+        query = world.query(*self.types)
+        excluded = world.query(self.without) if self.without is not None else None
+        key = (id(query), query.version,
+               None if excluded is None else (id(excluded), excluded.version))
+        if key == self._key:
+            return False
+        if excluded is None:
+            self.entities = list(query.entities())
+        else:
+            self.entities = [e for e in query.entities() if e not in excluded]
+        self.rows = world.columns.rows_for(self.entities)
+        self._key = key
+        return True
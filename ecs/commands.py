@@ -0,0 +1,89 @@
+# ecs/commands.py
+"""
+Deferred structural command buffer (`world.commands`).
+
+Systems that change the world's *structure* (create/destroy entities,
+add/remove components) while iterating a query record the change here
+instead. World applies the buffer in bulk at its sync points: before the
+update phase, and after every update system that queued something. Inside a
+system, queries therefore iterate a structure that does not change under
+them.
+
+Data changes (pos.x += ...) stay direct; only structural changes are deferred.
+
+    world.commands.destroy_entity(pellet)
+    world.commands.add_component(e, DeadFlag())
+"""
+from __future__ import annotations
+
+from typing import Any, List, Set, Tuple, Type
+
+__all__ = ["CommandBuffer"]
+
+_DESTROY = 0
+_ADD = 1
+_REMOVE = 2
+
+
+class CommandBuffer:
+    def __init__(self, world) -> None:
+        self._world = world
+        self._ops: List[Tuple[int, int, Any]] = []
+        # Entities queued for destruction; lets systems skip them before flush
+        self._doomed: Set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._ops)
+
+    def __bool__(self) -> bool:
+        return bool(self._ops)
+
+    # ---- recording -----------------------------------------------------------
+    def create_entity(self, *components: Any) -> int:
+        """
+        Reserve a handle now; its components are attached at the next flush.
+        The empty entity matches no query until then.
+        """
+        e = self._world.create_entity()
+        for comp in components:
+            self._ops.append((_ADD, e, comp))
+        return e
+
+    def destroy_entity(self, entity: int) -> None:
+        if entity in self._doomed:
+            return
+        self._doomed.add(entity)
+        self._ops.append((_DESTROY, entity, None))
+
+    def add_component(self, entity: int, component: Any) -> None:
+        self._ops.append((_ADD, entity, component))
+
+    def remove_component(self, entity: int, component_type: Type[Any]) -> None:
+        self._ops.append((_REMOVE, entity, component_type))
+
+    def is_pending_destroy(self, entity: int) -> bool:
+        """True if `entity` will be destroyed at the next flush."""
+        return entity in self._doomed
+
+    # ---- playback ------------------------------------------------------------
+    def flush(self) -> int:
+        """Apply all queued commands in recording order. Returns how many ran."""
+        if not self._ops:
+            return 0
+        w = self._world
+        ops = self._ops
+        # Swap first: commands issued while applying land in the next batch
+        self._ops = []
+        self._doomed = set()
+        for op, entity, arg in ops:
+            if op == _ADD:
+                w.add_component(entity, arg)
+            elif op == _REMOVE:
+                w.remove_component(entity, arg)
+            elif op == _DESTROY:
+                w.destroy_entity(entity)
+        return len(ops)
+
+    def clear(self) -> None:
+        self._ops.clear()
+        self._doomed.clear()
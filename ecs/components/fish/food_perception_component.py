@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from typing import Optional
+
+@dataclass
+class FoodPerception:
+    """
+    Per-tick food sensing, filled by FoodPerceptionSystem before BehaviorSystem.
+    States trust it only while `valid` (fresh this tick); otherwise they scan.
+    """
+    valid: bool = False
+    # Nearest pellet overall (ChaseFood) + its center, eat radius and distance
+    pellet: Optional[int] = None
+    cx: float = 0.0
+    cy: float = 0.0
+    radius: float = 0.0       # sprite half-size * FoodPellet.radius_scale
+    distance: float = 0.0     # fish center -> pellet center
+    can_eat: bool = False     # mouth-to-pellet test passed
+    # Nearest pellet inside food_detect_radius (LookForFood)
+    visible: Optional[int] = None
+    visible_cx: float = 0.0
+    visible_cy: float = 0.0
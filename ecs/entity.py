@@ -0,0 +1,98 @@
+# ecs/entity.py
+"""
+Generational entity handles.
+
+An entity handle is a plain int packing a slot index (low bits) and a
+generation counter (high bits). World recycles slots through a free list and
+bumps the slot's generation on destroy, so a stale handle held by a system
+never aliases the entity that later reuses its slot: `world.is_alive(h)`
+and every component lookup simply miss.
+
+Handles stay ints so they keep working as dict keys, in TankRef, in
+`fish_screen_rects`, etc. Slot 0 is reserved, so a handle is never 0 and a
+fresh World still hands out 1, 2, 3, ...
+
+`EntityTable` is the matching side-table: a flat list indexed by slot whose
+size is bounded by the peak number of live entities (not by how many were
+ever created), and which ignores entries written for older generations.
+"""
+from __future__ import annotations
+
+from typing import Any, Generic, Iterator, List, Optional, Tuple, TypeVar
+
+__all__ = [
+    "INDEX_BITS",
+    "INDEX_MASK",
+    "entity_index",
+    "entity_generation",
+    "make_handle",
+    "EntityTable",
+]
+
+INDEX_BITS = 22                    # ~4M simultaneously live entities
+INDEX_MASK = (1 << INDEX_BITS) - 1
+
+T = TypeVar("T")
+
+
+def make_handle(index: int, generation: int) -> int:
+    return (generation << INDEX_BITS) | index
+
+
+def entity_index(handle: int) -> int:
+    return handle & INDEX_MASK
+
+
+def entity_generation(handle: int) -> int:
+    return handle >> INDEX_BITS
+
+
+class EntityTable(Generic[T]):
+    """Per-entity side table indexed by slot; stale handles read as missing."""
+    __slots__ = ("_handles", "_values")
+
+    def __init__(self) -> None:
+        self._handles: List[int] = []
+        self._values: List[Any] = []
+
+    def get(self, handle: int, default: Optional[T] = None) -> Optional[T]:
+        i = handle & INDEX_MASK
+        if i < len(self._handles) and self._handles[i] == handle:
+            return self._values[i]
+        return default
+
+    def __contains__(self, handle: int) -> bool:
+        i = handle & INDEX_MASK
+        return i < len(self._handles) and self._handles[i] == handle
+
+    def __setitem__(self, handle: int, value: T) -> None:
+        i = handle & INDEX_MASK
+        handles = self._handles
+        if i >= len(handles):
+            grow = i + 1 - len(handles)
+            handles.extend([0] * grow)
+            self._values.extend([None] * grow)
+        handles[i] = handle
+        self._values[i] = value
+
+    def pop(self, handle: int, default: Optional[T] = None) -> Optional[T]:
+        i = handle & INDEX_MASK
+        if i < len(self._handles) and self._handles[i] == handle:
+            value = self._values[i]
+            self._handles[i] = 0
+            self._values[i] = None
+            return value
+        return default
+
+    def clear(self) -> None:
+        self._handles.clear()
+        self._values.clear()
+
+    def values(self) -> Iterator[T]:
+        return (v for h, v in zip(self._handles, self._values) if h)
+
+    def items(self) -> Iterator[Tuple[int, T]]:
+        return ((h, v) for h, v in zip(self._handles, self._values) if h)
+
+    def __len__(self) -> int:
+        return sum(1 for h in self._handles if h)
@@ -36,17 +36,19 @@ from ecs.components.fish.target_intent_component import TargetIntent
 from ecs.components.fish.steering_intent_component import SteeringIntent
 from ecs.components.fish.speed_intent_component import SpeedIntent
 from ecs.components.fish.breeding_component import Breeding
+from utils.rng import SPAWNING
 
 
 # Keys that should vary less to keep movement feel consistent across runs.
 _STABILITY_KEYS = {"speed", "acceleration", "turn_speed", "hunger_rate"}
 
 
-def _jitter(value: Any, key: str) -> Any:
+def _jitter(value: Any, key: str, rng: random.Random) -> Any:
     """
     Return a jittered copy of numeric values; non-numerics are returned as-is.
 
     Stable keys get a small ±4% noise. All other numeric keys get ±10%.
+    Draws come from `rng` (the "spawning" stream in game code).
     """
     if not isinstance(value, (int, float)):
         return value
@@ -56,7 +58,7 @@ def _jitter(value: Any, key: str) -> Any:
     else:
         span = 0.10
 
-    return value * (1.0 + random.uniform(-span, span))
+    return value * (1.0 + rng.uniform(-span, span))
 
 
 def create_fish(
@@ -118,8 +120,9 @@ def create_fish(
     merged_behavior.update(species_behavior)
 
     # ---- Apply jitter for personal variation -----------------------------------
-    merged_stats = {k: _jitter(v, k) for k, v in merged_stats.items()}
-    merged_behavior = {k: _jitter(v, k) for k, v in merged_behavior.items()}
+    rng = context.rng.stream(SPAWNING)
+    merged_stats = {k: _jitter(v, k, rng) for k, v in merged_stats.items()}
+    merged_behavior = {k: _jitter(v, k, rng) for k, v in merged_behavior.items()}
 
     # ---- Entity + core components ----------------------------------------------
     e = world.create_entity()
@@ -1,9 +1,30 @@
+from utils.timestep import blend_factor
+
+
 class BaseState:
     NAME = "Base"
+    # SLICED states split update() into a cheap per-tick tick() and a
+    # decide() that BehaviorSystem may run only every few ticks (with the
+    # time elapsed since the previous decision) when it has an AI budget.
+    # deadline() names a forced exit; BehaviorSystem puts it on a world
+    # timer so a sliced fish never overstays waiting for its cohort.
+    SLICED = False
     def enter(self, fish, context): pass
     def exit(self, fish, context): pass
     def update(self, fish, speed_intent, context, dt, world):
         raise NotImplementedError
+    def tick(self, fish, speed_intent, context, dt, world): pass
+    def decide(self, fish, context, dt, world): return None
+    def deadline(self, fish):
+        """state_timer value at which decide() must run (a forced exit), or None."""
+        return None
     def set_target(self, fish, tx, ty):
         fish.brain.tx = tx; fish.brain.ty = ty
-        fish.target.tx = tx; fish.target.ty = ty
\ No newline at end of file
+        fish.target.tx = tx; fish.target.ty = ty
+    def approach_speed(self, fish, speed_intent, context, dt):
+        """Ease current_desired_speed toward max_speed * _speed_factor (dt-correct smoothing)."""
+        b = fish.brain
+        smooth = float(context.balancing.get("state_speed_smoothing", 0.10))
+        target_speed = fish.motion.max_speed * b._speed_factor
+        b.current_desired_speed += (target_speed - b.current_desired_speed) * blend_factor(smooth, dt)
+        speed_intent.desired_speed = b.current_desired_speed
\ No newline at end of file
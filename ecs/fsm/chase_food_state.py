@@ -4,12 +4,16 @@ from ecs.components.core.position_component import Position
 from ecs.components.core.sprite_component import Sprite
 from ecs.components.core.tank_ref_component import TankRef
 from utils.geometry import get_mouth_logical
+from utils.spatial import LAYER_PELLETS
+
+# Logical px: more than a pellet moves in one sim step (grid positions lag a tick)
+_GRID_SLACK = 8.0
+
 class ChaseFoodState(BaseState):
     NAME = "ChaseFood"
     @staticmethod
     def _pellet_center_and_radius(world, pellet_id):
-        comps = getattr(world, "_components", {})
-        if pellet_id not in comps: return None, None, None
+        if not world.is_alive(pellet_id): return None, None, None
         pos = world.get_component(pellet_id, Position)
         spr = world.get_component(pellet_id, Sprite)
         pellet = world.get_component(pellet_id, FoodPellet)
@@ -27,8 +31,22 @@ class ChaseFoodState(BaseState):
     @staticmethod
     def _nearest_pellet(world, from_x, from_y):
         nearest, best_d2 = None, None
-        for pe in world.entities_with(FoodPellet, Position, Sprite, TankRef):
-            ppos = world.get_component(pe, Position); pspr = world.get_component(pe, Sprite)
+        doomed = world.commands.is_pending_destroy
+        pellets = world.query(FoodPellet, Position, Sprite, TankRef)
+        if world.spatial is not None:
+            # Grid centers are from the end of the previous tick: the stale
+            # nearest bounds the search, then every pellet that could beat it
+            # is ranked by its current Position (same metric as the scan below)
+            grid = world.spatial[LAYER_PELLETS]
+            hits = grid.nearest(from_x, from_y, k=1, accept=lambda pe: pe in pellets and not doomed(pe))
+            if not hits:
+                return None
+            near = grid.query_radius(from_x, from_y, hits[0][0] + 2 * _GRID_SLACK)
+            rows = [row for row in map(pellets.get, near) if row is not None]
+        else:
+            rows = pellets
+        for pe, _pellet, ppos, pspr, _tank in rows:
+            if doomed(pe): continue  # already eaten this tick
             cx = ppos.x + pspr.base_w * 0.5; cy = ppos.y + pspr.base_h * 0.5
             dx, dy = cx - from_x, cy - from_y
             d2 = dx*dx + dy*dy
@@ -42,37 +60,45 @@ class ChaseFoodState(BaseState):
 
     def update(self, fish, speed_intent, context, dt, world):
         b, t = fish.brain, fish.tuning
-        fx = fish.pos.x + fish.sprite.base_w * 0.5
-        fy = fish.pos.y + fish.sprite.base_h * 0.5
-        target_pellet = self._nearest_pellet(world, fx, fy)
+        percept = fish.perception
+        sensed = percept is not None and percept.valid and not world.commands.is_pending_destroy(percept.pellet)
+        if sensed:
+            # Batched sensing (FoodPerceptionSystem) already did the scan + eat test
+            target_pellet = percept.pellet
+            pcx, pcy, pr, can_eat = percept.cx, percept.cy, percept.radius, percept.can_eat
+        else:
+            fx = fish.pos.x + fish.sprite.base_w * 0.5
+            fy = fish.pos.y + fish.sprite.base_h * 0.5
+            target_pellet = self._nearest_pellet(world, fx, fy)
+            pcx = pcy = pr = None
+            if target_pellet is not None:
+                pcx, pcy, pr = self._pellet_center_and_radius(world, target_pellet)
         if target_pellet is None:
             threshold = float(t.get("food_seek_threshold", 0.5))
             hungry = (fish.hunger.hunger / max(1e-6, fish.hunger.hunger_max)) < threshold
             return "LookForFood" if hungry else "Cruise"
         b._target_pellet = target_pellet
-        pcx, pcy, pr = self._pellet_center_and_radius(world, target_pellet)
         if pcx is None:
             b._target_pellet = None; return None
-        mx, my = get_mouth_logical(fish.pos, fish.sprite, target_x=pcx)
-        mouth_r = self._mouth_radius(fish)
-        eat_margin = float(t.get("eat_extra_margin", 6.0))
+        if not sensed:
+            mx, my = get_mouth_logical(fish.pos, fish.sprite, target_x=pcx)
+            mouth_r = self._mouth_radius(fish)
+            eat_margin = float(t.get("eat_extra_margin", 6.0))
+            dx, dy = pcx - mx, pcy - my
+            dist = (dx*dx + dy*dy) ** 0.5
+            can_eat = dist <= (pr + mouth_r + eat_margin)
         self.set_target(fish, pcx, pcy)
-        smooth = float(context.balancing.get("state_speed_smoothing", 0.10))
-        target_speed = fish.motion.max_speed * b._speed_factor
-        b.current_desired_speed += (target_speed - b.current_desired_speed) * smooth
-        speed_intent.desired_speed = b.current_desired_speed
-        dx, dy = pcx - mx, pcy - my
-        dist = (dx*dx + dy*dy) ** 0.5
-        if dist <= (pr + mouth_r + eat_margin):
+        self.approach_speed(fish, speed_intent, context, dt)
+        if can_eat:
             pellet = world.get_component(target_pellet, FoodPellet)
             nutrition = float(getattr(pellet, "nutrition", 40.0))
             audio = getattr(context, "audio", None)
             if audio:
                 audio.play("bite")
             fish.hunger.hunger = min(fish.hunger.hunger_max, fish.hunger.hunger + nutrition)
-            world.destroy_entity(target_pellet)
+            world.commands.destroy_entity(target_pellet)
             b._target_pellet = None
             threshold = float(t.get("food_seek_threshold", 0.5))
             hungry = (fish.hunger.hunger / max(1e-6, fish.hunger.hunger_max)) < threshold
             return "LookForFood" if hungry else "Cruise"
-        return None
\ No newline at end of file
+        return None
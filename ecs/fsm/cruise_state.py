@@ -1,8 +1,10 @@
-import random
 from math import hypot
 from ecs.fsm.base_state import BaseState
+from utils.rng import AI
+from utils.timestep import step_chance
 class CruiseState(BaseState):
     NAME = "Cruise"
+    SLICED = True
 
     def enter(self, fish, context):
         brain = fish.brain
@@ -23,7 +25,7 @@ class CruiseState(BaseState):
         brain._speed_factor = float(speed_fac)
         brain._leave_chance = float(leave_ch)
 
-        from random import uniform
+        uniform = context.rng.stream(AI).uniform
         self.set_target(fish,
                         uniform(0, context.logical_tank_w),
                         uniform(0, context.logical_tank_h)
@@ -31,20 +33,26 @@ class CruiseState(BaseState):
         brain.next_state_time = brain._cruise_min + uniform(0.0, 2.0)
 
     def update(self, fish, speed_intent, context, dt, world):
+        self.tick(fish, speed_intent, context, dt, world)
+        return self.decide(fish, context, dt, world)
+
+    def tick(self, fish, speed_intent, context, dt, world):
+        self.approach_speed(fish, speed_intent, context, dt)
+        fish.brain.state_timer += dt
+
+    def deadline(self, fish):
+        return fish.brain._cruise_max
+
+    def decide(self, fish, context, dt, world):
         b = fish.brain; pos = fish.pos
+        rng = context.rng.stream(AI)
         if hypot(b.tx - pos.x, b.ty - pos.y) < b._arrival:
             self.set_target(fish,
-                random.uniform(0, context.logical_tank_w),
-                random.uniform(0, context.logical_tank_h)
+                rng.uniform(0, context.logical_tank_w),
+                rng.uniform(0, context.logical_tank_h)
             )
-        smooth = float(context.balancing.get("state_speed_smoothing", 0.10))
-        target_speed = fish.motion.max_speed * b._speed_factor
-        b.current_desired_speed += (target_speed - b.current_desired_speed) * smooth
-        speed_intent.desired_speed = b.current_desired_speed
-        b.state_timer += dt
         if b.state_timer > b._cruise_max: return "Idle"
         if b.state_timer > b.next_state_time:
-            import random as _r
-            if _r.random() < b._leave_chance * _r.uniform(0.7, 1.3):
+            if rng.random() < step_chance(b._leave_chance * rng.uniform(0.7, 1.3), dt):
                 return "Idle"
         return None
@@ -17,7 +17,7 @@ class DeadState(BaseState):
         # fish_view doesn’t keep entity/world by default; set via systems that call enter().
         # Safer approach: attach directly on known components via world if available.
         if world is not None and fish_entity is not None:
-            world.add_component(fish_entity, AffectedByGravity(speed=sink))
+            world.commands.add_component(fish_entity, AffectedByGravity(speed=sink))
         else:
             # Fallback: try to mutate through the view if it exposes world/add (some setups do)
             try:
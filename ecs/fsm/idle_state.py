@@ -1,7 +1,10 @@
-import random, math
+import math
 from ecs.fsm.base_state import BaseState
+from utils.rng import AI
+from utils.timestep import step_chance
 class IdleState(BaseState):
     NAME = "Idle"
+    SLICED = True
     def enter(self, fish, context):
         b = fish.brain; t = fish.tuning
         b.state_timer = 0.0
@@ -10,28 +13,35 @@ class IdleState(BaseState):
         b._amp = t.get("idle_bob_amplitude"); b._freq = t.get("idle_bob_frequency")
         b.idle_origin_x = fish.pos.x; b.idle_origin_y = fish.pos.y
         self._pick_new_idle_target(fish, context)
-        b.next_state_time = b._min + random.uniform(0.0, 3.0)
+        b.next_state_time = b._min + context.rng.stream(AI).uniform(0.0, 3.0)
     def _pick_new_idle_target(self, fish, context):
-        b = fish.brain; amp = b._amp
-        tx = max(0, min(context.logical_tank_w, b.idle_origin_x + random.uniform(-amp, amp)))
-        ty = max(0, min(context.logical_tank_h, b.idle_origin_y + random.uniform(-amp, amp)))
+        b = fish.brain; amp = b._amp; rng = context.rng.stream(AI)
+        tx = max(0, min(context.logical_tank_w, b.idle_origin_x + rng.uniform(-amp, amp)))
+        ty = max(0, min(context.logical_tank_h, b.idle_origin_y + rng.uniform(-amp, amp)))
+        b.idle_anchor_x = tx; b.idle_anchor_y = ty
         self.set_target(fish, tx, ty)
     def update(self, fish, speed_intent, context, dt, world):
-        b = fish.brain; pos = fish.pos
+        self.tick(fish, speed_intent, context, dt, world)
+        return self.decide(fish, context, dt, world)
+    def tick(self, fish, speed_intent, context, dt, world):
+        b = fish.brain
         b.state_timer += dt
         amp, freq = b._amp, b._freq
         fx = float(context.balancing.get("idle_bob_x_factor", 1.0))
         fy = float(context.balancing.get("idle_bob_y_factor", 0.8))
         sx = math.sin(b.state_timer * freq) * (amp * 0.25) * fx
         sy = math.cos(b.state_timer * freq * 0.8) * (amp * 0.25) * fy
-        self.set_target(fish, b.tx + sx, b.ty + sy)
-        smooth = float(context.balancing.get("state_speed_smoothing", 0.10))
-        target_speed = fish.motion.max_speed * b._speed_factor
-        b.current_desired_speed += (target_speed - b.current_desired_speed) * smooth
-        speed_intent.desired_speed = b.current_desired_speed
+        # Bob around the anchor as a function of state_timer (not accumulated
+        # per tick), so the path is the same at any sim rate
+        self.set_target(fish, b.idle_anchor_x + sx, b.idle_anchor_y + sy)
+        self.approach_speed(fish, speed_intent, context, dt)
+    def deadline(self, fish):
+        return fish.brain._max
+    def decide(self, fish, context, dt, world):
+        b = fish.brain
         if b.state_timer > b._max: return "Cruise"
         if b.state_timer > b.next_state_time:
-            import random as _r
-            if _r.random() < fish.tuning.get("transition_to_cruise_chance") * _r.uniform(0.7, 1.3):
+            rng = context.rng.stream(AI)
+            if rng.random() < step_chance(fish.tuning.get("transition_to_cruise_chance") * rng.uniform(0.7, 1.3), dt):
                 return "Cruise"
-        return None
\ No newline at end of file
+        return None
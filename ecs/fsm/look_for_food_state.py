@@ -1,10 +1,12 @@
-import random
 from math import hypot
 from ecs.fsm.base_state import BaseState
+from ecs.fsm.chase_food_state import _GRID_SLACK
 from ecs.components.tags.food_pellet_component import FoodPellet
 from ecs.components.core.position_component import Position
 from ecs.components.core.sprite_component import Sprite
 from ecs.components.core.tank_ref_component import TankRef
+from utils.rng import AI
+from utils.spatial import LAYER_PELLETS
 class LookForFoodState(BaseState):
     NAME = "LookForFood"
     def enter(self, fish, context):
@@ -14,14 +16,37 @@ class LookForFoodState(BaseState):
         b._retarget_interval = 0.8; b._retarget_timer = 0.0
         b._target_pellet = None
         self.set_target(fish,
-            random.uniform(0, context.logical_tank_w),
-            random.uniform(0, context.logical_tank_h)
+            context.rng.stream(AI).uniform(0, context.logical_tank_w),
+            context.rng.stream(AI).uniform(0, context.logical_tank_h)
         )
     def _nearest_visible_pellet(self, world, fish_pos, fish_spr, radius):
         fx = fish_pos.x + fish_spr.base_w * 0.5; fy = fish_pos.y + fish_spr.base_h * 0.5
         nearest, best_d, best_cx, best_cy = None, float("inf"), None, None
-        for e in world.entities_with(FoodPellet, Position, Sprite, TankRef):
-            p = world.get_component(e, Position); s = world.get_component(e, Sprite)
+        doomed = world.commands.is_pending_destroy
+        pellets = world.query(FoodPellet, Position, Sprite, TankRef)
+        if world.spatial is not None:
+            # Grid centers lag a tick (see ChaseFoodState._nearest_pellet): the
+            # stale nearest bounds the search, then the rows are ranked by
+            # current Position with the same visibility test as the scan below
+            grid = world.spatial[LAYER_PELLETS]
+            def visible(e):
+                row = pellets.get(e)
+                if row is None or doomed(e): return False
+                _e, _pellet, p, s, _tank = row
+                pr = max(s.base_w, s.base_h) * 0.5
+                return hypot(p.x + s.base_w * 0.5 - fx, p.y + s.base_h * 0.5 - fy) <= radius + pr
+            # A visible pellet's stale center is within reach; any visible one
+            # nearer than the stale hit now is within its distance + 2 slack
+            reach = radius + grid.max_half_extent + 2 * _GRID_SLACK
+            hits = grid.nearest(fx, fy, k=1, max_dist=reach, accept=visible)
+            if not hits:
+                return None, None, None
+            near = grid.query_radius(fx, fy, min(reach, hits[0][0] + 2 * _GRID_SLACK))
+            rows = [row for row in map(pellets.get, near) if row is not None]
+        else:
+            rows = pellets
+        for e, _pellet, p, s, _tank in rows:
+            if doomed(e): continue  # already eaten this tick
             cx = p.x + s.base_w * 0.5; cy = p.y + s.base_h * 0.5
             pr = max(s.base_w, s.base_h) * 0.5
             d = hypot(cx - fx, cy - fy)
@@ -30,8 +55,12 @@ class LookForFoodState(BaseState):
         return nearest, best_cx, best_cy
     def update(self, fish, speed_intent, context, dt, world):
         b, pos, spr, t = fish.brain, fish.pos, fish.sprite, fish.tuning
-        vision = float(t.get("food_detect_radius", 200.0))
-        target_id, cx, cy = self._nearest_visible_pellet(world, pos, spr, vision)
+        percept = fish.perception
+        if percept is not None and percept.valid and not world.commands.is_pending_destroy(percept.visible):
+            target_id, cx, cy = percept.visible, percept.visible_cx, percept.visible_cy
+        else:
+            vision = float(t.get("food_detect_radius", 200.0))
+            target_id, cx, cy = self._nearest_visible_pellet(world, pos, spr, vision)
         if target_id is not None:
             b._target_pellet = target_id
             b._target_pellet_cx = cx; b._target_pellet_cy = cy
@@ -40,11 +69,8 @@ class LookForFoodState(BaseState):
         if b._retarget_timer >= b._retarget_interval:
             b._retarget_timer = 0.0
             self.set_target(fish,
-                random.uniform(0, context.logical_tank_w),
-                random.uniform(0, context.logical_tank_h)
+                context.rng.stream(AI).uniform(0, context.logical_tank_w),
+                context.rng.stream(AI).uniform(0, context.logical_tank_h)
             )
-        smooth = float(context.balancing.get("state_speed_smoothing", 0.10))
-        target_speed = fish.motion.max_speed * b._speed_factor
-        b.current_desired_speed += (target_speed - b.current_desired_speed) * smooth
-        speed_intent.desired_speed = b.current_desired_speed
+        self.approach_speed(fish, speed_intent, context, dt)
         return None
@@ -0,0 +1,123 @@
+# ecs/profiler.py
+"""
+Opt-in per-system frame profiler.
+
+World.update / World.render (and TankScene's AI sandwich) route each system
+call through `FrameProfiler.run` while `enabled` is True; when disabled they
+take the plain loop, so the cost is one attribute check per phase.
+
+Per section we keep a rolling window of wall times and "entities touched"
+(the size of every query the section asked the World for), plus a total
+call count. `mark()` counts World ticks/frames per phase, so a system that
+runs at a reduced rate (metabolism, population guard) can be weighted by its
+calls per frame. `summaries()` turns that into min/mean/p95/max rows for the
+F7 debug panel and the headless runner.
+"""
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+__all__ = ["FrameProfiler", "SectionSummary"]
+
+
+@dataclass
+class SectionSummary:
+    name: str
+    phase: str
+    calls: int
+    min_ms: float
+    mean_ms: float
+    p95_ms: float
+    max_ms: float
+    entities: float  # mean entities touched per call (window)
+    per_frame: float = 1.0  # calls per marked frame (1.0 with no frames marked)
+
+    @property
+    def frame_ms(self) -> float:
+        """Mean cost per frame: per-call mean weighted by calls per frame."""
+        return self.mean_ms * self.per_frame
+
+
+class _Section:
+    __slots__ = ("name", "phase", "calls", "times", "entities")
+
+    def __init__(self, name: str, phase: str, window: int) -> None:
+        self.name = name
+        self.phase = phase
+        self.calls = 0
+        self.times: Deque[float] = deque(maxlen=window)
+        self.entities: Deque[int] = deque(maxlen=window)
+
+
+class FrameProfiler:
+    def __init__(self, window: int = 120, enabled: bool = False) -> None:
+        self.window = int(window)
+        self.enabled = bool(enabled)
+        self._sections: Dict[str, _Section] = {}
+        self._frames: Dict[str, int] = {}
+
+    # ---- recording -----------------------------------------------------------
+    def mark(self, phase: str = "update") -> None:
+        """One World update/render pass of `phase` ran (profiled)."""
+        self._frames[phase] = self._frames.get(phase, 0) + 1
+
+    def record(self, name: str, seconds: float, entities: int = 0, phase: str = "update") -> None:
+        sec = self._sections.get(name)
+        if sec is None:
+            sec = self._sections[name] = _Section(name, phase, self.window)
+        sec.calls += 1
+        sec.times.append(seconds)
+        sec.entities.append(entities)
+
+    def run(self, name: str, world, fn: Callable[..., Any], *args: Any, phase: str = "update") -> Any:
+        """Call fn(*args), timing it and counting the query rows it asked `world` for."""
+        world._rows_touched = 0
+        t0 = perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            elapsed = perf_counter() - t0
+            rows = world._rows_touched or 0
+            world._rows_touched = None
+            self.record(name, elapsed, rows, phase)
+
+    def run_system(self, world, system: Any, dt: float, phase: str = "update") -> None:
+        self.run(type(system).__name__, world, system.update, world, dt, phase=phase)
+
+    def reset(self) -> None:
+        self._sections.clear()
+        self._frames.clear()
+
+    # ---- reporting -----------------------------------------------------------
+    def summaries(self, phase: Optional[str] = None) -> List[SectionSummary]:
+        """Per-section window stats, slowest (by mean) first."""
+        out: List[SectionSummary] = []
+        for sec in self._sections.values():
+            if phase is not None and sec.phase != phase:
+                continue
+            if not sec.times:
+                continue
+            ts = sorted(sec.times)
+            frames = self._frames.get(sec.phase, 0)
+            n = len(ts)
+            p95 = ts[min(n - 1, int(round(0.95 * (n - 1))))]
+            out.append(SectionSummary(
+                name=sec.name,
+                phase=sec.phase,
+                calls=sec.calls,
+                min_ms=ts[0] * 1000.0,
+                mean_ms=sum(ts) / n * 1000.0,
+                p95_ms=p95 * 1000.0,
+                max_ms=ts[-1] * 1000.0,
+                entities=sum(sec.entities) / len(sec.entities),
+                per_frame=sec.calls / frames if frames else 1.0,
+            ))
+        out.sort(key=lambda s: s.mean_ms, reverse=True)
+        return out
+
+    def total_mean_ms(self, phase: Optional[str] = None) -> float:
+        """Mean ms per frame over all sections (rate-weighted, see frame_ms)."""
+        return sum(s.frame_ms for s in self.summaries(phase))
@@ -0,0 +1,69 @@
+# ecs/query.py
+"""
+Cached, incrementally-maintained query views.
+
+`world.query(Position, Velocity)` returns a Query registered on the World.
+The World keeps its member rows up to date inside add_component /
+remove_component / destroy_entity, so iterating a query costs O(matches)
+instead of O(all entities), and no set intersection is rebuilt per call.
+
+Iterating yields flat rows `(entity, comp_a, comp_b, ...)` in the order the
+entities joined the query (creation order for entities built in one go):
+
+    for e, pos, vel in world.query(Position, Velocity):
+        pos.x += vel.dx * dt
+"""
+from __future__ import annotations
+
+from typing import Any, Iterator, Tuple, Type
+
+from ecs.storage import SparseSet
+
+__all__ = ["Query"]
+
+
+class Query:
+    __slots__ = ("types", "_rows", "version")
+
+    def __init__(self, types: Tuple[Type[Any], ...]) -> None:
+        self.types = types
+        # Bumped whenever a row is added, replaced or dropped; lets batched
+        # systems cache per-query index arrays and rebuild only when it moves.
+        self.version = 0
+        # entity id -> (entity, *components)
+        self._rows: SparseSet[Tuple[Any, ...]] = SparseSet()
+
+    def __repr__(self) -> str:
+        names = ", ".join(t.__name__ for t in self.types)
+        return f"Query({names}; {len(self._rows)} matches)"
+
+    # ---- read API ------------------------------------------------------------
+    def __iter__(self) -> Iterator[Tuple[Any, ...]]:
+        return self._rows.values()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, entity: object) -> bool:
+        return entity in self._rows
+
+    def entities(self) -> Iterator[int]:
+        """Matching entity ids, without building component tuples."""
+        return iter(self._rows)
+
+    def get(self, entity: int):
+        """The row for one entity, or None if it does not match."""
+        return self._rows.get(entity)
+
+    # ---- maintenance (World only) --------------------------------------------
+    def _set(self, entity: int, row: Tuple[Any, ...]) -> None:
+        self._rows.add(entity, row)
+        self.version += 1
+
+    def _discard(self, entity: int) -> None:
+        if self._rows.remove(entity) is not None:
+            self.version += 1
+
+    def _compact(self) -> None:
+        if self._rows.needs_compact():
+            self._rows.compact()
@@ -0,0 +1,178 @@
+# ecs/schedule.py
+"""
+System access declarations and the dependency-aware stage builder.
+
+A system may declare what it touches as class attributes:
+
+    READS  = (MotionParams, SpeedIntent)   # fields it reads
+    WRITES = (Position, Velocity)          # fields it writes
+
+Entries are component types or resource names (strings: SPATIAL, COMMANDS,
+...). Only field access counts: a component used purely as a query filter
+needs no entry, because structural changes go through the command buffer and
+are applied between stages. A system that queues commands lists COMMANDS in
+WRITES, so command order stays deterministic.
+
+A system without declarations is a barrier: it runs after everything
+registered before it and before everything registered after it.
+
+`build_stages` places each system in the first stage after every earlier
+system it conflicts with (read/write or write/write on a shared entry).
+Systems in one stage are independent and may run concurrently; registration
+order only matters between systems that conflict.
+
+Run conditions (`add_system(..., run_if=...)`) are callables `cond(world) ->
+bool` checked before a system is entered; a list means all must hold. The
+stock ones:
+
+    flag(context, "show_fish_vision", ...)   any named attribute is truthy
+    components_changed(Brain, DeadFlag)      entities gained/lost/replaced one
+    resource_changed(lambda: ctx.logical_tank_w)   the returned value moved
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, FrozenSet, List, Optional, Sequence, Tuple
+
+__all__ = [
+    "COMMANDS", "SPATIAL", "POPULATION", "TIMERS", "access", "conflicts", "build_stages", "describe",
+    "flag", "components_changed", "resource_changed", "all_of",
+]
+
+# Resource names for non-component state
+COMMANDS = "commands"      # world.commands (structural changes)
+SPATIAL = "spatial"        # world.spatial (SpatialIndexSystem)
+POPULATION = "population"  # context.population_ok (PopulationGuard)
+TIMERS = "timers"          # world.timers (scheduling or cancelling timed events)
+
+Access = Optional[Tuple[FrozenSet[Any], FrozenSet[Any]]]
+
+
+def access(system: Any) -> Access:
+    """(reads, writes) declared by `system`, or None for a barrier."""
+    reads = getattr(system, "READS", None)
+    writes = getattr(system, "WRITES", None)
+    if reads is None and writes is None:
+        return None
+    return frozenset(reads or ()), frozenset(writes or ())
+
+
+def conflicts(a: Access, b: Access) -> bool:
+    if a is None or b is None:
+        return True
+    reads_a, writes_a = a
+    reads_b, writes_b = b
+    return bool(writes_a & (reads_b | writes_b) or writes_b & reads_a)
+
+
+def build_stages(systems: Sequence[Any]) -> List[List[int]]:
+    """Indices of `systems` grouped into stages that can run one after another."""
+    accesses = [access(s) for s in systems]
+    levels: List[int] = []
+    for i, a in enumerate(accesses):
+        level = 0
+        for j in range(i):
+            if levels[j] >= level and conflicts(a, accesses[j]):
+                level = levels[j] + 1
+        levels.append(level)
+    stages: List[List[int]] = [[] for _ in range(max(levels) + 1)] if levels else []
+    for i, level in enumerate(levels):
+        stages[level].append(i)
+    return stages
+
+
+# ---------------------------------------------------------------------------
+# Run conditions
+# ---------------------------------------------------------------------------
+Condition = Callable[[Any], bool]
+
+
+def flag(obj: Any, *names: str) -> Condition:
+    """True while any of `obj`'s named attributes is truthy (missing → False)."""
+    def cond(world: Any) -> bool:
+        for name in names:
+            if getattr(obj, name, False):
+                return True
+        return False
+    cond.__name__ = f"flag({', '.join(names)})"
+    return cond
+
+
+class components_changed:
+    """
+    True when the set of entities holding any of `types` changed (a component
+    added, removed or replaced) since the last check; the first check is True.
+    """
+    def __init__(self, *types: type) -> None:
+        if not types:
+            raise ValueError("components_changed() needs at least one component type")
+        self.types = types
+        self.__name__ = f"components_changed({', '.join(t.__name__ for t in types)})"
+        self._seen: Optional[Tuple[int, ...]] = None
+
+    def __call__(self, world: Any) -> bool:
+        versions = tuple(world.query(t).version for t in self.types)
+        if versions == self._seen:
+            return False
+        self._seen = versions
+        return True
+
+
+class resource_changed:
+    """True when `read()` returns something different from the last check (first check: True)."""
+    _UNSET = object()
+
+    def __init__(self, read: Callable[[], Any], name: str = "") -> None:
+        self.read = read
+        self.__name__ = f"resource_changed({name or getattr(read, '__name__', '?')})"
+        self._seen: Any = self._UNSET
+
+    def __call__(self, world: Any) -> bool:
+        value = self.read()
+        if value == self._seen:
+            return False
+        self._seen = value
+        return True
+
+
+def all_of(conds: Any) -> Optional[Condition]:
+    """Normalize `run_if` (None, one condition or a sequence) to one callable."""
+    if conds is None:
+        return None
+    if callable(conds):
+        return conds
+    conds = tuple(conds)
+    if len(conds) == 1:
+        return conds[0]
+
+    def cond(world: Any) -> bool:
+        # Evaluate every one: change-detecting conditions must see each tick
+        results = [c(world) for c in conds]
+        return all(results)
+    cond.__name__ = " & ".join(getattr(c, "__name__", "?") for c in conds)
+    return cond
+
+
+def _label(entry: Any) -> str:
+    return entry if isinstance(entry, str) else getattr(entry, "__name__", repr(entry))
+
+
+def describe(systems: Sequence[Any], stages: List[List[int]],
+             notes: Optional[Sequence[str]] = None) -> str:
+    """Human-readable schedule: one block per stage, one line per system."""
+    lines = []
+    for n, stage in enumerate(stages):
+        lines.append(f"stage {n}" + (" (parallel)" if len(stage) > 1 else ""))
+        for i in stage:
+            system = systems[i]
+            a = access(system)
+            line = f"  {type(system).__name__}"
+            if notes and notes[i]:
+                line += f" [{notes[i]}]"
+            if a is None:
+                line += "  barrier"
+            else:
+                reads, writes = a
+                line += (f"  reads: {', '.join(sorted(map(_label, reads))) or '-'}"
+                         f"  writes: {', '.join(sorted(map(_label, writes))) or '-'}")
+            lines.append(line)
+    return "\n".join(lines)
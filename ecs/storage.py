@@ -0,0 +1,120 @@
+# ecs/storage.py
+"""
+Sparse-set storage used by World.
+
+A SparseSet maps entity ids to values with O(1) add / get / remove and packed
+iteration over two parallel dense lists (entity ids + values).
+
+Removal leaves a tombstone (None) in the dense lists instead of shifting or
+swapping, so iteration order stays the order entities joined the set (the
+same "creation order" stability World always promised) and removing while a
+loop is running is safe. Tombstones are squeezed out by `compact()`, which
+World calls at its sync points (never in the middle of a query).
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Generic, Iterator, List, Optional, Tuple, TypeVar
+
+__all__ = ["SparseSet"]
+
+T = TypeVar("T")
+
+
+class SparseSet(Generic[T]):
+    __slots__ = ("_sparse", "_dense", "_data", "_holes")
+
+    def __init__(self) -> None:
+        # entity id -> index into the dense lists
+        self._sparse: Dict[int, int] = {}
+        # packed entity ids (None = tombstone) and their values
+        self._dense: List[Optional[int]] = []
+        self._data: List[Any] = []
+        self._holes: int = 0
+
+    # ---- size / membership ---------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._sparse)
+
+    def __bool__(self) -> bool:
+        return bool(self._sparse)
+
+    def __contains__(self, entity: object) -> bool:
+        return entity in self._sparse
+
+    @property
+    def holes(self) -> int:
+        """Number of tombstones waiting for `compact()`."""
+        return self._holes
+
+    # ---- element access ------------------------------------------------------
+    def get(self, entity: int, default: Optional[T] = None) -> Optional[T]:
+        i = self._sparse.get(entity)
+        return default if i is None else self._data[i]
+
+    def add(self, entity: int, value: T) -> bool:
+        """Insert or replace. Returns True when the entity is new to the set."""
+        i = self._sparse.get(entity)
+        if i is not None:
+            self._data[i] = value
+            return False
+        self._sparse[entity] = len(self._dense)
+        self._dense.append(entity)
+        self._data.append(value)
+        return True
+
+    def remove(self, entity: int) -> Optional[T]:
+        """Remove and return the value (None if the entity was not present)."""
+        i = self._sparse.pop(entity, None)
+        if i is None:
+            return None
+        value = self._data[i]
+        self._dense[i] = None
+        self._data[i] = None
+        self._holes += 1
+        return value
+
+    def clear(self) -> None:
+        self._sparse.clear()
+        self._dense.clear()
+        self._data.clear()
+        self._holes = 0
+
+    # ---- iteration (packed, skips tombstones) --------------------------------
+    def __iter__(self) -> Iterator[int]:
+        for e in self._dense:
+            if e is not None:
+                yield e
+
+    def values(self) -> Iterator[T]:
+        data = self._data
+        for i, e in enumerate(self._dense):
+            if e is not None:
+                yield data[i]
+
+    def items(self) -> Iterator[Tuple[int, T]]:
+        data = self._data
+        for i, e in enumerate(self._dense):
+            if e is not None:
+                yield e, data[i]
+
+    # ---- maintenance ---------------------------------------------------------
+    def compact(self) -> None:
+        """Drop tombstones, preserving order. O(len); call between queries."""
+        if not self._holes:
+            return
+        dense: List[Optional[int]] = []
+        data: List[Any] = []
+        sparse = self._sparse
+        for e, value in zip(self._dense, self._data):
+            if e is None:
+                continue
+            sparse[e] = len(dense)
+            dense.append(e)
+            data.append(value)
+        self._dense = dense
+        self._data = data
+        self._holes = 0
+
+    def needs_compact(self) -> bool:
+        # Amortized O(1): only rebuild once tombstones outnumber live entries.
+        return self._holes > 32 and self._holes * 2 > len(self._dense)
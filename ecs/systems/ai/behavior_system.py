@@ -13,13 +13,28 @@ Responsibilities
 
 Notes
 * This system does not mutate Brain.state directly — it only proposes transitions.
-* A small cache of FishView objects avoids reallocations each frame.
+* A small cache of FishView objects avoids reallocations each frame. It is an
+  EntityTable (slot-indexed), so it stays bounded as pellets/fish churn and a
+  recycled slot never picks up a dead entity's view.
+
+Time slicing
+* With `ai_decision_budget` (balancing) > 0 and more fish than the budget,
+  fish are dealt round-robin into ceil(fish / budget) cohorts (at most
+  `ai_max_cohorts`). Fish in SLICED states (Cruise, Idle) run the state's cheap
+  `tick()` every tick but its `decide()` only on their cohort's tick, with the
+  time elapsed since their previous decision.
+* Urgent fish decide immediately: the first tick in a state, DeadFlag, and a
+  state's deadline() (e.g. cruise_max_time) — a world timer armed on entering
+  the state flags it, so nobody polls the deadline off-cohort.
+  Food states, Dead and Egg are never sliced, so a pellet coming into view
+  is always handled on the tick it appears.
 """
 
 from __future__ import annotations
 
-from typing import Dict, Optional, Tuple
+from typing import Dict, Optional, Set
 
+from ecs.entity import EntityTable
 from ecs.views.fish_view import FishView
 from ecs.fsm import FSM_STATES
 from ecs.components.fish.brain_component import Brain
@@ -33,6 +48,8 @@ from ecs.components.fish.target_intent_component import TargetIntent
 from ecs.components.fish.steering_intent_component import SteeringIntent
 from ecs.components.fish.speed_intent_component import SpeedIntent
 from ecs.components.core.tank_ref_component import TankRef
+from ecs.components.fish.food_perception_component import FoodPerception
+from ecs.components.tags.dead_component import DeadFlag
 
 
 class BehaviorSystem:
@@ -49,16 +66,26 @@ class BehaviorSystem:
     def __init__(self, context) -> None:
         self.context = context
 
-        # entity_id -> FishView (reused/updated each frame)
-        self._views: Dict[int, FishView] = {}
+        # entity -> FishView (reused/updated each frame)
+        self._views: EntityTable[FishView] = EntityTable()
 
-        # Tracks whether we've called enter() for (entity, state_name).
-        # Using a set is slightly cheaper than a dict of booleans.
-        self._entered: Dict[Tuple[int, str], bool] = {}
+        # entity -> names of states we've called enter() for.
+        self._entered: EntityTable[Set[str]] = EntityTable()
 
         # Cache FSM registry reference (micro-optimization on dict global).
         self._fsm = FSM_STATES
 
+        # Time slicing: max full decisions per tick (0 → everyone every tick)
+        b = getattr(context, "balancing", None) or {}
+        self.budget = max(0, int(b.get("ai_decision_budget", 0)))
+        self.max_cohorts = max(1, int(b.get("ai_max_cohorts", 8)))
+        self.cohorts = 1
+        self._tick = 0
+        # entity -> [state name, seconds since its last decide(), ticket,
+        # deadline due, deadline timer] for sliced fish; the ticket picks the cohort
+        self._pending: EntityTable[list] = EntityTable()
+        self._tickets = 0
+
     # --------------------------------------------------------------------- #
     # Internal helpers
     # --------------------------------------------------------------------- #
@@ -103,10 +130,52 @@ class BehaviorSystem:
         """
         Call enter() exactly once per (entity, state_name).
         """
-        key = (e, brain.state)
-        if key not in self._entered:
+        entered = self._entered.get(e)
+        if entered is None:
+            entered = self._entered[e] = set()
+        if brain.state not in entered:
             self._fsm[brain.state].enter(view, self.context)
-            self._entered[key] = True
+            entered.add(brain.state)
+
+    def _cohort_count(self, fish: int) -> int:
+        if self.budget <= 0 or fish <= self.budget:
+            return 1
+        return min(self.max_cohorts, -(-fish // self.budget))
+
+    def _deadline_due(self, e: int) -> None:
+        pending = self._pending.get(e)
+        if pending is not None:
+            pending[3] = True
+
+    def _arm_deadline(self, e: int, pending: list, state, view: FishView, world) -> None:
+        world.timers.cancel(pending[4])
+        pending[3] = False
+        limit = state.deadline(view)
+        pending[4] = None if limit is None else world.timers.schedule(
+            world.time + max(0.0, limit - view.brain.state_timer), self._deadline_due, e)
+
+    def _drop_pending(self, e: int, world) -> None:
+        pending = self._pending.pop(e)
+        if pending is not None:
+            world.timers.cancel(pending[4])
+
+    def _sliced_update(self, e: int, brain: Brain, state, view: FishView,
+                       speed: SpeedIntent, dt: float, world) -> Optional[str]:
+        """Full update of a sliced state: tick() plus decide() over the elapsed time."""
+        pending = self._pending.get(e)
+        if pending is None:
+            pending = self._pending[e] = [brain.state, 0.0, self._tickets, False, None]
+            self._tickets += 1
+            self._arm_deadline(e, pending, state, view, world)
+        elif pending[0] != brain.state:
+            pending[0] = brain.state
+            pending[1] = 0.0
+            self._arm_deadline(e, pending, state, view, world)
+        state.tick(view, speed, self.context, dt, world)
+        elapsed = pending[1] + dt
+        pending[1] = 0.0
+        pending[3] = False
+        return state.decide(view, self.context, elapsed, world)
 
     # --------------------------------------------------------------------- #
     # ECS system API
@@ -123,20 +192,39 @@ class BehaviorSystem:
         """
         proposed: Dict[int, Optional[str]] = {}
         fsm = self._fsm  # local ref
-
-        # Iterate only over entities that have all required components.
-        for e in world.entities_with(*self._REQUIRED):
-            # Pull components once each (local vars are faster & clearer).
-            brain: Brain = world.get_component(e, Brain)
-            pos: Position = world.get_component(e, Position)
-            vel: Velocity = world.get_component(e, Velocity)
-            motion: MotionParams = world.get_component(e, MotionParams)
-            hunger: Hunger = world.get_component(e, Hunger)
-            sprite: Sprite = world.get_component(e, Sprite)
-            tuning: BehaviorTuning = world.get_component(e, BehaviorTuning)
-            target: TargetIntent = world.get_component(e, TargetIntent)
-            steer: SteeringIntent = world.get_component(e, SteeringIntent)
-            speed: SpeedIntent = world.get_component(e, SpeedIntent)
+        rows = world.query(*self._REQUIRED)
+
+        cohorts = self._cohort_count(len(rows))
+        if cohorts == 1 and self.cohorts > 1:
+            # Unsliced again: drop stale elapsed time and deadline timers
+            for pending in self._pending.values():
+                world.timers.cancel(pending[4])
+            self._pending.clear()
+        self.cohorts = cohorts
+        tick = self._tick
+        self._tick += 1
+
+        pending_get = self._pending.get
+        dead = world.query(DeadFlag)
+        context = self.context
+
+        # Iterate only over entities that have all required components;
+        # the cached query hands us the components in _REQUIRED order.
+        for (e, brain, pos, motion, vel, hunger,
+             tuning, sprite, _tank, target, steer, speed) in rows:
+
+            state = fsm[brain.state]
+            if cohorts > 1 and state.SLICED:
+                pending = pending_get(e)
+                if (pending is not None and pending[0] == brain.state
+                        and (pending[2] + tick) % cohorts
+                        and not pending[3] and e not in dead):
+                    # Not this fish's cohort: cheap continuation, decision deferred
+                    view = self._get_view(e, brain, pos, vel, motion, hunger, sprite, tuning, target, steer, speed)
+                    state.tick(view, speed, context, dt, world)
+                    pending[1] += dt
+                    proposed[e] = None
+                    continue
 
             # Compose (or refresh) the lightweight view.
             view = self._get_view(e, brain, pos, vel, motion, hunger, sprite, tuning, target, steer, speed)
@@ -144,12 +232,18 @@ class BehaviorSystem:
             # Make entity/world available to state handlers (e.g., DeadState.enter)
             setattr(view, "entity_id", e)
             setattr(view, "world", world)
+            # Food sensing from FoodPerceptionSystem (None → states scan themselves)
+            view.perception = world.get_component(e, FoodPerception)
 
             # Ensure we called enter() for the current state at least once.
             self._ensure_enter_called(e, brain, view)
 
             # Run the state's update; it may return a next-state string or None.
-            next_state = fsm[brain.state].update(view, speed, self.context, dt, world)
-            proposed[e] = next_state
+            if cohorts > 1 and state.SLICED:
+                proposed[e] = self._sliced_update(e, brain, state, view, speed, dt, world)
+            else:
+                if cohorts > 1:
+                    self._drop_pending(e, world)  # left the sliced states: restart on return
+                proposed[e] = state.update(view, speed, context, dt, world)
 
         return proposed
@@ -0,0 +1,139 @@
+# ecs/systems/ai/food_perception_system.py
+"""
+FoodPerceptionSystem
+--------------------
+Runs once per tick *before* BehaviorSystem and answers every food question
+the FSM asks, for all food-seeking fish in one vectorized pass:
+
+* nearest pellet overall (ChaseFood target), its center, eat radius and
+  distance, plus the mouth-to-pellet eat test;
+* nearest pellet inside the fish's `food_detect_radius` (LookForFood).
+
+Results land in each fish's FoodPerception component (`FishView.perception`).
+Only fish in PERCEIVING_STATES are sensed; their records are `valid` for this
+tick only, and every other fish's record is invalidated, so a state never
+reads stale data — it falls back to its own scan instead. The same happens
+when NumPy is unavailable (the system then does nothing).
+
+Pellet set and metrics match the states' scalar scans: pellets are
+`(FoodPellet, Position, Sprite, TankRef)` rows, ties resolve to the earlier
+row, visibility is `d <= food_detect_radius + max(w, h)/2`.
+"""
+from __future__ import annotations
+
+from typing import List
+
+from ecs.columns import HAVE_NUMPY, np
+from ecs.components.core.position_component import Position
+from ecs.components.core.sprite_component import Sprite
+from ecs.components.core.tank_ref_component import TankRef
+from ecs.components.fish.behavior_tuning import BehaviorTuning
+from ecs.components.fish.brain_component import Brain
+from ecs.components.fish.food_perception_component import FoodPerception
+from ecs.components.tags.food_pellet_component import FoodPellet
+
+PERCEIVING_STATES = frozenset(("LookForFood", "ChaseFood"))
+
+# Cap on fish x pellet matrix cells per chunk (~16 MB of float64 per array)
+_CHUNK_CELLS = 2_000_000
+
+
+class FoodPerceptionSystem:
+    _FISH = (Brain, Position, Sprite, BehaviorTuning, TankRef)
+    _PELLETS = (FoodPellet, Position, Sprite, TankRef)
+
+    def __init__(self, context) -> None:
+        self.context = context
+        self._valid: List[FoodPerception] = []  # records written last tick
+
+    def update(self, world, dt: float) -> None:
+        for rec in self._valid:
+            rec.valid = False
+        self._valid = []
+        if not HAVE_NUMPY:
+            return
+
+        fish = []
+        missing = []
+        for e, brain, pos, spr, tuning, _tank in world.query(*self._FISH):
+            if brain.state not in PERCEIVING_STATES:
+                continue
+            rec = world.get_component(e, FoodPerception)
+            if rec is None:
+                rec = FoodPerception()
+                missing.append((e, rec))
+            fish.append((rec, pos, spr, tuning))
+        for e, rec in missing:
+            world.add_component(e, rec)
+        if not fish:
+            return
+
+        pellets = [(e, p, s, pellet) for e, pellet, p, s, _tank in world.query(*self._PELLETS)]
+        if not pellets:
+            for rec, *_ in fish:
+                rec.valid = True; rec.pellet = None; rec.visible = None; rec.can_eat = False
+            self._valid = [rec for rec, *_ in fish]
+            return
+
+        # Pellet columns
+        ids = [e for e, *_ in pellets]
+        pw = np.array([s.base_w for _, _, s, _ in pellets], dtype=np.float64)
+        ph = np.array([s.base_h for _, _, s, _ in pellets], dtype=np.float64)
+        pcx = np.array([p.x for _, p, _, _ in pellets], dtype=np.float64) + pw * 0.5
+        pcy = np.array([p.y for _, p, _, _ in pellets], dtype=np.float64) + ph * 0.5
+        half = np.maximum(pw, ph) * 0.5
+        eat_r = half * np.array([float(getattr(pl, "radius_scale", 1.0)) for *_, pl in pellets])
+
+        # Fish columns
+        n = len(fish)
+        x0 = np.empty(n); y0 = np.empty(n); fw = np.empty(n); fh = np.empty(n)
+        vision = np.empty(n); mouth_fx = np.empty(n); mouth_fy = np.empty(n)
+        mouth_r = np.empty(n); margin = np.empty(n)
+        for i, (_rec, pos, spr, t) in enumerate(fish):
+            x0[i] = pos.x; y0[i] = pos.y; fw[i] = spr.base_w; fh[i] = spr.base_h
+            vision[i] = float(t.get("food_detect_radius", 200.0))
+            mouth_fx[i] = float(getattr(spr, "mouth_fx", 0.85))
+            mouth_fy[i] = float(getattr(spr, "mouth_fy", 0.50))
+            factor = float(t.get("mouth_radius_factor", 0.35))
+            mouth_r[i] = max(4.0, min(spr.base_w, spr.base_h) * factor * 0.5)
+            margin[i] = float(t.get("eat_extra_margin", 6.0))
+        fcx = x0 + fw * 0.5
+        fcy = y0 + fh * 0.5
+
+        nearest = np.empty(n, dtype=np.intp); dist = np.empty(n)
+        vis = np.full(n, -1, dtype=np.intp)
+        step = max(1, _CHUNK_CELLS // len(ids))
+        for a in range(0, n, step):
+            b = min(n, a + step)
+            d = np.hypot(pcx[None, :] - fcx[a:b, None], pcy[None, :] - fcy[a:b, None])
+            k = np.argmin(d, axis=1)  # first minimum → earliest row, like the scans
+            nearest[a:b] = k
+            dist[a:b] = d[np.arange(b - a), k]
+            d[d > vision[a:b, None] + half[None, :]] = np.inf
+            kv = np.argmin(d, axis=1)
+            seen = np.isfinite(d[np.arange(b - a), kv])
+            vis[a:b] = np.where(seen, kv, -1)
+
+        # Mouth-to-pellet eat test against the nearest pellet (utils.geometry.get_mouth_logical)
+        tx = pcx[nearest]; ty = pcy[nearest]
+        face_right = tx >= fcx
+        mx = x0 + fw * np.where(face_right, mouth_fx, 1.0 - mouth_fx)
+        my = y0 + fh * mouth_fy
+        mouth_d = ((tx - mx) ** 2 + (ty - my) ** 2) ** 0.5
+        can_eat = mouth_d <= eat_r[nearest] + mouth_r + margin
+
+        for i, (rec, *_rest) in enumerate(fish):
+            k = int(nearest[i])
+            rec.valid = True
+            rec.pellet = ids[k]
+            rec.cx = float(tx[i]); rec.cy = float(ty[i])
+            rec.radius = float(eat_r[k])
+            rec.distance = float(dist[i])
+            rec.can_eat = bool(can_eat[i])
+            kv = int(vis[i])
+            if kv < 0:
+                rec.visible = None
+            else:
+                rec.visible = ids[kv]
+                rec.visible_cx = float(pcx[kv]); rec.visible_cy = float(pcy[kv])
+        self._valid = [rec for rec, *_ in fish]
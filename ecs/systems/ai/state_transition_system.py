@@ -1,3 +1,4 @@
+from ecs.entity import EntityTable
 from ecs.fsm import FSM_STATES
 from ecs.components.fish.brain_component import Brain
 
@@ -5,7 +6,8 @@ class StateTransitionSystem:
     def __init__(self, context, behavior_system):
         self.context = context
         self.behavior = behavior_system
-        self._entered = {}
+        # entity -> state names whose enter() we issued (slot-indexed, bounded)
+        self._entered = EntityTable()
 
     def update(self, world, final_states, dt):
         for e, next_state in final_states.items():
@@ -22,10 +24,14 @@ class StateTransitionSystem:
             if fish_view is None:
                 continue
 
+            entered = self._entered.get(e)
+            if entered is None:
+                entered = self._entered[e] = set()
+
             # EXIT old state
-            if (e, current) in self._entered:
+            if current in entered:
                 FSM_STATES[current].exit(fish_view, self.context)
-                self._entered.pop((e, current), None)
+                entered.discard(current)
 
             # 🔊 if we're transitioning to Dead, play SFX once here
             if next_state == "Dead":
@@ -39,4 +45,4 @@ class StateTransitionSystem:
 
             # ENTER new state
             FSM_STATES[next_state].enter(fish_view, self.context)
-            self._entered[(e, next_state)] = True
+            entered.add(next_state)
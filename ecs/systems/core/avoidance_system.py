@@ -1,17 +1,23 @@
 from math import hypot
-from ecs.components.core.position_component import Position
-from ecs.components.core.velocity_component import Velocity
-from ecs.components.core.tank_ref_component import TankRef
-from ecs.components.fish.steering_intent_component import SteeringIntent
-from math import hypot
 
 from ecs.components.core.position_component import Position
 from ecs.components.core.velocity_component import Velocity
 from ecs.components.core.tank_ref_component import TankRef
 from ecs.components.fish.steering_intent_component import SteeringIntent
+from ecs.columns import RowCache, np
 
 
 class AvoidanceSystem:
+    """
+    Soft wall avoidance: adds a push away from the wall bands (and the swim
+    floor) into SteeringIntent, scaled by speed and clamped to max_strength.
+    On a columnar World this runs as one batched pass over the columns.
+    """
+    _QUERY = (Position, SteeringIntent, TankRef, Velocity)
+    # Scheduler access (ecs/schedule.py)
+    READS = (Position, Velocity)
+    WRITES = (SteeringIntent,)
+
     def __init__(self, context):
         self.context = context
         b = context.balancing or {}
@@ -21,8 +27,15 @@ class AvoidanceSystem:
         self.max_strength = float(b.get("avoidance_max_strength", 0.25))
         # Reference speed used to scale avoidance with current speed.
         self._speed_ref = float(b.get("typical_max_speed", 40.0))
+        self._bodies = RowCache(self._QUERY)
 
     def update(self, world, dt):
+        if world.columns is not None:
+            self._update_columns(world, world.columns)
+        else:
+            self._update_scalar(world)
+
+    def _update_scalar(self, world):
         # Logical tank size
         w = float(self.context.logical_tank_w)
         h = float(self.context.logical_tank_h)
@@ -33,10 +46,7 @@ class AvoidanceSystem:
         swim_bottom_margin = float(getattr(self.context, "swim_bottom_margin", 64.0))
         water_bottom = h - swim_bottom_margin  # y coordinate in logical space
 
-        for e in world.entities_with(Position, SteeringIntent, TankRef, Velocity):
-            pos: Position = world.get_component(e, Position)
-            intent: SteeringIntent = world.get_component(e, SteeringIntent)
-            vel: Velocity = world.get_component(e, Velocity)
+        for _e, pos, intent, _tank, vel in world.query(Position, SteeringIntent, TankRef, Velocity):
 
             # Normalize velocity to get a directional bias; if nearly stopped,
             # avoidance is minimal.
@@ -87,4 +97,50 @@ class AvoidanceSystem:
 
             # Accumulate into the per-fish steering intent (MovementSystem will consume it).
             intent.dx += ax
-            intent.dy += ay
\ No newline at end of file
+            intent.dy += ay
+
+    # ---- batched (columnar World) ------------------------------------------
+    def _update_columns(self, world, cols):
+        w = float(self.context.logical_tank_w)
+        h = float(self.context.logical_tank_h)
+        m = float(self.margin)
+        water_bottom = h - float(getattr(self.context, "swim_bottom_margin", 64.0))
+
+        bodies = self._bodies
+        bodies.refresh(world)
+        rows = bodies.rows
+        if not len(rows):
+            return
+        vdx = cols.vel_dx[rows]; vdy = cols.vel_dy[rows]
+        speed = np.hypot(vdx, vdy)
+        moving = speed >= 1e-3
+        rows = rows[moving]
+        if not len(rows):
+            return
+        speed = speed[moving]
+        vx = vdx[moving] / speed
+        vy = vdy[moving] / speed
+        x = cols.pos_x[rows]; y = cols.pos_y[rows]
+
+        # Wall bands, accumulated in the scalar order (left, right / top, bottom)
+        zero = np.zeros_like(x)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ax = zero + np.where(x < m, (1.0 - (x / m)) * np.maximum(0.0, -vx), 0.0)
+            ax = ax - np.where(x > w - m, (1.0 - ((w - x) / m)) * np.maximum(0.0, vx), 0.0)
+            ay = zero + np.where(y < m, (1.0 - (y / m)) * np.maximum(0.0, -vy), 0.0)
+            ay = ay - np.where(y > water_bottom - m,
+                               (1.0 - ((water_bottom - y) / m)) * np.maximum(0.0, vy), 0.0)
+
+        speed_scale = np.minimum(1.0, speed / self._speed_ref)
+        ax *= speed_scale
+        ay *= speed_scale
+
+        strength = np.hypot(ax, ay)
+        clamp = (strength > self.max_strength) & (strength > 1e-7)
+        s = np.ones_like(strength)
+        np.divide(self.max_strength, strength, out=s, where=clamp)
+        ax *= s
+        ay *= s
+
+        cols.steer_dx[rows] += ax
+        cols.steer_dy[rows] += ay
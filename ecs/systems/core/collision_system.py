@@ -4,37 +4,50 @@ from ecs.components.core.velocity_component import Velocity
 from ecs.components.core.sprite_component import Sprite
 from ecs.components.core.tank_ref_component import TankRef
 from ecs.components.tags.dead_component import DeadFlag
+from ecs.columns import RowCache, np
 
 class CollisionSystem:
     """
     Enforces hard tank boundaries and applies bounce to velocity when colliding.
     MovementSystem no longer does any clamping/bounce; it only integrates.
+
+    On a columnar World the same wall tests run as one batched pass over the
+    position/velocity columns (live and dead fish separately).
     """
+    _QUERY = (Position, Velocity, Sprite, TankRef)
+    # Scheduler access (ecs/schedule.py)
+    READS = (Sprite,)
+    WRITES = (Position, Velocity)
+
     def __init__(self, context):
         self.context = context
         self.wall_bounce = float((context.balancing or {}).get("wall_bounce", 0.35))
+        # Batched path: rows + sprite sizes for live / dead bodies
+        self._alive = RowCache(self._QUERY, without=DeadFlag)
+        self._dead = RowCache(self._QUERY + (DeadFlag,))
+        self._alive_size = self._dead_size = None
 
     def update(self, world, dt):
+        if world.columns is not None:
+            self._update_columns(world, world.columns)
+        else:
+            self._update_scalar(world)
+
+    def _update_scalar(self, world):
         lw = self.context.logical_tank_w
         lh = self.context.logical_tank_h
         swim_floor = float(getattr(self.context, "swim_bottom_margin", 64))
         alive_bottom_y = lh - swim_floor  # top of dark brown frame
 
-        for e in world.entities_with(Position, Velocity, Sprite, TankRef):
+        for e, pos, vel, spr, _tank in world.query(Position, Velocity, Sprite, TankRef):
             if world.get_component(e, DeadFlag):
                 # dead: keep existing full-tank clamp (GravitySystem settles them on sand)
-                pos = world.get_component(e, Position)
-                spr = world.get_component(e, Sprite)
                 if pos.x < 0: pos.x = 0
                 if pos.x + spr.base_w > lw: pos.x = lw - spr.base_w
                 if pos.y < 0: pos.y = 0
                 if pos.y + spr.base_h > lh: pos.y = lh - spr.base_h
                 continue
 
-            pos = world.get_component(e, Position)
-            vel = world.get_component(e, Velocity)
-            spr = world.get_component(e, Sprite)
-
             # left/right/top (unchanged) ...
             if pos.x < 0.0:
                 pos.x = 0.0
@@ -53,3 +66,58 @@ class CollisionSystem:
                 if vel.dy > 0.0:
                     vel.dy = -vel.dy * self.wall_bounce
 
+    # ---- batched (columnar World) ------------------------------------------
+    @staticmethod
+    def _sizes(world, entities):
+        w = np.empty(len(entities)); h = np.empty(len(entities))
+        for i, e in enumerate(entities):
+            spr = world.get_component(e, Sprite)
+            w[i] = spr.base_w; h[i] = spr.base_h
+        return w, h
+
+    def _update_columns(self, world, cols):
+        lw = self.context.logical_tank_w
+        lh = self.context.logical_tank_h
+        swim_floor = float(getattr(self.context, "swim_bottom_margin", 64))
+        alive_bottom_y = lh - swim_floor
+        bounce = self.wall_bounce
+
+        if self._alive.refresh(world):
+            self._alive_size = self._sizes(world, self._alive.entities)
+        if self._dead.refresh(world):
+            self._dead_size = self._sizes(world, self._dead.entities)
+
+        rows = self._dead.rows
+        if len(rows):
+            sw, sh = self._dead_size
+            x = cols.pos_x[rows]; y = cols.pos_y[rows]
+            x[x < 0] = 0
+            over = x + sw > lw; x[over] = (lw - sw)[over]
+            y[y < 0] = 0
+            over = y + sh > lh; y[over] = (lh - sh)[over]
+            cols.pos_x[rows] = x; cols.pos_y[rows] = y
+
+        rows = self._alive.rows
+        if not len(rows):
+            return
+        sw, sh = self._alive_size
+        x = cols.pos_x[rows]; y = cols.pos_y[rows]
+        vx = cols.vel_dx[rows]; vy = cols.vel_dy[rows]
+
+        # Same order as the scalar branches: left, right, top, swim floor
+        hit = x < 0.0
+        x[hit] = 0.0
+        flip = hit & (vx < 0.0); vx[flip] = -vx[flip] * bounce
+        hit = x + sw > lw
+        x[hit] = (lw - sw)[hit]
+        flip = hit & (vx > 0.0); vx[flip] = -vx[flip] * bounce
+        hit = y < 0.0
+        y[hit] = 0.0
+        flip = hit & (vy < 0.0); vy[flip] = -vy[flip] * bounce
+        bottom_limit = np.maximum(0.0, alive_bottom_y - sh)
+        hit = y > bottom_limit
+        y[hit] = bottom_limit[hit]
+        flip = hit & (vy > 0.0); vy[flip] = -vy[flip] * bounce
+
+        cols.pos_x[rows] = x; cols.pos_y[rows] = y
+        cols.vel_dx[rows] = vx; cols.vel_dy[rows] = vy
@@ -1,5 +1,4 @@
 from math import hypot, atan2, cos, sin
-import random
 from ecs.components.fish.motion_component import MotionParams
 from ecs.components.core.position_component import Position
 from ecs.components.core.tank_ref_component import TankRef
@@ -10,6 +9,11 @@ from ecs.components.tags.dead_component import DeadFlag
 from ecs.components.fish.target_intent_component import TargetIntent
 from ecs.components.fish.steering_intent_component import SteeringIntent
 from ecs.components.fish.speed_intent_component import SpeedIntent
+from ecs.columns import RowCache, np
+from utils.rng import MOVEMENT
+from utils.timestep import decay_factor
+
+_PI = 3.14159265  # scalar and batched paths share the same wrap constant
 
 def _clamp_angle(delta, limit):
     if delta > limit: return limit
@@ -21,31 +25,47 @@ class MovementSystem:
     Integrates desired motion:
       - Builds direction from target + steering (AvoidanceSystem)
       - Applies turning limit and acceleration clamp
-      - Applies damping
+      - Applies damping (per-60 Hz-tick factor, rescaled to dt)
       - Integrates pos/vel
     NOTE: No boundary checks or bounce here — CollisionSystem handles that.
+
+    On a columnar World (`World(columns=True)`) the same math runs as one
+    batched NumPy pass over the physics columns; results match the scalar
+    path to float rounding. Noise comes from the "movement" RNG stream's
+    block sequence, two draws per noisy mover in query order, so both paths
+    see the same numbers.
     """
+    _QUERY = (Position, Velocity, MotionParams,
+              TargetIntent, SteeringIntent, SpeedIntent, TankRef, Sprite)
+    # Scheduler access (ecs/schedule.py)
+    READS = (MotionParams, TargetIntent, SpeedIntent, BehaviorTuning, Sprite)
+    WRITES = (Position, Velocity, SteeringIntent)  # steering is consumed (zeroed) each step
+
     def __init__(self, context):
         self.context = context
         b = context.balancing
         self.damping = float(b.get("movement_damping", 0.94))
+        self._rng = context.rng.stream(MOVEMENT)
+        # Batched path: live movers' rows + per-row noise, rebuilt on change
+        self._movers = RowCache(self._QUERY, without=DeadFlag)
+        self._noise = None
+        self._tuning_key = None
 
     def update(self, world, dt: float):
-        for e in world.entities_with(
+        if world.columns is not None:
+            self._update_columns(world, world.columns, dt)
+        else:
+            self._update_scalar(world, dt)
+
+    def _update_scalar(self, world, dt: float):
+        damping = decay_factor(self.damping, dt)
+        for e, pos, vel, motion, target, steer, speedi, _tank, _spr in world.query(
             Position, Velocity, MotionParams,
             TargetIntent, SteeringIntent, SpeedIntent, TankRef, Sprite
         ):
             if world.get_component(e, DeadFlag):
                 continue
 
-            pos = world.get_component(e, Position)
-            vel = world.get_component(e, Velocity)
-            motion = world.get_component(e, MotionParams)
-            target = world.get_component(e, TargetIntent)
-            steer  = world.get_component(e, SteeringIntent)
-            speedi = world.get_component(e, SpeedIntent)
-            spr    = world.get_component(e, Sprite)
-
             # Direction toward target + soft steering (already set by AvoidanceSystem)
             dx = target.tx - pos.x; dy = target.ty - pos.y
             dist = max(1e-6, hypot(dx, dy))
@@ -57,8 +77,8 @@ class MovementSystem:
             if tuning:
                 noise = float(tuning.get("noise", 0.0))
                 if noise > 0.0:
-                    dir_x += random.uniform(-noise, noise)
-                    dir_y += random.uniform(-noise, noise)
+                    dir_x += noise * (2.0 * self._rng.next_uniform() - 1.0)
+                    dir_y += noise * (2.0 * self._rng.next_uniform() - 1.0)
 
             # Normalize final dir
             dlen = hypot(dir_x, dir_y)
@@ -76,7 +96,7 @@ class MovementSystem:
             else:
                 cur_ang = atan2(vel.dy, vel.dx)
                 des_ang = atan2(des_vy, des_vx) if desired_speed > 1e-6 else cur_ang
-                da = (des_ang - cur_ang + 3.14159265) % (2*3.14159265) - 3.14159265
+                da = (des_ang - cur_ang + _PI) % (2*_PI) - _PI
                 max_rotate = max(0.0, motion.turn_speed) * dt
                 cur_ang += _clamp_angle(da, max_rotate)
                 heading_vx, heading_vy = cos(cur_ang), sin(cur_ang)
@@ -89,8 +109,8 @@ class MovementSystem:
                 s = max_delta / dv_len; dvx *= s; dvy *= s
 
             # Apply velocity & damping
-            vel.dx = (vel.dx + dvx) * self.damping
-            vel.dy = (vel.dy + dvy) * self.damping
+            vel.dx = (vel.dx + dvx) * damping
+            vel.dy = (vel.dy + dvy) * damping
 
             # Integrate position (no clamping here)
             pos.x += vel.dx * dt
@@ -98,3 +118,74 @@ class MovementSystem:
 
             # Reset steering each frame
             steer.dx = 0.0; steer.dy = 0.0
+
+    # ---- batched (columnar World) ------------------------------------------
+    def _batch(self, world):
+        """Rows of live movers in query order, and their noise amplitudes."""
+        movers = self._movers
+        tunings = world.query(BehaviorTuning)
+        tuning_key = (id(tunings), tunings.version)
+        if movers.refresh(world) or tuning_key != self._tuning_key:
+            noise = []
+            for e in movers.entities:
+                tuning = world.get_component(e, BehaviorTuning)
+                noise.append(float(tuning.get("noise", 0.0)) if tuning else 0.0)
+            self._noise = np.asarray(noise, dtype=np.float64)
+            self._tuning_key = tuning_key
+        return movers.rows, self._noise
+
+    def _update_columns(self, world, cols, dt: float):
+        rows, noise = self._batch(world)
+        if not len(rows):
+            return
+        px = cols.pos_x[rows]; py = cols.pos_y[rows]
+        vx = cols.vel_dx[rows]; vy = cols.vel_dy[rows]
+
+        # Direction toward target + soft steering
+        dx = cols.target_x[rows] - px; dy = cols.target_y[rows] - py
+        dist = np.maximum(1e-6, np.hypot(dx, dy))
+        dir_x = dx / dist + cols.steer_dx[rows]
+        dir_y = dy / dist + cols.steer_dy[rows]
+
+        # Behavioral noise: one block of draws, same order as the scalar loop
+        noisy = np.flatnonzero(noise > 0.0)
+        if len(noisy):
+            n = noise[noisy]
+            u = self._rng.uniforms(2 * len(noisy))
+            dir_x[noisy] += n * (2.0 * u[0::2] - 1.0)
+            dir_y[noisy] += n * (2.0 * u[1::2] - 1.0)
+
+        dlen = np.hypot(dir_x, dir_y)
+        ok = dlen > 1e-5
+        np.divide(dir_x, dlen, out=dir_x, where=ok)
+        np.divide(dir_y, dlen, out=dir_y, where=ok)
+
+        desired = np.maximum(0.0, np.minimum(cols.desired_speed[rows], cols.max_speed[rows]))
+        des_vx = dir_x * desired; des_vy = dir_y * desired
+
+        # Heading turn limit (fish at rest turn instantly)
+        cur_ang = np.arctan2(vy, vx)
+        des_ang = np.where(desired > 1e-6, np.arctan2(des_vy, des_vx), cur_ang)
+        da = (des_ang - cur_ang + _PI) % (2*_PI) - _PI
+        max_rotate = np.maximum(0.0, cols.turn_speed[rows]) * dt
+        cur_ang += np.clip(da, -max_rotate, max_rotate)
+        still = np.hypot(vx, vy) < 1e-6
+        heading_x = np.where(still, dir_x, np.cos(cur_ang))
+        heading_y = np.where(still, dir_y, np.sin(cur_ang))
+
+        # Accel clamp toward target velocity
+        dvx = heading_x * desired - vx; dvy = heading_y * desired - vy
+        dv_len = np.hypot(dvx, dvy)
+        max_delta = cols.acceleration[rows] * dt
+        scale = np.ones_like(dv_len)
+        np.divide(max_delta, dv_len, out=scale, where=(dv_len > max_delta) & (dv_len > 1e-6))
+        dvx *= scale; dvy *= scale
+
+        # Velocity & damping, integrate, reset steering
+        damping = decay_factor(self.damping, dt)
+        vx = (vx + dvx) * damping
+        vy = (vy + dvy) * damping
+        cols.vel_dx[rows] = vx; cols.vel_dy[rows] = vy
+        cols.pos_x[rows] = px + vx * dt
+        cols.pos_y[rows] = py + vy * dt
+        cols.steer_dx[rows] = 0.0; cols.steer_dy[rows] = 0.0
@@ -44,9 +44,7 @@ class ResizeSystem:
         self.context.tank_screen_h = tank_render_h
 
         # --- Update the actual tank entity ---
-        for tank in world.entities_with(Tank, Position, Bounds):
-            pos = world.get_component(tank, Position)
-            bounds = world.get_component(tank, Bounds)
+        for _tank, _tag, pos, bounds in world.query(Tank, Position, Bounds):
 
             pos.x = tank_x
             pos.y = tank_y
@@ -0,0 +1,62 @@
+# ecs/systems/core/spatial_index_system.py
+from ecs.components.core.position_component import Position
+from ecs.components.core.sprite_component import Sprite
+from ecs.components.core.tank_ref_component import TankRef
+from ecs.components.fish.age_component import Age
+from ecs.components.fish.brain_component import Brain
+from ecs.components.tags.food_pellet_component import FoodPellet
+from ecs.schedule import SPATIAL
+from utils.spatial import LAYER_EGGS, LAYER_FISH, LAYER_PELLETS, SpatialIndex
+
+
+class SpatialIndexSystem:
+    """
+    Keeps a layered uniform grid (utils/spatial.py) in sync with the world and
+    publishes it as `world.spatial`.
+
+    Layers hold sprite boxes in logical tank coordinates: "pellets"
+    (FoodPellet), "eggs" (Brain with Age.stage == "Egg") and "fish" (every
+    other Brain). Runs last in the update phase, so the grid matches the
+    positions the AI reads at the start of the next tick. Entities that left
+    a query are swept out only when that query's membership changed.
+    """
+    # Scheduler access (ecs/schedule.py)
+    READS = (Position, Sprite, Age)
+    WRITES = (SPATIAL,)
+
+    def __init__(self, context):
+        self.context = context
+        b = getattr(context, "balancing", None) or {}
+        self.index = SpatialIndex(cell_size=float(b.get("spatial_cell_size", 64.0)))
+        self._seen_versions = {}
+
+    def update(self, world, dt):
+        world.spatial = self.index
+        pellets = self.index[LAYER_PELLETS]
+        fish = self.index[LAYER_FISH]
+        eggs = self.index[LAYER_EGGS]
+
+        pellet_q = world.query(FoodPellet, Position, Sprite, TankRef)
+        for e, _pellet, pos, spr, _tank in pellet_q:
+            hw = spr.base_w * 0.5; hh = spr.base_h * 0.5
+            pellets.update(e, pos.x + hw, pos.y + hh, hw, hh)
+        self._sweep(pellet_q, pellets)
+
+        brain_q = world.query(Brain, Position, Sprite)
+        for e, _brain, pos, spr in brain_q:
+            age = world.get_component(e, Age)
+            layer, other = (eggs, fish) if (age is not None and age.stage == "Egg") else (fish, eggs)
+            if e in other:
+                other.remove(e)  # hatched (or re-egged)
+            hw = spr.base_w * 0.5; hh = spr.base_h * 0.5
+            layer.update(e, pos.x + hw, pos.y + hh, hw, hh)
+        self._sweep(brain_q, fish, eggs)
+
+    def _sweep(self, query, *grids):
+        key = id(query)
+        if self._seen_versions.get(key) == query.version:
+            return
+        self._seen_versions[key] = query.version
+        for grid in grids:
+            for e in [e for e in grid if e not in query]:
+                grid.remove(e)
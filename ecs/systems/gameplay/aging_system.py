@@ -1,14 +1,21 @@
 # ecs/systems/aging_system.py
+from typing import Tuple
+
 from ecs.components.fish.age_component import Age
 from ecs.components.fish.motion_component import MotionParams
 from ecs.components.fish.health_component import Health
 from ecs.components.tags.dead_component import DeadFlag
 from ecs.components.tags.affected_by_gravity import AffectedByGravity  # used to drop eggs
+from ecs.entity import EntityTable
+from ecs.schedule import COMMANDS, TIMERS
 # NOTE: Do not assign to names like DeadFlag inside functions; we only import & use them.
 
 class AgingSystem:
     """
-    - Eggs: accumulate pre-hatch time; lifespan/aging begin at hatching (age=0).
+    - Eggs: hatching is a world timer scheduled when the egg is first seen;
+      eggs are not stepped per tick, their pre-hatch time is derived from
+      when they were laid (egg_elapsed). Lifespan/aging begin at hatching
+      (age=0).
     - Post-hatch: juvenile/adult/senior speed scaling and elder health decay.
     - Optional hard death at lifespan.
     Config (data/aging.json):
@@ -21,6 +28,10 @@ class AgingSystem:
       - egg_duration_sec (preferred)
       - egg_threshold_ratio (fallback if no seconds set)
     """
+    # Scheduler access (ecs/schedule.py)
+    READS = (Age, MotionParams, Health)  # read-modify-write
+    WRITES = (Age, MotionParams, Health, COMMANDS, TIMERS)
+
     def __init__(self, context):
         self.context = context
         cfg = context.aging or {}
@@ -41,6 +52,9 @@ class AgingSystem:
         self.egg_duration_sec_cfg = cfg.get("egg_duration_sec", None)
         self.egg_ratio_cfg = cfg.get("egg_threshold_ratio", None)
 
+        # egg entity -> (pending hatch timer handle, world time it was laid)
+        self._hatch_timers: EntityTable[Tuple[int, float]] = EntityTable()
+
     # ---- helpers -------------------------------------------------------------
 
     def _egg_hatch_seconds(self, lifespan: float) -> float:
@@ -94,36 +108,66 @@ class AgingSystem:
         if age_cmp.stage != stage:
             age_cmp.stage = stage
 
+    def egg_elapsed(self, world, e: int, age: Age) -> float:
+        """Seconds egg `e` has been incubating (age.pre_hatch is only written back on hatch/sync)."""
+        pending = self._hatch_timers.get(e)
+        if pending is None:
+            return age.pre_hatch
+        return world.time - pending[1]
+
+    def _hatch(self, e: int, world) -> None:
+        """Hatch timer: start real aging from 0 and let the fish swim."""
+        pending = self._hatch_timers.pop(e)
+        age = world.get_component(e, Age)
+        if age is None or age.stage != "Egg":
+            return  # already hatched (fast-forward) or gone
+        laid = world.time - pending[1] if pending is not None else age.pre_hatch
+        age.pre_hatch = max(laid, self._egg_hatch_seconds(age.lifespan))
+        age.stage = "Juvenile"
+        age.age = 0.0
+        # Remove gravity so the fish can swim normally
+        world.commands.remove_component(e, AffectedByGravity)
+
+    def drop_hatch_timers(self, world) -> None:
+        """
+        Write each pending egg's incubation time back to age.pre_hatch and
+        forget its hatch timer; the next update reschedules from pre_hatch
+        (before a fast-forward, which advances pre_hatch in closed form).
+        """
+        for e, (handle, laid_at) in self._hatch_timers.items():
+            world.timers.cancel(handle)
+            age = world.get_component(e, Age)
+            if age is not None and age.stage == "Egg":
+                age.pre_hatch = world.time - laid_at
+        self._hatch_timers.clear()
+
     # ---- ECS entry -----------------------------------------------------------
 
     def update(self, world, dt: float):
         if dt <= 0.0:
             return
 
-        for e in world.entities_with(Age):
+        for e, age in world.query(Age):
             # Skip dead — DeadState/Gravity handles their presentation/motion.
             if world.get_component(e, DeadFlag):
                 continue
 
-            age = world.get_component(e, Age)
-
-            # EGG PHASE: accumulate pre-hatch; no lifespan aging yet
+            # EGG PHASE: the hatch timer does the work; no lifespan aging yet
             if age.stage == "Egg":
-                age.pre_hatch += dt
-
-                # Ensure eggs fall if GravitySystem is in use
-                if world.get_component(e, AffectedByGravity) is None:
-                    world.add_component(e, AffectedByGravity(speed=float(
-                        (self.context.balancing or {}).get("egg_fall_speed", 55.0)
-                    )))
-
-                hatch_after = self._egg_hatch_seconds(age.lifespan)
-                if age.pre_hatch >= hatch_after:
-                    # Hatch now → start real aging from 0
-                    age.stage = "Juvenile"
-                    age.age = 0.0
-                    # Remove gravity so the fish can swim normally
-                    world.remove_component(e, AffectedByGravity)
+                pending = self._hatch_timers.get(e)
+                if pending is None or pending[0] not in world.timers:
+                    # First seen (or timers dropped): incubating since this
+                    # step began, on top of any pre_hatch already recorded
+                    laid_at = world.time - dt - age.pre_hatch
+                    hatch_at = max(world.time, laid_at + self._egg_hatch_seconds(age.lifespan))
+                    handle = world.timers.schedule(hatch_at, self._hatch, e, world)
+                    self._hatch_timers[e] = (handle, laid_at)
+
+                    # Ensure eggs fall if GravitySystem is in use
+                    if world.get_component(e, AffectedByGravity) is None:
+                        world.commands.add_component(e, AffectedByGravity(speed=float(
+                            (self.context.balancing or {}).get("egg_fall_speed", 55.0)
+                        )))
                 continue  # nothing else while egg
 
             # POST-HATCH: advance age & compute ratio
@@ -150,6 +194,6 @@ class AgingSystem:
             # Optional hard death at lifespan
             if self.hard_death and age.age >= age.lifespan:
                 if not world.get_component(e, DeadFlag):
-                    world.add_component(e, DeadFlag())
+                    world.commands.add_component(e, DeadFlag())
                 # NEW: make the biological stage reflect death
                 age.stage = "Dead"
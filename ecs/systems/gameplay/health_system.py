@@ -5,19 +5,20 @@ from ecs.components.fish.hunger_component import Hunger
 from ecs.components.fish.behavior_tuning import BehaviorTuning
 from ecs.components.tags.dead_component import DeadFlag
 from ecs.components.fish.age_component import Age
+from ecs.schedule import COMMANDS
 class HealthSystem:
     """
     Handles health regeneration and starvation.
     Does NOT change AI state directly — sets DeadFlag instead.
     """
+    # Scheduler access (ecs/schedule.py)
+    READS = (Hunger, BehaviorTuning)
+    WRITES = (Health, Age, COMMANDS)
 
     def update(self, world, dt):
-        for e in world.entities_with(Health, Hunger, BehaviorTuning):
+        for e, health, hunger, tuning in world.query(Health, Hunger, BehaviorTuning):
             if world.get_component(e, DeadFlag):
                 continue
-            health = world.get_component(e, Health)
-            hunger = world.get_component(e, Hunger)
-            tuning = world.get_component(e, BehaviorTuning)
 
             regen_factor = tuning.get("health_regen_factor", 0.0)
             starve_factor = tuning.get("health_starve_factor", 0.0)
@@ -39,7 +40,7 @@ class HealthSystem:
             # Mark death (but do not change AI state!)
             if health.value <= 0:
                 if not world.get_component(e, DeadFlag):
-                    world.add_component(e, DeadFlag())
+                    world.commands.add_component(e, DeadFlag())
                 # NEW: reflect death in the life-stage component
                 age = world.get_component(e, Age)
                 if age is not None:
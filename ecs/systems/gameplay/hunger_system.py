@@ -15,12 +15,14 @@ class HungerSystem:
 
     When hunger hits 0 → health drains in HealthSystem, not here.
     """
+    # Scheduler access (ecs/schedule.py)
+    READS = ()
+    WRITES = (Hunger,)
 
     def update(self, world, dt):
-        for e in world.entities_with(Hunger, Health):
+        for e, hunger, _health in world.query(Hunger, Health):
             if world.get_component(e, DeadFlag):
                 continue
-            hunger = world.get_component(e, Hunger)
 
             # Reduce hunger
             hunger.hunger -= hunger.hunger_rate * dt
@@ -0,0 +1,211 @@
+# ecs/systems/gameplay/metabolism.py
+"""
+Closed-form metabolism: advance hunger, health and age by T seconds in one go.
+
+HungerSystem, HealthSystem and AgingSystem integrate piecewise-linear rates
+tick by tick. For a long gap (catch-up after a pause, a huge time_scale) the
+same model is solved analytically per fish:
+
+* hunger(t) = max(0, h0 - rate * t)  (no feeding during the gap);
+* health' = +regen while hunger ratio > threshold (capped at max),
+            -starve while hunger == 0,
+            -elder decay, which ramps linearly with age past r_elder;
+* eggs hatch after the egg duration, then age counts toward lifespan;
+* death at health 0 (HealthSystem) or at lifespan (hard death).
+
+The window is split at every regime change (regen ends, starvation starts,
+hatch, elder ramp starts, lifespan); inside a piece health follows
+`H + a*t - b*t^2/2`, so crossing the cap or zero is a root of a quadratic.
+Results agree with tick integration to within a tick's worth of change.
+"""
+from __future__ import annotations
+
+from math import inf, sqrt
+from typing import Optional, Tuple
+
+from ecs.components.fish.age_component import Age
+from ecs.components.fish.behavior_tuning import BehaviorTuning
+from ecs.components.fish.health_component import Health
+from ecs.components.fish.hunger_component import Hunger
+from ecs.components.fish.motion_component import MotionParams
+from ecs.components.tags.affected_by_gravity import AffectedByGravity
+from ecs.components.tags.dead_component import DeadFlag
+from ecs.systems.gameplay.aging_system import AgingSystem
+
+__all__ = ["advance_fish", "fast_forward_metabolism"]
+
+_EPS = 1e-9
+
+
+def _health_piece(h: float, cap: float, a: float, b: float,
+                  span: float) -> Tuple[float, Optional[float]]:
+    """
+    Health over one piece with rate `a - b*t` (b >= 0), capped at `cap`.
+    Returns (health at the end, time of reaching 0 or None).
+    """
+    t0 = 0.0
+    if h >= cap - _EPS and a >= 0.0:
+        # Pinned at the cap until the rate turns negative
+        hold = a / b if b > 0.0 else inf
+        if hold >= span:
+            return cap, None
+        h, t0, a = cap, hold, 0.0
+    else:
+        # Rising toward the cap?
+        if a > 0.0 and h < cap:
+            rise = cap - h
+            if b > 0.0:
+                disc = a * a - 2.0 * b * rise
+                t_cap = (a - sqrt(disc)) / b if disc >= 0.0 else inf
+            else:
+                t_cap = rise / a
+            if t_cap < span:
+                end, died = _health_piece(cap, cap, a - b * t_cap, b, span - t_cap)
+                return end, (None if died is None else t_cap + died)
+    left = span - t0
+    # First t in (0, left] with h + a t - b t^2 / 2 <= 0
+    if b > 0.0:
+        t_dead = (a + sqrt(a * a + 2.0 * b * h)) / b
+    elif a < 0.0:
+        t_dead = h / -a
+    else:
+        t_dead = inf
+    if h <= 0.0:
+        t_dead = 0.0
+    if t_dead <= left:
+        return 0.0, t0 + t_dead
+    return min(cap, h + a * left - 0.5 * b * left * left), None
+
+
+def advance_fish(seconds: float, age: Age, hunger: Optional[Hunger],
+                 health: Optional[Health], tuning: Optional[BehaviorTuning],
+                 aging: AgingSystem) -> Optional[float]:
+    """
+    Advance one living fish by `seconds` in place. Returns the time of death
+    (seconds into the window) or None. The caller adds DeadFlag and the
+    gravity changes (see fast_forward_metabolism).
+    """
+    T = max(0.0, float(seconds))
+    L = max(1e-6, age.lifespan)
+
+    # ---- life timeline: post-hatch aging starts at t_start -----------------
+    if age.stage == "Egg":
+        t_start = max(0.0, aging._egg_hatch_seconds(age.lifespan) - age.pre_hatch)
+        a0 = 0.0
+    else:
+        t_start = 0.0
+        a0 = age.age
+    t_life = t_start + max(0.0, L - a0) if aging.hard_death else inf
+
+    # Elder decay D(t) = sigma * (t - t_ramp) once t >= t_on
+    health_max = health.max_value if health is not None else 0.0
+    span_ratio = max(1e-6, 1.0 - aging.r_elder)
+    sigma = health_max * aging.elder_hdecay / (span_ratio * L) if aging.elder_hdecay > 0.0 else 0.0
+    t_ramp = t_start + aging.r_elder * L - a0
+    t_on = max(t_start, t_ramp) if sigma > 0.0 else inf
+
+    # ---- hunger timeline ---------------------------------------------------
+    if hunger is not None:
+        h0, rate, hmax = hunger.hunger, hunger.hunger_rate, max(1e-6, hunger.hunger_max)
+    else:
+        h0, rate, hmax = 1.0, 0.0, 1.0
+
+    def hunger_at(t: float) -> float:
+        return min(hmax, max(0.0, h0 - rate * t))
+
+    # Only fish HealthSystem sees (Hunger + BehaviorTuning) regen, starve or die of it
+    vital = health is not None and hunger is not None and tuning is not None
+    if vital:
+        regen = health_max * float(tuning.get("health_regen_factor", 0.0))
+        starve = health_max * float(tuning.get("health_starve_factor", 0.0))
+        thr = float(tuning.get("health_regen_threshold", 0.5))
+    else:
+        regen = starve = 0.0
+        thr = 1.0
+    if rate > 0.0:
+        t_regen_end = max(0.0, (h0 - thr * hmax) / rate)
+        t_starve = max(0.0, h0 / rate)
+    else:
+        t_regen_end = inf if h0 / hmax > thr else 0.0
+        t_starve = 0.0 if h0 <= 0.0 else inf
+
+    # ---- integrate health piece by piece -----------------------------------
+    cuts = sorted({0.0, T} | {t for t in (t_regen_end, t_starve, t_on, t_life) if 0.0 < t < T})
+    h = health.value if health is not None else 0.0
+    t_dead: Optional[float] = None
+    for s, e in zip(cuts, cuts[1:]):
+        if s >= t_life:
+            t_dead = t_life
+            break
+        if health is not None:
+            mid = 0.5 * (s + e)
+            rate_h = 0.0
+            if vital and hunger_at(mid) / hmax > thr:
+                rate_h += regen
+            if vital and mid >= t_starve:
+                rate_h -= starve
+            b = 0.0
+            if mid >= t_on:
+                rate_h -= sigma * (s - t_ramp)
+                b = sigma
+            h, died = _health_piece(h, health_max, rate_h, b, e - s)
+            if died is not None:
+                if vital:
+                    t_dead = s + died
+                    break
+                h = 0.0  # AgingSystem clamps at 0; without tuning nothing kills it
+    if t_dead is None and t_life <= T:
+        t_dead = t_life
+    t_end = T if t_dead is None else t_dead
+
+    # ---- write back --------------------------------------------------------
+    if hunger is not None:
+        hunger.hunger = hunger_at(t_end)
+    if health is not None:
+        health.value = max(0.0, h)
+    if age.stage == "Egg" and t_end < t_start:
+        age.pre_hatch += t_end
+    else:
+        if age.stage == "Egg":
+            age.pre_hatch += t_start
+        age.age = a0 + (t_end - t_start)
+        aging._update_stage_from_ratio(age, age.age / L)
+    if t_dead is not None:
+        age.stage = "Dead"
+    return t_dead
+
+
+def fast_forward_metabolism(world, context, seconds: float,
+                            aging: Optional[AgingSystem] = None) -> int:
+    """
+    Apply `seconds` of hunger/health/aging to every living fish at once.
+    Structural changes (DeadFlag, egg gravity) are queued on world.commands
+    and `aging`'s pending hatch timers are rescheduled from the new pre-hatch
+    times. Returns the number of fish that died.
+    """
+    if seconds <= 0.0:
+        return 0
+    aging = aging or AgingSystem(context)
+    aging.drop_hatch_timers(world)  # eggs' pre_hatch up to date before advancing it
+    deaths = 0
+    for e, age in world.query(Age):
+        if world.get_component(e, DeadFlag):
+            continue
+        was_egg = age.stage == "Egg"
+        t_dead = advance_fish(seconds, age,
+                              world.get_component(e, Hunger),
+                              world.get_component(e, Health),
+                              world.get_component(e, BehaviorTuning),
+                              aging)
+        if was_egg and age.stage not in ("Egg", "Dead") and world.get_component(e, AffectedByGravity):
+            world.commands.remove_component(e, AffectedByGravity)
+        if t_dead is not None:
+            world.commands.add_component(e, DeadFlag())
+            deaths += 1
+        elif age.stage != "Egg":
+            mp = world.get_component(e, MotionParams)
+            if mp is not None:
+                if not hasattr(mp, "base_max_speed"):
+                    mp.base_max_speed = float(mp.max_speed)
+                mp.max_speed = mp.base_max_speed * aging._speed_mult_for_ratio(age.age / max(1e-6, age.lifespan))
+    return deaths
@@ -1,17 +1,22 @@
 from ecs.components.fish.brain_component import Brain
 from ecs.components.tags.dead_component import DeadFlag
+from ecs.schedule import POPULATION
 
 class PopulationGuard:
     """
     Maintains ctx.population_ok by counting living (Brain & !DeadFlag).
     Why: gate breeding completion and eligibility.
     """
+    # Scheduler access (ecs/schedule.py)
+    READS = ()
+    WRITES = (POPULATION,)
+
     def __init__(self, context):
         self.ctx = context
 
     def update(self, world, dt):
         living = 0
-        for e in world.entities_with(Brain):
+        for e in world.query(Brain).entities():
             if world.get_component(e, DeadFlag) is None:
                 living += 1
         self.ctx.population_ok = (living < int(self.ctx.breeding["max_population"]))
\ No newline at end of file
@@ -9,6 +9,10 @@ class GravitySystem:
     Single, generic falling system for pellets, eggs, dead fish, etc.
     Applies +Y based on AffectedByGravity.speed until resting on the sand.
     """
+    # Scheduler access (ecs/schedule.py)
+    READS = (AffectedByGravity, Sprite)
+    WRITES = (Position,)
+
     def __init__(self, context):
         self.context = context
 
@@ -25,10 +29,7 @@ class GravitySystem:
         if dt <= 0.0:
             return
         floor_y = self._floor_logical_y()
-        for e in world.entities_with(AffectedByGravity, Position, Sprite, TankRef):
-            grav = world.get_component(e, AffectedByGravity)
-            pos = world.get_component(e, Position)
-            spr = world.get_component(e, Sprite)
+        for _e, grav, pos, spr, _tank in world.query(AffectedByGravity, Position, Sprite, TankRef):
 
             pos.y += float(grav.speed) * dt
             rest_y = floor_y - spr.base_h
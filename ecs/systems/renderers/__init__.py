@@ -3,7 +3,8 @@
 Convenience re-exports for renderer helpers and caches.
 """
 
-from .cache import LabelCache, SpriteCache
+from .atlas import SpriteAtlas
+from .cache import LabelCache, SpriteCache, SurfaceLRU
 from .geometry import (
     center_logical,
     pellet_center_radius,
@@ -18,7 +19,9 @@ from .overlay_motion import draw_velocity_arrow, draw_avoidance_arrow
 
 __all__ = [
     "LabelCache",
+    "SpriteAtlas",
     "SpriteCache",
+    "SurfaceLRU",
     "center_logical",
     "pellet_center_radius",
     "mouth_logical",
@@ -0,0 +1,120 @@
+# ecs/systems/renderers/atlas.py
+"""
+Sprite atlas: finished SpriteCache variants shelf-packed into a few large
+pages, so a frame's sprites can go to the screen in one Surface.blits()
+call with area rects instead of one blit (and one Rect) per fish.
+
+Regions are keyed by SpriteCache key and hold no reference to the variant
+surface: the owner registers release() as a SpriteCache drop listener, so a
+variant the LRU evicts (or replaces) gives its slot back and the cache's byte
+budget still bounds the variants. Freed slots are reused by later variants
+that fit in them.
+
+pack() runs between frames (tallest first, for tighter shelves); the draw
+loop only looks regions up with get(). When a variant doesn't fit, `full` is
+set and the owner decides whether to start over (clear + repack).
+
+Pixels are copied with BLEND_RGBA_MAX onto a cleared area, i.e. verbatim,
+so blitting an area of a page gives exactly the pixels of blitting the
+variant surface. Pages are convert_alpha()'d once a display mode is set.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+import pygame
+
+__all__ = ["SpriteAtlas"]
+
+_MB = 1024 * 1024
+
+
+class SpriteAtlas:
+    """Shelf-packed pages of sprite variants for the current scale."""
+
+    def __init__(self, page_size: int = 1024, max_bytes: int = 16 * _MB) -> None:
+        self.page_size = int(page_size)
+        self.max_pages = max(1, int(max_bytes) // (self.page_size * self.page_size * 4))
+        self._pages: List[pygame.Surface] = []
+        # Per page: shelves as [y, height, next_x]
+        self._shelves: List[List[List[int]]] = []
+        # Released slots: (page, area), reused first-fit
+        self._free: List[Tuple[pygame.Surface, pygame.Rect]] = []
+        self._regions: Dict[Hashable, Tuple[pygame.Surface, pygame.Rect]] = {}
+        self.full = False
+
+    def __len__(self) -> int:
+        return len(self._regions)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._regions
+
+    def get(self, key: Hashable) -> Optional[Tuple[pygame.Surface, pygame.Rect]]:
+        """(page, area) holding variant `key`, or None if it isn't packed."""
+        return self._regions.get(key)
+
+    def clear(self) -> None:
+        self._pages.clear()
+        self._shelves.clear()
+        self._free.clear()
+        self._regions.clear()
+        self.full = False
+
+    def release(self, key: Hashable) -> None:
+        """Variant `key` left the sprite cache: free its slot."""
+        region = self._regions.pop(key, None)
+        if region is not None:
+            self._free.append(region)
+            self.full = False  # worth trying again
+
+    def pack(self, items: Iterable[Tuple[Hashable, pygame.Surface]]) -> int:
+        """Copy (key, surface) variants into the pages; returns how many were packed."""
+        todo = sorted(((k, s) for k, s in items if k not in self._regions),
+                      key=lambda item: -item[1].get_height())
+        packed = 0
+        for key, surf in todo:
+            w, h = surf.get_size()
+            spot = self._find_spot(w, h) if 0 < w <= self.page_size and 0 < h <= self.page_size else None
+            if spot is None:
+                self.full = True
+                continue
+            page, area = spot
+            page.fill((0, 0, 0, 0), area)
+            page.blit(surf, area.topleft, special_flags=pygame.BLEND_RGBA_MAX)
+            self._regions[key] = (page, area)
+            packed += 1
+        return packed
+
+    def _find_spot(self, w: int, h: int) -> Optional[Tuple[pygame.Surface, pygame.Rect]]:
+        for i, (page, slot) in enumerate(self._free):
+            if slot.w >= w and slot.h >= h:
+                del self._free[i]
+                return page, pygame.Rect(slot.x, slot.y, w, h)
+        size = self.page_size
+        for page, shelves in zip(self._pages, self._shelves):
+            # First shelf tall enough with room left, else a new shelf below
+            for shelf in shelves:
+                if shelf[1] >= h and shelf[2] + w <= size:
+                    x = shelf[2]
+                    shelf[2] += w
+                    return page, pygame.Rect(x, shelf[0], w, h)
+            bottom = shelves[-1][0] + shelves[-1][1] if shelves else 0
+            if bottom + h <= size:
+                shelves.append([bottom, h, w])
+                return page, pygame.Rect(0, bottom, w, h)
+        if len(self._pages) >= self.max_pages:
+            return None
+        page = pygame.Surface((size, size), pygame.SRCALPHA)
+        if pygame.display.get_init() and pygame.display.get_surface() is not None:
+            page = page.convert_alpha()
+        self._pages.append(page)
+        self._shelves.append([[0, h, w]])
+        return page, pygame.Rect(0, 0, w, h)
+
+    def stats(self) -> Dict[str, Any]:
+        used = sum(a.w * a.h for _, a in self._regions.values())
+        total = len(self._pages) * self.page_size * self.page_size
+        return {
+            "entries": len(self._regions), "pages": len(self._pages), "free_slots": len(self._free),
+            "bytes": total * 4, "fill": used / total if total else 0.0, "full": self.full,
+        }
@@ -1,36 +1,290 @@
 # ecs/systems/renderers/cache.py
 """
-Lightweight sprite/label surface caches with optional variants:
+Lightweight sprite/label surface caches on a shared LRU layer (SurfaceLRU:
+true LRU order, optional byte budget and entry limit, hit/miss/eviction
+counters listed in the F7 debug panel). Sprite variants:
 - dead=True: grayscale + vertical flip (your existing "Dead" look)
 - hflip=True: horizontal flip (ignored when dead=True)
 - variant="senior": partial desaturate + warm tint (+ optional 1px outline)
-All heavy pixel work happens once per unique cache key.
+All heavy pixel work happens once per unique cache key, vectorized over
+pygame.surfarray when NumPy is available (per-pixel loops otherwise; both
+give identical pixels).
 
 This version also publishes the final, already-transformed surface that the
 sprite renderer blitted for each entity so the Fish window can reuse it
 (eggs, juvenile scale, senior tint, dead flip+grey, etc.).
 """
 from __future__ import annotations
-from typing import Dict, Tuple, Any
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
 import pygame
 
-__all__ = ["SpriteCache", "LabelCache"]
+from ecs.columns import HAVE_NUMPY, np
+from ecs.entity import EntityTable
+
+__all__ = ["SurfaceLRU", "SpriteCache", "LabelCache"]
+
+_MB = 1024 * 1024
 
 
 def _clamp01(x: float) -> float:
     return 0.0 if x < 0.0 else 1.0 if x > 1.0 else x
 
 
+# ---- pixel passes (in place on a 32-bit SRCALPHA surface) -------------------
+# Each touches only pixels with alpha != 0 and uses the same integer/float
+# arithmetic as the loop fallbacks, so both paths produce the same bytes.
+
+def _grayscale_np(img: pygame.Surface) -> None:
+    rgb = pygame.surfarray.pixels3d(img)
+    on = pygame.surfarray.pixels_alpha(img) != 0
+    c = rgb[on].astype(np.int32)
+    lum = (c[:, 0] * 299 + c[:, 1] * 587 + c[:, 2] * 114) // 1000  # ITU-R 601-2
+    rgb[on] = lum[:, None]
+    del rgb  # release the surface lock
+
+
+def _grayscale_loop(img: pygame.Surface) -> None:
+    width, height = img.get_size()
+    for x in range(width):
+        for y in range(height):
+            r, g, b, a = img.get_at((x, y))
+            if a:
+                lum = (r * 299 + g * 587 + b * 114) // 1000  # ITU-R 601-2
+                img.set_at((x, y), (lum, lum, lum, a))
+
+
+def _desat_tint_np(img: pygame.Surface, desaturate: float, tint: Tuple[int, int, int]) -> None:
+    rgb = pygame.surfarray.pixels3d(img)
+    on = pygame.surfarray.pixels_alpha(img) != 0
+    c = rgb[on].astype(np.int32)
+    if desaturate > 0.0:
+        lum = (c[:, 0] * 299 + c[:, 1] * 587 + c[:, 2] * 114) // 1000
+        # int(r + (lum - r) * d): the mix lies between r and lum, so truncation is floor
+        c = (c + (lum[:, None] - c) * desaturate).astype(np.int32)
+    if tint != (255, 255, 255):
+        c = (c * np.array(tint, dtype=np.int32)) // 255
+    rgb[on] = c
+    del rgb
+
+
+def _desat_tint_loop(img: pygame.Surface, desaturate: float, tint: Tuple[int, int, int]) -> None:
+    w, h = img.get_size()
+    tr, tg, tb = tint
+    for x in range(w):
+        for y in range(h):
+            r, g, b, a = img.get_at((x, y))
+            if not a:
+                continue
+            if desaturate > 0.0:
+                lum = (r * 299 + g * 587 + b * 114) // 1000
+                r = int(r + (lum - r) * desaturate)
+                g = int(g + (lum - g) * desaturate)
+                b = int(b + (lum - b) * desaturate)
+            if (tr, tg, tb) != (255, 255, 255):
+                r = (r * tr) // 255
+                g = (g * tg) // 255
+                b = (b * tb) // 255
+            img.set_at((x, y), (r, g, b, a))
+
+
+def _dilated_outline_np(img: pygame.Surface, px: int,
+                        color: Tuple[int, int, int, int]) -> pygame.Surface:
+    """Opaque outline: the alpha mask (> 127) shifted by ±px on each axis, OR-ed."""
+    w, h = img.get_size()
+    solid = pygame.surfarray.array_alpha(img) > 127
+    ring = np.zeros_like(solid)
+    if px < w:
+        ring[:-px, :] |= solid[px:, :]
+        ring[px:, :] |= solid[:-px, :]
+    if px < h:
+        ring[:, :-px] |= solid[:, px:]
+        ring[:, px:] |= solid[:, :-px]
+    final = pygame.Surface((w, h), pygame.SRCALPHA)
+    rgb = pygame.surfarray.pixels3d(final)
+    rgb[ring] = color[:3]
+    del rgb
+    alpha = pygame.surfarray.pixels_alpha(final)
+    alpha[ring] = 255
+    del alpha
+    return final
+
+
+def _alpha_copy(surf: pygame.Surface) -> pygame.Surface:
+    """Private per-pixel-alpha copy without convert_alpha() (no display needed)."""
+    if surf.get_flags() & pygame.SRCALPHA:
+        return surf.copy()
+    out = pygame.Surface(surf.get_size(), pygame.SRCALPHA)
+    out.blit(surf, (0, 0))
+    return out
+
+
+def surface_bytes(surf: pygame.Surface) -> int:
+    """Pixel memory held by a surface (row pitch * height)."""
+    return surf.get_pitch() * surf.get_height()
+
+
+class SurfaceLRU:
+    """
+    Least-recently-used Surface cache. Limits (0 = unlimited): `max_bytes`,
+    counted with surface_bytes(), and `max_entries`. A surface bigger than
+    the whole budget is returned to the caller but not kept. Every instance
+    is listed by SurfaceLRU.instances() for the debug panel.
+
+    Drop listeners (add_drop_listener) are called with the key of every entry
+    that leaves the cache: evicted, replaced by put() or cleared. Bound
+    methods are held weakly.
+    """
+    _instances: "weakref.WeakSet[SurfaceLRU]" = weakref.WeakSet()
+
+    def __init__(self, name: str, max_bytes: int = 0, max_entries: int = 0) -> None:
+        self.name = name
+        self.max_bytes = int(max_bytes)
+        self.max_entries = int(max_entries)
+        self._items: "OrderedDict[Hashable, Tuple[pygame.Surface, int]]" = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._listeners: List[Callable[[], Optional[Callable[[Hashable], None]]]] = []
+        SurfaceLRU._instances.add(self)
+
+    @classmethod
+    def instances(cls) -> List["SurfaceLRU"]:
+        return sorted(cls._instances, key=lambda c: c.name)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._items
+
+    def get(self, key: Hashable) -> Optional[pygame.Surface]:
+        items = self._items
+        try:
+            item = items[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        items.move_to_end(key)
+        self.hits += 1
+        return item[0]
+
+    def peek(self, key: Hashable) -> Optional[pygame.Surface]:
+        """Surface for `key` without touching counters or LRU order."""
+        item = self._items.get(key)
+        return item[0] if item is not None else None
+
+    def touch(self, keys: Iterable[Hashable]) -> None:
+        """Mark `keys` as just used (lookups served elsewhere, e.g. from an atlas)."""
+        items = self._items
+        for key in keys:
+            if key in items:
+                items.move_to_end(key)
+
+    def add_drop_listener(self, fn: Callable[[Hashable], None]) -> None:
+        ref = weakref.WeakMethod(fn) if hasattr(fn, "__self__") else (lambda: fn)
+        self._listeners.append(ref)
+
+    def _dropped(self, key: Hashable) -> None:
+        if not self._listeners:
+            return
+        live = []
+        for ref in self._listeners:
+            fn = ref()
+            if fn is not None:
+                fn(key)
+                live.append(ref)
+        self._listeners = live
+
+    def put(self, key: Hashable, surf: pygame.Surface) -> None:
+        size = surface_bytes(surf)
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.bytes -= old[1]
+            self._dropped(key)
+        if self.max_bytes and size > self.max_bytes:
+            return
+        self._items[key] = (surf, size)
+        self.bytes += size
+        self._trim()
+
+    def set_limits(self, max_bytes: Optional[int] = None, max_entries: Optional[int] = None) -> None:
+        if max_bytes is not None:
+            self.max_bytes = int(max_bytes)
+        if max_entries is not None:
+            self.max_entries = int(max_entries)
+        self._trim()
+
+    def _trim(self) -> None:
+        items = self._items
+        while items and ((self.max_bytes and self.bytes > self.max_bytes)
+                         or (self.max_entries and len(items) > self.max_entries)):
+            key, (_, size) = items.popitem(last=False)
+            self.bytes -= size
+            self.evictions += 1
+            self._dropped(key)
+
+    def items(self) -> List[Tuple[Hashable, pygame.Surface]]:
+        """(key, surface) pairs, least recently used first (no counter or order change)."""
+        return [(key, item[0]) for key, item in self._items.items()]
+
+    def clear(self) -> None:
+        """Drop every entry (not counted as evictions; counters are kept)."""
+        keys = list(self._items) if self._listeners else ()
+        self._items.clear()
+        self.bytes = 0
+        for key in keys:
+            self._dropped(key)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "name": self.name, "entries": len(self._items), "bytes": self.bytes,
+            "max_bytes": self.max_bytes, "hits": self.hits, "misses": self.misses,
+            "evictions": self.evictions, "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
 class SpriteCache:
     """Cache scaled/variant sprite surfaces + share final blits to other systems."""
     _shared = None  # singleton holder
 
-    def __init__(self, cache_limit: int = 256) -> None:
-        self.cache_limit = int(cache_limit)
+    def __init__(self, cache_limit: int = 256, max_bytes: int = 64 * _MB) -> None:
         # key: (id(img), w, h, dead, hflip, variant_key) -> Surface
-        self._cache: Dict[Tuple[int, int, int, bool, bool, Tuple[Any, ...]], pygame.Surface] = {}
+        self._cache = SurfaceLRU("sprites", max_bytes=max_bytes, max_entries=cache_limit)
+        # Background pre-warm (see rescale): keys being built, finished
+        # builds waiting for the swap, and the pre-rescale surface of each
+        # variant (key minus size) for nearest-neighbour placeholders
+        self._pending: set = set()
+        self._ready: List[Tuple[int, Any, pygame.Surface]] = []
+        self._ready_lock = threading.Lock()
+        self._generation = 0
+        self._stale: Dict[Tuple[Any, ...], pygame.Surface] = {}
+        self._placeholders: Dict[Any, pygame.Surface] = {}
+        self._worker: Optional[ThreadPoolExecutor] = None
         # NEW: what the renderer actually blitted last for each entity
-        self._final_by_entity: Dict[int, pygame.Surface] = {}
+        # (slot-indexed: bounded by live entities, stale handles read as None)
+        self._final_by_entity: EntityTable[pygame.Surface] = EntityTable()
+
+    @property
+    def cache_limit(self) -> int:
+        return self._cache.max_entries
+
+    @cache_limit.setter
+    def cache_limit(self, value: int) -> None:
+        self._cache.set_limits(max_entries=value)
+
+    @property
+    def max_bytes(self) -> int:
+        return self._cache.max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int) -> None:
+        self._cache.set_limits(max_bytes=value)
 
     @classmethod
     def shared(cls) -> "SpriteCache":
@@ -39,6 +293,23 @@ class SpriteCache:
             cls._shared = cls()
         return cls._shared
 
+    # ---- lookups that bypass get() (SpriteAtlas) -----------------------------
+    def key(self, img: pygame.Surface, w: int, h: int, *, dead: bool = False, hflip: bool = False,
+            variant: str = "normal", senior_style: Dict[str, Any] | None = None) -> Tuple[Any, ...]:
+        """Cache key of the variant get() would return for these arguments."""
+        return (id(img), int(w), int(h), bool(dead), bool(hflip), self._variant_key(variant, senior_style))
+
+    def peek(self, key: Tuple[Any, ...]) -> Optional[pygame.Surface]:
+        """Finished variant for `key` if cached (never builds, no placeholders)."""
+        return self._cache.peek(key)
+
+    def touch(self, keys: Iterable[Tuple[Any, ...]]) -> None:
+        self._cache.touch(keys)
+
+    def add_drop_listener(self, fn: Callable[[Tuple[Any, ...]], None]) -> None:
+        """Call fn(key) whenever a variant leaves the cache (see SurfaceLRU)."""
+        self._cache.add_drop_listener(fn)
+
     # ---- "final surface" sharing API -----------------------------------------
     def put_final(self, entity_id: int, surf: pygame.Surface) -> None:
         self._final_by_entity[entity_id] = surf
@@ -51,18 +322,88 @@ class SpriteCache:
         self._cache.clear()
         # also clear finals when scale/atlas changes so thumbs refresh
         self._final_by_entity.clear()
+        self._generation += 1  # in-flight pre-warm results are dropped
+        self._pending.clear()
+        self._stale.clear()
+        self._placeholders.clear()
+
+    # ---- background pre-warm -------------------------------------------------
+    def rescale(self, jobs: Iterable[Tuple[pygame.Surface, int, int, bool, bool, str, Any]]) -> int:
+        """
+        Scale change: like clear(), but the listed variants
+        (img, w, h, dead, hflip, variant, senior_style) are built on a worker
+        thread. Until apply_prewarmed() swaps a result in, get(...,
+        placeholder=True) answers with a nearest-neighbour scale of the old
+        variant. Returns the number of jobs queued.
+        """
+        stale = {key[:1] + key[3:]: surf for key, surf in self._cache.items()}
+        self.clear()
+        self._stale = stale
+        generation = self._generation
+        # The worker only touches private copies of the sources (main thread
+        # may scale the originals meanwhile) and never the display
+        sources: Dict[int, pygame.Surface] = {}
+        queued = 0
+        for img, w, h, dead, hflip, variant, style in jobs:
+            key = self.key(img, w, h, dead=dead, hflip=hflip, variant=variant, senior_style=style)
+            if key in self._pending:
+                continue
+            src = sources.get(id(img))
+            if src is None:
+                src = sources[id(img)] = _alpha_copy(img)
+            self._pending.add(key)
+            if self._worker is None:
+                self._worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sprite-prewarm")
+            self._worker.submit(self._prewarm_one, generation, key, src)
+            queued += 1
+        return queued
+
+    def _prewarm_one(self, generation: int, key, src: pygame.Surface) -> None:
+        # Racy reads are fine: apply_prewarmed() re-checks before using a result
+        if generation != self._generation or key not in self._pending:
+            return  # superseded by another resize, or built on demand already
+        _, w, h, dead, hflip, vkey = key
+        surf = self._build(src, w, h, dead, hflip, vkey, convert=False)
+        with self._ready_lock:
+            self._ready.append((generation, key, surf))
+
+    def apply_prewarmed(self) -> int:
+        """Swap finished pre-warm builds into the cache (main thread, between frames)."""
+        if not self._ready:
+            return 0
+        with self._ready_lock:
+            ready, self._ready = self._ready, []
+        swapped = 0
+        for generation, key, surf in ready:
+            if generation != self._generation or key not in self._pending:
+                continue
+            self._cache.put(key, surf.convert_alpha())  # display format, main thread only
+            self._pending.discard(key)
+            self._placeholders.pop(key, None)
+            swapped += 1
+        if not self._pending:
+            self._stale.clear()
+            self._placeholders.clear()
+        return swapped
+
+    @property
+    def prewarming(self) -> int:
+        """Variants still being built in the background."""
+        return len(self._pending)
+
+    def wait_prewarm(self) -> None:
+        """Block until queued pre-warm builds finish (tests, tools)."""
+        if self._worker is not None:
+            self._worker.submit(lambda: None).result()
 
     # --- transforms -----------------------------------------------------------
-    def _to_grayscale_and_vflip(self, surf: pygame.Surface) -> pygame.Surface:
+    # Vectorized passes when NumPy is importable (tests flip this to compare)
+    use_numpy = HAVE_NUMPY
+
+    def _to_grayscale_and_vflip(self, surf: pygame.Surface, convert: bool = True) -> pygame.Surface:
         """Dead look: grayscale + vertical flip (once)."""
-        gs = surf.copy().convert_alpha()
-        width, height = gs.get_size()
-        for x in range(width):
-            for y in range(height):
-                r, g, b, a = gs.get_at((x, y))
-                if a:
-                    lum = (r * 299 + g * 587 + b * 114) // 1000  # ITU-R 601-2
-                    gs.set_at((x, y), (lum, lum, lum, a))
+        gs = surf.copy().convert_alpha() if convert else _alpha_copy(surf)
+        (_grayscale_np if self.use_numpy else _grayscale_loop)(gs)
         return pygame.transform.flip(gs, False, True)
 
     def _apply_senior_style(
@@ -74,41 +415,30 @@ class SpriteCache:
         outline: bool,
         outline_px: int,
         outline_color: Tuple[int, int, int, int],
+        convert: bool = True,
     ) -> pygame.Surface:
         """
         Senior look: partial desat toward grayscale, then warm tint.
         Optionally add a small outline (1 px) using a mask.
         """
         desaturate = _clamp01(float(desaturate))
-        # 1) partial desaturation (per-pixel mix toward luminance)
-        img = base.copy().convert_alpha()
+        img = base.copy().convert_alpha() if convert else _alpha_copy(base)
         w, h = img.get_size()
-        if desaturate > 0.0:
-            for x in range(w):
-                for y in range(h):
-                    r, g, b, a = img.get_at((x, y))
-                    if a:
-                        lum = (r * 299 + g * 587 + b * 114) // 1000
-                        r = int(r + (lum - r) * desaturate)
-                        g = int(g + (lum - g) * desaturate)
-                        b = int(b + (lum - b) * desaturate)
-                        img.set_at((x, y), (r, g, b, a))
-        # 2) warm tint (fast per-pixel multiply)
-        tr, tg, tb = [max(0, min(255, int(v))) for v in tint_rgb]
-        if (tr, tg, tb) != (255, 255, 255):
-            for x in range(w):
-                for y in range(h):
-                    r, g, b, a = img.get_at((x, y))
-                    if a:
-                        r = (r * tr) // 255
-                        g = (g * tg) // 255
-                        b = (b * tb) // 255
-                        img.set_at((x, y), (r, g, b, a))
+        # 1) partial desaturation (per-pixel mix toward luminance)
+        # 2) warm tint (per-pixel multiply), fused into one pass
+        tint = tuple(max(0, min(255, int(v))) for v in tint_rgb)
+        if desaturate > 0.0 or tint != (255, 255, 255):
+            (_desat_tint_np if self.use_numpy else _desat_tint_loop)(img, desaturate, tint)
         if not outline or outline_px <= 0:
             return img
         # 3) tiny outline via mask (cached once per key)
         outline_px = max(1, int(outline_px))
         oc = outline_color if len(outline_color) == 4 else (outline_color[0], outline_color[1], outline_color[2], 255)
+        if self.use_numpy and oc[3] == 255:
+            # Opaque ring: the four shifted blits below reduce to a mask dilation
+            final = _dilated_outline_np(img, outline_px, oc)
+            final.blit(img, (0, 0))
+            return final
         # Build a mask off the *desat+tinted* image alpha
         mask = pygame.mask.from_surface(img)
         edge = mask.to_surface(setcolor=oc, unsetcolor=(0, 0, 0, 0))
@@ -148,6 +478,7 @@ class SpriteCache:
         hflip: bool = False,
         variant: str = "normal",
         senior_style: Dict[str, Any] | None = None,
+        placeholder: bool = False,
     ) -> pygame.Surface:
         """
         Return a (possibly transformed) surface:
@@ -155,16 +486,38 @@ class SpriteCache:
         - dead=True: grayscale + vertical flip
         - hflip=True: horizontal flip (ignored if dead=True)
         - variant="senior": partial desat + tint + optional outline
+
+        placeholder=True: while this variant is pre-warming (rescale), return
+        a cheap nearest-neighbour scale of its pre-rescale surface instead of
+        building it now.
         """
-        vkey = self._variant_key(variant, senior_style)
-        key = (id(img), int(w), int(h), bool(dead), bool(hflip), vkey)
+        key = self.key(img, w, h, dead=dead, hflip=hflip, variant=variant, senior_style=senior_style)
+        vkey = key[5]
         cached = self._cache.get(key)
         if cached is not None:
             return cached
+        if key in self._pending:
+            if placeholder:
+                quick = self._placeholders.get(key)
+                if quick is not None:
+                    return quick
+                old = self._stale.get(key[:1] + key[3:])
+                if old is not None:
+                    quick = self._placeholders[key] = pygame.transform.scale(old, (int(w), int(h)))
+                    return quick
+            # Built here after all: the worker skips it (or its result is dropped)
+            self._pending.discard(key)
+        transformed = self._build(img, int(w), int(h), bool(dead), bool(hflip), vkey)
+        self._cache.put(key, transformed)
+        return transformed
+
+    def _build(self, img: pygame.Surface, w: int, h: int, dead: bool, hflip: bool,
+               vkey: Tuple[Any, ...], convert: bool = True) -> pygame.Surface:
+        """convert=False: pixel work only, no display calls (pre-warm worker)."""
         # Base scale first
         scaled = pygame.transform.smoothscale(img, (int(w), int(h)))
         if dead:
-            transformed = self._to_grayscale_and_vflip(scaled)
+            transformed = self._to_grayscale_and_vflip(scaled, convert)
         else:
             # optional hflip relative to the base art
             base = pygame.transform.flip(scaled, True, False) if hflip else scaled
@@ -178,21 +531,19 @@ class SpriteCache:
                     outline=outline,
                     outline_px=opx,
                     outline_color=ocol,
+                    convert=convert,
                 )
             else:
                 transformed = base
-        # Simple LRU-ish eviction
-        if len(self._cache) >= self.cache_limit and self._cache:
-            self._cache.pop(next(iter(self._cache)))
-        self._cache[key] = transformed
         return transformed
 
 
 class LabelCache:
-    """Cache rendered text surfaces for a given pygame Font."""
-    def __init__(self, font) -> None:
+    """Cache rendered text surfaces for a given pygame Font (LRU, byte-budgeted)."""
+    def __init__(self, font, max_bytes: int = 2 * _MB) -> None:
         self.font = font
-        self._cache: Dict[Tuple[str, Tuple[int, int, int]], pygame.Surface] = {}
+        # (text, color) -> Surface
+        self._cache = SurfaceLRU("labels", max_bytes=max_bytes)
 
     def clear(self) -> None:
         self._cache.clear()
@@ -203,5 +554,5 @@ class LabelCache:
         if cached is not None:
             return cached
         surf = self.font.render(text, True, color)
-        self._cache[key] = surf
+        self._cache.put(key, surf)
         return surf
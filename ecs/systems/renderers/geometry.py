@@ -6,8 +6,7 @@ from ecs.components.tags.food_pellet_component import FoodPellet
 from ecs.components.fish.behavior_tuning import BehaviorTuning
 from utils.geometry import get_mouth_logical as _core_mouth_logical
 def entity_exists(world, eid: int) -> bool:
-    comps = getattr(world, "_components", None)
-    return isinstance(comps, dict) and (eid in comps)
+    return world.is_alive(eid)
 
 def center_logical(pos: Position, spr: Sprite) -> Tuple[float, float]:
     return pos.x + spr.base_w * 0.5, pos.y + spr.base_h * 0.5
@@ -13,8 +13,7 @@ def _pellet_center_and_radius_render(world, pellet_id, *,
                                      radius_scale: float = 1.0,
                                      off_x: float = 0.0, off_y: float = 0.0):
     """Same math the FSM uses, but local to the renderer to avoid imports."""
-    comps = getattr(world, "_components", {})
-    if pellet_id not in comps:
+    if not world.is_alive(pellet_id):
         return None, None, None
     p = world.get_component(pellet_id, Position)
     s = world.get_component(pellet_id, Sprite)
@@ -12,6 +12,7 @@ from ecs.components.fish.behavior_tuning import BehaviorTuning
 from ecs.components.fish.target_intent_component import TargetIntent
 from ecs.components.fish.steering_intent_component import SteeringIntent
 from ecs.components.fish.age_component import Age
+from ecs.entity import EntityTable
 from ecs.systems.renderers import (
     LabelCache,
     choose_facing,
@@ -24,6 +25,12 @@ from ecs.systems.renderers import (
 
 
 class FishOverlaySystem:
+    # Context toggles under which this system draws anything (its run_if)
+    FLAGS = (
+        "show_behavior_labels", "show_fish_vision", "show_pellet_radius", "show_food_links",
+        "show_target_lines", "show_velocity_arrows", "show_avoidance_arrows",
+    )
+
     def __init__(self, screen, assets, context, font_size: int = 14):
         self.screen = screen
         self.assets = assets
@@ -38,8 +45,10 @@ class FishOverlaySystem:
         self.font = pygame.font.SysFont("arial", font_size)
 
         # Caches/state
-        self.label_cache = LabelCache(self.font)  # cached text surfaces
-        self._last_facing: dict[int, bool] = {}   # eid -> faces_right
+        ui = getattr(self.context, "ui", {}) or {}
+        self.label_cache = LabelCache(  # cached text surfaces
+            self.font, max_bytes=int(float(ui.get("label_cache_mb", 2)) * 1024 * 1024))
+        self._last_facing: EntityTable[bool] = EntityTable()   # eid -> faces_right
 
         # UI sizing (stable defaults; tweak via context if present)
         self._bar_h = int(getattr(self.context, "overlay_bar_h", 8))
@@ -50,9 +59,7 @@ class FishOverlaySystem:
     def update(self, world, dt):
         scale = float(getattr(self.context, "tank_scale", 1.0))
 
-        for e in world.entities_with(Position, Sprite):
-            pos: Position = world.get_component(e, Position)
-            spr: Sprite = world.get_component(e, Sprite)
+        for e, pos, spr in world.query(Position, Sprite):
             vel: Optional[Velocity] = world.get_component(e, Velocity)
             brain: Optional[Brain] = world.get_component(e, Brain)
             hunger: Optional[Hunger] = world.get_component(e, Hunger)
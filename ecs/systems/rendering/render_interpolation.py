@@ -0,0 +1,61 @@
+# ecs/systems/rendering/render_interpolation.py
+"""
+RenderInterpolation
+-------------------
+Smooth drawing between fixed simulation steps.
+
+Game.run steps the simulation in fixed `dt` increments and renders with the
+leftover accumulator fraction `alpha = accumulator / dt` (context.render_alpha).
+Before every fixed step (not every substep: alpha is a fraction of the whole
+step) Game.advance has the scene call `snapshot(world)` to remember where each
+tank entity was; at render time `begin(world, alpha)` moves positions to
+`prev + (cur - prev) * alpha`, the render systems draw as usual, and
+`end(world)` restores the simulated positions. Render systems therefore need
+no changes, and everything they publish (hit rects, overlays) matches what is
+on screen.
+
+Entities created since the last snapshot draw at their current position.
+"""
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+from ecs.components.core.position_component import Position
+from ecs.components.core.tank_ref_component import TankRef
+
+
+class RenderInterpolation:
+    def __init__(self) -> None:
+        self._prev: Dict[int, Tuple[float, float]] = {}
+        self._saved: List[Tuple[Position, float, float]] = []
+
+    def snapshot(self, world) -> None:
+        """Remember positions at the start of a simulation step."""
+        self._prev = {e: (pos.x, pos.y) for e, pos, _tank in world.query(Position, TankRef)}
+
+    def begin(self, world, alpha: float) -> None:
+        """Move positions to the interpolated render state (undo with end())."""
+        self._saved = []
+        if alpha >= 1.0 or not self._prev:
+            return
+        alpha = max(0.0, float(alpha))
+        prev = self._prev
+        saved = self._saved
+        for e, pos, _tank in world.query(Position, TankRef):
+            p = prev.get(e)
+            if p is None:
+                continue
+            x, y = pos.x, pos.y
+            px, py = p
+            if px == x and py == y:
+                continue
+            saved.append((pos, x, y))
+            pos.x = px + (x - px) * alpha
+            pos.y = py + (y - py) * alpha
+
+    def end(self, world) -> None:
+        """Restore the simulated positions."""
+        for pos, x, y in self._saved:
+            pos.x = x
+            pos.y = y
+        self._saved = []
@@ -1,6 +1,5 @@
 # ecs/systems/rendering/sprite_render_system.py
 from __future__ import annotations
-import pygame
 from typing import Optional
 
 from ecs.components.core.position_component import Position
@@ -10,13 +9,22 @@ from ecs.components.core.velocity_component import Velocity
 from ecs.components.fish.brain_component import Brain
 from ecs.components.fish.target_intent_component import TargetIntent
 from ecs.components.fish.age_component import Age
+from ecs.entity import EntityTable
 from ecs.systems.renderers import choose_facing
+from ecs.systems.renderers.atlas import SpriteAtlas
 from ecs.systems.renderers.cache import SpriteCache
 
 class SpriteRenderSystem:
     """
     Draw fish sprites and publish per-fish screen rects for click hit-testing.
 
+    Sprites are gathered as (surface, dest, area) draw commands and sent in
+    one screen.blits() call. Finished variants come from a SpriteAtlas page,
+    rebuilt from the pre-warm job list on every scale change (packed as the
+    variants become available); variants missing from it (pre-warm
+    placeholders, new stages) are drawn from their own surface and packed
+    after the frame.
+
     WHY: MouseSystem._hit_test_fish reads context.fish_screen_rects.
     If this list is missing or stale, clicks won't open panels.
     """
@@ -29,9 +37,17 @@ class SpriteRenderSystem:
         self.sprite_cache = SpriteCache.shared()
         ui = getattr(context, "ui", {}) or {}
         self.sprite_cache.cache_limit = int(ui.get("render_cache_limit", cache_limit))
+        self.sprite_cache.max_bytes = int(float(ui.get("render_cache_mb", 64)) * 1024 * 1024)
 
         self._last_scale: Optional[float] = None
-        self._last_facing: dict[int, bool] = {}
+        self._prewarm = bool(ui.get("sprite_prewarm", True))
+        self.atlas: Optional[SpriteAtlas] = None
+        if ui.get("sprite_atlas", True):
+            self.atlas = SpriteAtlas(max_bytes=int(float(ui.get("sprite_atlas_mb", 16)) * 1024 * 1024))
+            self.sprite_cache.add_drop_listener(self.atlas.release)
+        self._atlas_want: list = []  # job keys still to pack once pre-warmed
+        self._atlas_compacted = False
+        self._last_facing: EntityTable[bool] = EntityTable()
 
     def _senior_style_cfg(self) -> dict:
         aging = getattr(self.context, "aging", {}) or {}
@@ -43,19 +59,124 @@ class SpriteRenderSystem:
             "outline_color": tuple(aging.get("senior_outline_color", [40, 35, 30, 255])),
         }
 
+    def _variant(self, spr: Sprite, age: Optional[Age], brain: Optional[Brain], scale: float):
+        """
+        What to draw for one sprite at `scale`: (base_img, base_w, base_h,
+        screen_w, screen_h, dead, variant, senior_style), or None without art.
+        """
+        base_w = int(round(spr.base_w * scale))
+        base_h = int(round(spr.base_h * scale))
+
+        # Stage/variant
+        stage = getattr(age, "stage", "Adult") if age else "Adult"
+        is_dead = (getattr(brain, "state", "") == "Dead")
+        is_senior = bool(age and stage == "Senior")
+        is_juvenile = bool(age and stage == "Juvenile")
+        is_egg = bool(age and stage == "Egg")
+
+        # Base asset
+        base_img = self.assets.get(getattr(spr, "image_id", None))
+        if is_egg:
+            base_img = self.assets.get("egg") or base_img
+        if base_img is None:
+            return None
+
+        # Size selection (cards are elsewhere; here we render full-size fish w/ juvenile scaling)
+        screen_w = base_w
+        screen_h = base_h
+        if is_juvenile:
+            juvenile_scale = float((getattr(self.context, "aging", {}) or {}).get("juvenile_scale", 0.5))
+            screen_w = max(1, int(round(base_w * juvenile_scale)))
+            screen_h = max(1, int(round(base_h * juvenile_scale)))
+
+        # Variant flags
+        variant = "normal"
+        senior_style = None
+        if (not is_dead) and is_senior:
+            variant = "senior"
+            senior_style = self._senior_style_cfg()
+        return base_img, base_w, base_h, screen_w, screen_h, is_dead, variant, senior_style
+
+    def _prewarm_jobs(self, world, scale: float) -> list:
+        """
+        Variants the next frames will ask for at `scale`: every one in use by
+        the live population (most used first, both facings), then each
+        species.json sprite as a normal adult and juvenile.
+        """
+        counts = {}
+        for e, spr in world.query(Sprite):
+            if world.get_component(e, TankRef) is None:
+                continue
+            v = self._variant(spr, world.get_component(e, Age), world.get_component(e, Brain), scale)
+            if v is None:
+                continue
+            base_img, _, _, w, h, dead, variant, style = v
+            for hflip in ((False,) if dead else (False, True)):
+                key = (id(base_img), w, h, dead, hflip, variant)
+                if key not in counts:
+                    counts[key] = [0, (base_img, w, h, dead, hflip, variant, style)]
+                counts[key][0] += 1
+        jobs = [job for _, job in sorted(counts.values(), key=lambda c: -c[0])]
+        juvenile_scale = float((getattr(self.context, "aging", {}) or {}).get("juvenile_scale", 0.5))
+        for sdata in (getattr(self.context, "species_config", {}) or {}).values():
+            img = self.assets.get(sdata.get("sprite"))
+            if img is None:
+                continue
+            w = int(round(int(sdata.get("width", 0)) * scale))
+            h = int(round(int(sdata.get("height", 0)) * scale))
+            if w <= 0 or h <= 0:
+                continue
+            for sw, sh in ((w, h), (max(1, int(round(w * juvenile_scale))), max(1, int(round(h * juvenile_scale))))):
+                for hflip in (False, True):
+                    jobs.append((img, sw, sh, False, hflip, "normal", None))
+        return jobs
+
+    def _pack(self, keys) -> None:
+        """Pack the finished variants among `keys` (placeholders have none yet)."""
+        peek = self.sprite_cache.peek
+        self.atlas.pack([(k, surf) for k in keys for surf in (peek(k),) if surf is not None])
+
+    def _rebuild_atlas(self, jobs: list, build: bool) -> None:
+        """Scale change: start the atlas over from the job list (building the variants if `build`)."""
+        cache = self.sprite_cache
+        keys = []
+        for img, w, h, dead, hflip, variant, style in jobs:
+            if build:
+                cache.get(img, w, h, dead=dead, hflip=hflip, variant=variant, senior_style=style)
+            keys.append(cache.key(img, w, h, dead=dead, hflip=hflip, variant=variant, senior_style=style))
+        self.atlas.clear()
+        self._atlas_compacted = False
+        self._pack(keys)
+        self._atlas_want = [k for k in keys if k not in self.atlas] if cache.prewarming else []
+
     def update(self, world, dt) -> None:
-        # Invalidate cache when tank scale changes
+        # Scale change: rebuild the variants in use on a worker thread
+        # (placeholders meanwhile), or right away without pre-warm; the atlas
+        # starts over from the same job list
+        cache = self.sprite_cache
+        atlas = self.atlas
         scale = float(getattr(self.context, "tank_scale", 1.0))
         if self._last_scale != scale:
-            self.sprite_cache.clear()
+            jobs = self._prewarm_jobs(world, scale) if (self._prewarm or atlas is not None) else []
+            background = self._last_scale is not None and self._prewarm
+            if background:
+                cache.rescale(jobs)
+            else:
+                cache.clear()
+            if atlas is not None:
+                self._rebuild_atlas(jobs, build=not background)
             self._last_scale = scale
+        if cache.apply_prewarmed() and self._atlas_want:
+            self._pack(self._atlas_want)
+            self._atlas_want = [k for k in self._atlas_want if k not in atlas] if cache.prewarming else []
 
         # Rebuild hit rects every frame
-        self.context.fish_screen_rects = []  # list[(entity_id, pygame.Rect)]
+        rects = self.context.fish_screen_rects = []  # list[(entity_id, (x, y, w, h))]
+        draws = []
+        used = set()     # variant keys drawn from the atlas
+        missing = set()  # variant keys drawn from their own surface
 
-        for e in world.entities_with(Position, Sprite):
-            pos: Position = world.get_component(e, Position)
-            spr: Sprite = world.get_component(e, Sprite)
+        for e, pos, spr in world.query(Position, Sprite):
             vel: Optional[Velocity] = world.get_component(e, Velocity)
             brain: Optional[Brain] = world.get_component(e, Brain)
             age: Optional[Age] = world.get_component(e, Age)
@@ -73,55 +194,54 @@ class SpriteRenderSystem:
             face_right, need_hflip = choose_facing(spr, vel, target, pos, last_face)
             self._last_facing[e] = face_right
 
+            v = self._variant(spr, age, brain, scale)
+            if v is None:
+                continue
+            base_img, base_w, base_h, screen_w, screen_h, is_dead, variant, senior_style = v
+
             # World → screen
-            base_w = int(round(spr.base_w * scale))
-            base_h = int(round(spr.base_h * scale))
             draw_x = int(round(tank_pos.x + pos.x * scale))
             draw_y = int(round(tank_pos.y + pos.y * scale))
 
-            # Stage/variant
-            stage = getattr(age, "stage", "Adult") if age else "Adult"
-            is_dead = (getattr(brain, "state", "") == "Dead")
-            is_senior = bool(age and stage == "Senior")
-            is_juvenile = bool(age and stage == "Juvenile")
-            is_egg = bool(age and stage == "Egg")
-
-            # Base asset
-            base_img = self.assets.get(getattr(spr, "image_id", None))
-            if is_egg:
-                base_img = self.assets.get("egg") or base_img
-            if base_img is None:
-                continue
-
-            # Size selection (cards are elsewhere; here we render full-size fish w/ juvenile scaling)
-            screen_w = base_w
-            screen_h = base_h
-            if is_juvenile:
-                juvenile_scale = float((getattr(self.context, "aging", {}) or {}).get("juvenile_scale", 0.5))
-                screen_w = max(1, int(round(base_w * juvenile_scale)))
-                screen_h = max(1, int(round(base_h * juvenile_scale)))
-
-            # Variant flags
-            variant = "normal"
-            senior_style = None
-            if (not is_dead) and is_senior:
-                variant = "senior"
-                senior_style = self._senior_style_cfg()
-
-            # Finals
-            surf = self.sprite_cache.get(
-                base_img,
-                screen_w, screen_h,
-                dead=is_dead,
-                hflip=(need_hflip and not is_dead),
-                variant=variant,
-                senior_style=senior_style,
-            )
-
             # Center scaled fish inside its base box so geometry is stable
             ix = int(round(draw_x + (base_w - screen_w) * 0.5))
             iy = int(round(draw_y + (base_h - screen_h) * 0.5))
-            self.screen.blit(surf, (ix, iy))
+
+            hflip = need_hflip and not is_dead
+            packed = None
+            if atlas is not None:
+                key = cache.key(base_img, screen_w, screen_h, dead=is_dead, hflip=hflip,
+                                variant=variant, senior_style=senior_style)
+                packed = atlas.get(key)
+                (missing if packed is None else used).add(key)
+            if packed is not None:
+                draws.append((packed[0], (ix, iy), packed[1]))
+            else:
+                # Finals (a nearest-neighbour placeholder while pre-warming)
+                surf = cache.get(
+                    base_img,
+                    screen_w, screen_h,
+                    dead=is_dead,
+                    hflip=hflip,
+                    variant=variant,
+                    senior_style=senior_style,
+                    placeholder=True,
+                )
+                draws.append((surf, (ix, iy)))
 
             # Publish clickable rect = drawn rect
-            self.context.fish_screen_rects.append((e, pygame.Rect(ix, iy, screen_w, screen_h)))
+            rects.append((e, (ix, iy, screen_w, screen_h)))
+
+        if draws:
+            self.screen.blits(draws, doreturn=False)
+
+        if atlas is not None:
+            # Atlas hits skip get(): keep those variants recent in the LRU
+            cache.touch(used)
+            if missing and not atlas.full:
+                self._pack(missing)
+            if atlas.full and not self._atlas_compacted:
+                # Out of room: start over once per scale with what this frame drew
+                self._atlas_compacted = True
+                atlas.clear()
+                self._pack(used | missing)
@@ -19,10 +19,7 @@ class TankRenderSystem:
         return self._font_cache[size]
 
     def update(self, world, dt):
-        for e in world.entities_with(Position, Bounds, TankStyle):
-            pos = world.get_component(e, Position)
-            bounds = world.get_component(e, Bounds)
-            style = world.get_component(e, TankStyle)
+        for e, pos, bounds, style in world.query(Position, Bounds, TankStyle):
 
             x, y = pos.x, pos.y
             w, h = bounds.width, bounds.height
@@ -57,4 +57,7 @@ class CursorSystem:
         if state == self._last_state:
             return
         self._last_state = state
-        self._apply_cursor()
+        try:
+            self._apply_cursor()
+        except pygame.error:
+            pass  # no cursor support (e.g. dummy video driver / offscreen rendering)
@@ -10,6 +10,7 @@ def ensure_defaults(ctx) -> None:
     _def(ctx, "show_food_menu", False)      # F3
     _def(ctx, "show_behavior_menu", False)  # F4
     _def(ctx, "show_swim_menu", False)      # F5
+    _def(ctx, "show_perf_menu", False)      # F7
 
     # Movement
     _def(ctx, "show_target_lines", False)
@@ -32,7 +33,7 @@ def ensure_defaults(ctx) -> None:
 def select_tab(ctx, tab: str) -> None:
     """
     Mutually-exclusive selection with toggle behavior.
-    Allowed tabs: "legend","motion","food","behavior","swim".
+    Allowed tabs: "legend","motion","food","behavior","swim","perf".
 
     Behavior:
       - Pressing a new tab clears all overlays + opens that tab's menu + turns on its overlays.
@@ -82,6 +83,11 @@ def select_tab(ctx, tab: str) -> None:
         ctx.show_swim_floor_debug = True
         return
 
+    if tab == "perf":
+        ctx.show_perf_menu = True
+        _set_profiling(ctx, True)  # timings only cost while the panel is open
+        return
+
 # Internals ---------------------------------------------------------------
 
 def _def(ctx, name, value):
@@ -94,6 +100,16 @@ def _clear_all_menus(ctx):
     ctx.show_food_menu = False
     ctx.show_behavior_menu = False
     ctx.show_swim_menu = False
+    if getattr(ctx, "show_perf_menu", False):
+        _set_profiling(ctx, False)
+    ctx.show_perf_menu = False
+
+def _set_profiling(ctx, on: bool) -> None:
+    prof = getattr(ctx, "profiler", None)
+    if prof is not None:
+        prof.enabled = on
+        if on:
+            prof.reset()
 
 def _clear_all_overlays(ctx):
     # Movement
@@ -117,4 +133,5 @@ def _is_tab_open(ctx, tab: str) -> bool:
     if tab == "food":     return bool(getattr(ctx, "show_food_menu", False))
     if tab == "behavior": return bool(getattr(ctx, "show_behavior_menu", False))
     if tab == "swim":     return bool(getattr(ctx, "show_swim_menu", False))
+    if tab == "perf":     return bool(getattr(ctx, "show_perf_menu", False))
     return False
@@ -1,6 +1,8 @@
 # ecs/systems/ui/debug/debug_menu.py
 import pygame
 
+from ecs.systems.renderers.cache import SurfaceLRU
+
 # ---------- Colors aligned with overlay drawers ----------
 # Motion overlay
 CLR_TARGET   = (255, 200, 0)   # target line
@@ -23,11 +25,12 @@ CLR_AGE_END   = (255, 140, 60)
 
 class DebugMenu:
     """
-    Small F-key debug panels (F1..F5). Text-only; overlays render elsewhere.
+    Small F-key debug panels (F1..F5, F7). Text-only; overlays render elsewhere.
 
     IMPORTANT: Supports BOTH selection models:
-      1) New: context.debug_panel_mode in {"legend","motion","food","behavior","swim", None}
-      2) Legacy: show_debug_menu/show_motion_menu/show_food_menu/show_behavior_menu/show_swim_menu
+      1) New: context.debug_panel_mode in {"legend","motion","food","behavior","swim","perf", None}
+      2) Legacy: show_debug_menu/show_motion_menu/show_food_menu/show_behavior_menu/show_swim_menu/
+         show_perf_menu
 
     If debug_panel_mode is present, it takes precedence.
     Otherwise, it derives the mode from legacy flags.
@@ -38,6 +41,7 @@ class DebugMenu:
     LINE_GAP = 6
     BG = (0, 0, 0, 160)
     TXT = (235, 240, 255)
+    PERF_ROWS = 10  # slowest systems shown per phase
 
     def __init__(self, screen, context):
         self.screen = screen
@@ -58,7 +62,7 @@ class DebugMenu:
     def _active_mode(self):
         # Preferred: unified mode string
         mode = getattr(self.context, "debug_panel_mode", None)
-        if mode in ("legend", "motion", "food", "behavior", "swim"):
+        if mode in ("legend", "motion", "food", "behavior", "swim", "perf"):
             return mode
 
         # Legacy flags fallback (first true wins; you can tweak priority if needed)
@@ -67,6 +71,7 @@ class DebugMenu:
         if bool(getattr(self.context, "show_food_menu", False)):      return "food"
         if bool(getattr(self.context, "show_behavior_menu", False)):  return "behavior"
         if bool(getattr(self.context, "show_swim_menu", False)):      return "swim"
+        if bool(getattr(self.context, "show_perf_menu", False)):      return "perf"
         return None
 
     # ---- content builders ----
@@ -104,6 +109,7 @@ class DebugMenu:
                 t("F4    – Behavior labels & bars"),
                 t("F5    – Toggle swim-area overlay"),
                 t("F6    – Breeding (Not Implemented)"),
+                t("F7    – Frame profiler (per-system timings, render caches)"),
             ]
         elif mode == "motion":
             items += [
@@ -132,8 +138,53 @@ class DebugMenu:
                 title("F5 - SWIM AREA OVERLAY"),
                 t("Visualizes fall floor vs swim bottom; see tank for colors."),
             ]
+        elif mode == "perf":
+            items += [title("F7 - FRAME PROFILER")] + [t(row) for row in self._perf_rows()]
         return items
 
+    def _perf_rows(self):
+        prof = getattr(self.context, "profiler", None)
+        if prof is None:
+            return ["No profiler on context."]
+        rows = [f"{'system':<24}{'mean':>7}{'p95':>7}{'max':>7}{'min':>7}{'calls':>8}{'ents':>7}  (ms)"]
+        for phase in ("update", "render"):
+            sums = prof.summaries(phase)
+            if not sums:
+                continue
+            rows.append(f"-- {phase}: {sum(s.frame_ms for s in sums):.2f} ms/frame mean (rate-weighted)")
+            for s in sums[:self.PERF_ROWS]:
+                rows.append(
+                    f"{s.name[:23]:<24}{s.mean_ms:>7.2f}{s.p95_ms:>7.2f}{s.max_ms:>7.2f}"
+                    f"{s.min_ms:>7.2f}{s.calls:>8}{s.entities:>7.0f}"
+                )
+        if len(rows) == 1:
+            rows.append("Collecting samples...")
+        dropped = float(getattr(self.context, "sim_time_dropped", 0.0))
+        if dropped > 0.0:
+            rows.append(f"sim time dropped (substep cap): {dropped:.2f} s")
+        scale = float(getattr(self.context, "time_scale", 1.0))
+        if scale != 1.0:
+            rows.append(f"time scale {scale:g}x, {getattr(self.context, 'sim_substeps', 1)} updates/step"
+                        + (" (fast-forward)" if getattr(self.context, "fast_forwarding", False) else ""))
+        caught_up = float(getattr(self.context, "sim_time_caught_up", 0.0))
+        if caught_up > 0.0:
+            rows.append(f"metabolism caught up in closed form: {caught_up:.1f} s")
+        return rows + self._cache_rows()
+
+    def _cache_rows(self):
+        caches = SurfaceLRU.instances()
+        if not caches:
+            return []
+        rows = [f"-- render caches  {'ents':>6}{'MB':>8}{'/ MB':>7}{'hit%':>7}{'miss':>8}{'evict':>7}"]
+        for c in caches:
+            s = c.stats()
+            budget = f"{s['max_bytes'] / 1048576:.0f}" if s["max_bytes"] else "-"
+            rows.append(
+                f"{s['name'][:17]:<17}{s['entries']:>6}{s['bytes'] / 1048576:>8.2f}{budget:>7}"
+                f"{s['hit_rate'] * 100:>7.1f}{s['misses']:>8}{s['evictions']:>7}"
+            )
+        return rows
+
     # ---- render ----
     def _render_items(self, items):
         if not items:
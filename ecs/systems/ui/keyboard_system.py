@@ -8,12 +8,14 @@ class KeyboardSystem:
     """
     Dispatcher-only:
       SPACE  -> pause/unpause
+      , / .  -> slower / faster time_scale preset (fast-forward from 5x)
       L      -> begin label edit (if provided)
       F1     -> dbg.select_tab(ctx, "legend")
       F2     -> dbg.select_tab(ctx, "motion")
       F3     -> dbg.select_tab(ctx, "food")      # keeps target ON while active
       F4     -> dbg.select_tab(ctx, "behavior")
       F5     -> dbg.select_tab(ctx, "swim")
+      F7     -> dbg.select_tab(ctx, "perf")      # per-system frame profiler
     """
     def __init__(self, context):
         self.context = context
@@ -36,6 +38,11 @@ class KeyboardSystem:
                    not bool(getattr(self.context, "paused", False)))
             return
 
+        if k in (pygame.K_COMMA, pygame.K_PERIOD):
+            step = getattr(self.context, "step_time_scale", None)
+            if callable(step): step(1 if k == pygame.K_PERIOD else -1)
+            return
+
         if k == pygame.K_l:
             begin = getattr(self.context, "begin_label_edit", None)
             if callable(begin): begin()
@@ -48,5 +55,6 @@ class KeyboardSystem:
         elif k == pygame.K_F3: dbg.select_tab(self.context, "food");     return
         elif k == pygame.K_F4: dbg.select_tab(self.context, "behavior"); return
         elif k == pygame.K_F5: dbg.select_tab(self.context, "swim");     return
+        elif k == pygame.K_F7: dbg.select_tab(self.context, "perf");     return
 
     def update(self, world, dt): return
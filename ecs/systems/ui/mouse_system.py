@@ -3,9 +3,14 @@ from __future__ import annotations
 from typing import Optional, Iterable, Tuple
 import pygame
 
+from utils.spatial import LAYER_EGGS, LAYER_FISH
+
 LMB = 1
 RMB = 3
 
+# Logical px: more than a fish moves in one sim step (prefilter only; rects decide)
+_INTERP_SLACK = 8.0
+
 class MouseSystem:
     """
     Mouse-up driven + Panels:
@@ -59,12 +64,30 @@ class MouseSystem:
             if hasattr(self.context, flag): setattr(self.context, flag, False)
 
     def _hit_test_fish(self, mx: int, my: int) -> Optional[int]:
-        rects: Iterable[Tuple[int, pygame.Rect]] = getattr(self.context, "fish_screen_rects", []) or []
-        for eid, rect in reversed(list(rects)):
-            if rect.collidepoint(mx, my):
+        rects: Iterable[Tuple[int, Tuple[int, int, int, int]]] = getattr(self.context, "fish_screen_rects", []) or []
+        near = self._fish_near_point(mx, my)
+        if near is not None and not near:
+            return None  # grid says nothing is under the cursor
+        for eid, (x, y, w, h) in reversed(list(rects)):
+            if (near is None or eid in near) and x <= mx < x + w and y <= my < y + h:
                 return eid
         return None
 
+    def _fish_near_point(self, mx: int, my: int) -> Optional[set]:
+        """Fish/eggs whose logical sprite box covers the click (None → no grid)."""
+        spatial = getattr(self._world, "spatial", None)
+        if spatial is None:
+            return None
+        scale = float(getattr(self.context, "tank_scale", 1.0)) or 1.0
+        lx = (mx - float(getattr(self.context, "tank_screen_x", 0))) / scale
+        ly = (my - float(getattr(self.context, "tank_screen_y", 0))) / scale
+        # Drawn rects are rounded to whole screen pixels and, with render
+        # interpolation, trail the simulated position by up to one step
+        pad = 2.0 / scale + _INTERP_SLACK
+        near = set(spatial[LAYER_FISH].query_point(lx, ly, pad))
+        near.update(spatial[LAYER_EGGS].query_point(lx, ly, pad))
+        return near
+
     # events
     def handle_mouse_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.MOUSEBUTTONUP:
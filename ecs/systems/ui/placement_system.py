@@ -1,6 +1,5 @@
 from __future__ import annotations
 from typing import List, Tuple, Optional
-import random
 
 from ecs.components.core.position_component import Position
 from ecs.components.core.sprite_component import Sprite
@@ -10,6 +9,7 @@ from ecs.components.tags.affected_by_gravity import AffectedByGravity
 from ecs.components.fish.age_component import Age
 from ecs.components.fish.brain_component import Brain
 from ecs.components.core.velocity_component import Velocity
+from utils.rng import SPAWNING
 
 class PlacementSystem:
     """
@@ -23,7 +23,8 @@ class PlacementSystem:
     frame (after UI handling).
 
     Also exposes `spawn_egg_at(world, x_logical, y_logical, species_id=None)` so
-    gameplay systems (breeding) can spawn “the same egg” as the EGG tool.
+    gameplay systems (breeding) can spawn “the same egg” as the EGG tool, and
+    `spawn_pellet_at(world, x_logical, y_logical)` for scripted feeding.
     """
 
     def __init__(self, context):
@@ -37,6 +38,11 @@ class PlacementSystem:
     def enqueue_click(self, x: int, y: int) -> None:
         self._pending_clicks.append((int(x), int(y)))
 
+    @property
+    def has_pending(self) -> bool:
+        """Clicks waiting for the next update (TankScene's run_if)."""
+        return bool(self._pending_clicks)
+
     # -------------------- helpers --------------------
     def _point_in_tank_screen(self, x: int, y: int) -> bool:
         sx = int(getattr(self.context, "tank_screen_x", 0))
@@ -56,6 +62,17 @@ class PlacementSystem:
         if not (sx <= x <= sx + sw and sy <= y <= sy + sh):
             return
 
+        self.spawn_pellet_at(world, (x - sx) / scale, (y - sy) / scale)
+
+    # -------------------- SPAWN PELLET (programmatic) --------------------
+    def spawn_pellet_at(self, world, x_logical: float, y_logical: float) -> Optional[int]:
+        """
+        Programmatic logical pellet spawn (FEED tool path without the screen
+        transform); used by the headless runner. Returns the pellet entity.
+        """
+        if self._tank_entity is None:
+            return None
+
         cfg = self.context.pellets or {}
         image_id = cfg.get("sprite", "pellet")
         w = int(cfg.get("width", 16))
@@ -66,12 +83,9 @@ class PlacementSystem:
         off_y = float(cfg.get("center_offset_y", 0.0))
         fall_speed = float(cfg.get("fall_speed", 60.0))
 
-        logical_x = (x - sx) / scale
-        logical_y = (y - sy) / scale
-
         e = world.create_entity()
         world.add_component(e, TankRef(self._tank_entity))
-        world.add_component(e, Position(logical_x, logical_y))
+        world.add_component(e, Position(float(x_logical), float(y_logical)))
         world.add_component(e, Sprite(image_id=image_id, base_w=w, base_h=h))
         world.add_component(e, FoodPellet(nutrition=nutrition, radius_scale=radius_scale,
                                           center_off_x=off_x, center_off_y=off_y))
@@ -80,6 +94,7 @@ class PlacementSystem:
         audio = getattr(self.context, "audio", None)
         if audio:
             audio.play("pellet_drop")
+        return e
 
     # -------------------- SPAWN EGG (click) --------------------
     def _spawn_egg(self, world, click_x: int, click_y: int) -> None:
@@ -120,7 +135,7 @@ class PlacementSystem:
         if not species_map:
             return
         if species_id is None:
-            species_id = random.choice(list(species_map.keys()))
+            species_id = self.context.rng.stream(SPAWNING).choice(list(species_map.keys()))
         sdata = species_map.get(species_id)
         if not sdata:
             return
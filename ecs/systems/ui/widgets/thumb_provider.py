@@ -6,7 +6,7 @@ from ecs.components.core.sprite_component import Sprite
 from ecs.components.fish.age_component import Age
 from ecs.components.fish.brain_component import Brain
 from ecs.components.fish.health_component import Health
-from ecs.systems.renderers.cache import SpriteCache
+from ecs.systems.renderers.cache import SpriteCache, SurfaceLRU
 
 
 class ThumbProvider:
@@ -23,7 +23,8 @@ class ThumbProvider:
         self.context = context
         self.cache = SpriteCache.shared()
         # (image_key, stage, dead/alive, box_px) -> Surface
-        self._local: Dict[Tuple[str, str, str, int], pygame.Surface] = {}
+        ui = getattr(context, "ui", {}) or {}
+        self._local = SurfaceLRU("thumbs", max_bytes=int(float(ui.get("thumb_cache_mb", 8)) * 1024 * 1024))
 
     def _senior_style_cfg(self) -> Dict[str, Any]:
         aging = getattr(self.context, "aging", {}) or {}
@@ -57,8 +58,9 @@ class ThumbProvider:
 
         key_img = spr.image_id if not is_egg else "egg"
         key = (key_img, stage, "dead" if is_dead else "alive", int(box_px))
-        if key in self._local:
-            return self._local[key]
+        cached = self._local.get(key)
+        if cached is not None:
+            return cached
 
         # ---- Egg: use egg sprite directly ----
         if is_egg:
@@ -73,7 +75,7 @@ class ThumbProvider:
                 variant="normal", senior_style=None
             )
             if surf is not None:
-                self._local[key] = surf
+                self._local.put(key, surf)
             return surf
 
         # ---- Non-egg: base species sprite ----
@@ -102,5 +104,5 @@ class ThumbProvider:
             senior_style=style
         )
         if surf is not None:
-            self._local[key] = surf
+            self._local.put(key, surf)
         return surf
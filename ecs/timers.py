@@ -0,0 +1,208 @@
+# ecs/timers.py
+"""
+Hierarchical timer wheel for timed entity events.
+
+Systems schedule "call fn at sim time T (for entity E)" instead of polling a
+deadline for every entity every tick:
+
+    handle = world.timers.schedule(world.time + 8.0, hatch, egg_entity)
+    world.timers.cancel(handle)            # or cancel_entity(egg_entity)
+
+Time is quantized to `resolution` seconds (a wheel tick); a timer fires on
+the first advance() whose time reaches its deadline, never early. Timers due
+on the same tick fire in (deadline, schedule order) order, so runs are
+deterministic.
+
+Layout: level 0 has 256 one-tick slots, each level above 64 slots covering a
+whole lower level (256, 256*64, ... ticks). Scheduling is O(1); far timers
+cascade down a level when their slot comes up. Deadlines beyond the top
+level wait in an overflow list. Stretches with no timers in the lower levels
+are skipped in one jump, so a long advance (catch-up) stays cheap.
+"""
+from __future__ import annotations
+
+from math import ceil
+from typing import Any, Callable, Dict, List, Optional, Set
+
+__all__ = ["TimerWheel"]
+
+_L0_BITS = 8
+_LN_BITS = 6
+_LEVELS = 4
+_L0_SIZE = 1 << _L0_BITS
+_LN_SIZE = 1 << _LN_BITS
+# Ticks covered by one slot of each level, and by a whole level
+_SLOT_SPAN = [1 << (_L0_BITS + _LN_BITS * (lv - 1)) if lv else 1 for lv in range(_LEVELS)]
+_LEVEL_SPAN = [_SLOT_SPAN[lv] * (_L0_SIZE if lv == 0 else _LN_SIZE) for lv in range(_LEVELS)]
+
+
+class _Timer:
+    __slots__ = ("id", "tick", "at", "fn", "entity", "args", "live")
+
+    def __init__(self, tid: int, tick: int, at: float, fn: Callable[..., Any],
+                 entity: Optional[int], args: tuple) -> None:
+        self.id = tid
+        self.tick = tick
+        self.at = at
+        self.fn = fn
+        self.entity = entity
+        self.args = args
+        self.live = True
+
+
+class TimerWheel:
+    def __init__(self, resolution: float = 1.0 / 120.0) -> None:
+        if resolution <= 0:
+            raise ValueError("resolution must be > 0")
+        self.resolution = float(resolution)
+        self._tick = 0  # last processed wheel tick
+        self._slots: List[List[List[_Timer]]] = [
+            [[] for _ in range(_L0_SIZE if lv == 0 else _LN_SIZE)] for lv in range(_LEVELS)
+        ]
+        self._counts = [0] * _LEVELS
+        self._overflow: List[_Timer] = []
+        self._ready: List[_Timer] = []  # scheduled at/behind the current tick
+        self._live: Dict[int, _Timer] = {}
+        self._by_entity: Dict[int, Set[int]] = {}
+        self._next_id = 1
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def __contains__(self, handle: object) -> bool:
+        """True while the timer behind `handle` is still pending."""
+        return handle in self._live
+
+    @property
+    def now(self) -> float:
+        """Time of the last processed tick."""
+        return self._tick * self.resolution
+
+    # ---- scheduling ----------------------------------------------------------
+    def schedule(self, at: float, fn: Callable[..., Any], entity: Optional[int] = None,
+                 *args: Any) -> int:
+        """
+        Call `fn(entity, *args)` (or `fn(*args)` without an entity) once sim
+        time reaches `at`. Returns a handle for cancel().
+        """
+        tid = self._next_id
+        self._next_id += 1
+        tick = max(0, int(ceil(at / self.resolution - 1e-9)))
+        timer = _Timer(tid, tick, float(at), fn, entity, args)
+        self._live[tid] = timer
+        if entity is not None:
+            self._by_entity.setdefault(entity, set()).add(tid)
+        self._place(timer)
+        return tid
+
+    def cancel(self, handle: Optional[int]) -> bool:
+        """Cancel one timer; False if it already fired or was cancelled."""
+        timer = self._live.pop(handle, None) if handle is not None else None
+        if timer is None:
+            return False
+        timer.live = False
+        if timer.entity is not None:
+            ids = self._by_entity.get(timer.entity)
+            if ids is not None:
+                ids.discard(timer.id)
+                if not ids:
+                    del self._by_entity[timer.entity]
+        return True
+
+    def cancel_entity(self, entity: int) -> int:
+        """Cancel every pending timer for `entity`; returns how many."""
+        ids = self._by_entity.pop(entity, None)
+        if not ids:
+            return 0
+        for tid in ids:
+            timer = self._live.pop(tid, None)
+            if timer is not None:
+                timer.live = False
+        return len(ids)
+
+    def pending(self, entity: int) -> int:
+        return len(self._by_entity.get(entity, ()))
+
+    # ---- advancing -------------------------------------------------------------
+    def advance(self, now: float) -> int:
+        """Fire every timer due by sim time `now`; returns how many fired."""
+        target = int(now / self.resolution + 1e-9)
+        fired = self._fire(self._ready) if self._ready else 0
+        while self._tick < target:
+            if not self._live:
+                self._tick = target
+                break
+            # Jump over ticks where nothing can come due
+            span = 1
+            for lv in range(_LEVELS):
+                if self._counts[lv]:
+                    break
+                span = _LEVEL_SPAN[lv]
+            if span > 1:
+                boundary = (self._tick // span + 1) * span
+                if boundary - 1 > self._tick:
+                    self._tick = min(target, boundary - 1)
+                    continue
+            self._tick += 1
+            self._cascade()
+            slot = self._slots[0][self._tick & (_L0_SIZE - 1)]
+            if slot:
+                self._counts[0] -= len(slot)
+                due, slot[:] = slot[:], []
+                fired += self._fire(due)
+            if self._ready:
+                fired += self._fire(self._ready)
+        return fired
+
+    # ---- internals -----------------------------------------------------------------
+    def _place(self, timer: _Timer) -> None:
+        delta = timer.tick - self._tick
+        if delta <= 0:
+            self._ready.append(timer)
+            return
+        for lv in range(_LEVELS):
+            if delta < _LEVEL_SPAN[lv] or (lv and timer.tick // _SLOT_SPAN[lv] - self._tick // _SLOT_SPAN[lv] < _LN_SIZE):
+                if lv == 0:
+                    idx = timer.tick & (_L0_SIZE - 1)
+                else:
+                    idx = (timer.tick // _SLOT_SPAN[lv]) & (_LN_SIZE - 1)
+                self._slots[lv][idx].append(timer)
+                self._counts[lv] += 1
+                return
+        self._overflow.append(timer)
+
+    def _cascade(self) -> None:
+        """On level boundaries, re-place the timers of the slot that just came up."""
+        tick = self._tick
+        for lv in range(1, _LEVELS):
+            if tick % _SLOT_SPAN[lv]:
+                return
+            idx = (tick // _SLOT_SPAN[lv]) & (_LN_SIZE - 1)
+            slot = self._slots[lv][idx]
+            if slot:
+                self._counts[lv] -= len(slot)
+                moved, slot[:] = slot[:], []
+                for timer in moved:
+                    if timer.live:
+                        self._place(timer)
+        if tick % _LEVEL_SPAN[_LEVELS - 1] == 0 and self._overflow:
+            waiting, self._overflow = self._overflow, []
+            for timer in waiting:
+                if timer.live:
+                    self._place(timer)
+
+    def _fire(self, due: List[_Timer]) -> int:
+        if due is self._ready:
+            due, self._ready = self._ready, []
+        due.sort(key=lambda t: (t.at, t.id))
+        fired = 0
+        for timer in due:
+            if not timer.live:
+                continue
+            self.cancel(timer.id)  # drop bookkeeping before the callback may reschedule
+            if timer.entity is None:
+                timer.fn(*timer.args)
+            else:
+                timer.fn(timer.entity, *timer.args)
+            fired += 1
+        return fired
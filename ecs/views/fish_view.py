@@ -10,6 +10,7 @@ from ecs.components.fish.behavior_tuning import BehaviorTuning
 from ecs.components.fish.target_intent_component import TargetIntent
 from ecs.components.fish.steering_intent_component import SteeringIntent
 from ecs.components.fish.speed_intent_component import SpeedIntent
+from ecs.components.fish.food_perception_component import FoodPerception
 @dataclass
 class FishView:
     brain: Brain
@@ -21,4 +22,5 @@ class FishView:
     tuning: BehaviorTuning
     target: TargetIntent
     steering: SteeringIntent
-    speed: SpeedIntent
\ No newline at end of file
+    speed: SpeedIntent
+    perception: Optional[FoodPerception] = None
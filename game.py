@@ -1,6 +1,9 @@
 # =========================
 # file: game.py
 # =========================
+import math
+import time
+
 import pygame
 import const
 from game_context import GameContext
@@ -8,8 +11,18 @@ from scene_manager import SceneManager
 from scenes.tank_scene import TankScene
 from config import load_config
 from render.audio_manager import AudioManager
+from utils.rng import AUDIO
 
 class Game:
+    # Largest dt per update (time_scale substepping) and, while substepping,
+    # the wall-clock share of a frame the sim may use before the backlog goes
+    # to catch-up instead
+    max_step_dt = const.MAX_STEP_DT
+    frame_budget = 1.0 / const.FPS
+    # Updates (and their dt) left of a step the frame budget interrupted
+    _carry_updates = 0
+    _carry_dt = 0.0
+
     def __init__(self):
         pygame.init()
         pygame.display.set_caption("Fish SIM")
@@ -26,8 +39,10 @@ class Game:
         self.clock = pygame.time.Clock()
 
         self.context = GameContext()
+        if self.settings.get("rng_seed") is not None:
+            self.context.rng.reseed(self.settings["rng_seed"])
         self.context.assets.load_folder("assets/sprites")
-        self.context.audio = AudioManager(self.settings)
+        self.context.audio = AudioManager(self.settings, rng=self.context.rng.stream(AUDIO))
 
         # Scene
         initial_scene = TankScene(self.context, self.screen)
@@ -39,8 +54,76 @@ class Game:
         self.context.new_screen_h = sh
         self.context.needs_resize = True
 
-        self.dt = 1.0 / const.FPS
+        # Fixed sim step (settings "sim_hz"); rendering still runs at const.FPS
+        self.dt = 1.0 / max(1.0, float(self.settings.get("sim_hz", const.SIM_HZ)))
         self.accumulator = 0.0
+        self.max_substeps = const.MAX_SUBSTEPS
+        self._last_render = 0.0
+
+    def substeps(self, time_scale: float) -> int:
+        """Updates per fixed step so none exceeds max_step_dt (never below the base dt)."""
+        scaled = self.dt * time_scale
+        limit = max(self.dt, self.max_step_dt)
+        return max(1, math.ceil(scaled / limit - 1e-9))
+
+    def advance(self) -> int:
+        """
+        Drain the accumulator in fixed `dt` steps, at most `max_substeps` per
+        frame, and publish the leftover fraction as context.render_alpha.
+        Each step covers dt * time_scale of sim time, split into `substeps()`
+        equal updates; the scene snapshots its render interpolation once per
+        step (begin_step) before them. Returns the number of steps started.
+
+        While substepping, stepping also stops once the frame budget is spent,
+        checked after every update: the rest of an interrupted step is carried
+        over and finished first next frame. Backlog beyond the cap is dropped;
+        in fast-forward its hunger/health/aging is caught up in closed form
+        (scene.fast_forward) instead, so skipping ahead still ages the tank at
+        the requested speed.
+        """
+        ctx = self.context
+        scale = ctx.time_scale
+        sub = self.substeps(scale)
+        sub_dt = self.dt * scale / sub
+        ctx.sim_substeps = sub
+        deadline = time.perf_counter() + self.frame_budget if sub > 1 or self._carry_updates else None
+        steps = 0
+        out_of_time = False
+        while not out_of_time:
+            if not self._carry_updates:
+                if self.accumulator < self.dt or steps >= self.max_substeps:
+                    break
+                self.accumulator -= self.dt
+                self._carry_updates, self._carry_dt = sub, sub_dt
+                self.scene_manager.begin_step()
+                steps += 1
+            while self._carry_updates:
+                self.scene_manager.update(self._carry_dt)
+                self._carry_updates -= 1
+                if deadline is not None and time.perf_counter() >= deadline:
+                    out_of_time = True
+                    break
+        if self.accumulator >= self.dt:
+            # Too far behind (slow frame, resize, feeding burst): drop whole
+            # steps rather than run ever more of them next frame
+            backlog = self.accumulator - self.accumulator % self.dt
+            self.accumulator -= backlog
+            catch_up = getattr(getattr(self.scene_manager, "current_scene", None), "fast_forward", None)
+            if getattr(ctx, "fast_forwarding", False) and callable(catch_up):
+                catch_up(backlog * scale)
+                ctx.sim_time_caught_up += backlog * scale
+            else:
+                ctx.sim_time_dropped += backlog
+        ctx.render_alpha = self.accumulator / self.dt
+        return steps
+
+    def _render_due(self) -> bool:
+        """Every frame normally; FAST_FORWARD_RENDER_HZ while fast-forwarding."""
+        now = time.perf_counter()
+        if self.context.fast_forwarding and now - self._last_render < 1.0 / const.FAST_FORWARD_RENDER_HZ:
+            return False
+        self._last_render = now
+        return True
 
     def run(self):
         while self.context.running:
@@ -69,13 +152,12 @@ class Game:
                 # Route once to the active scene
                 self.scene_manager.handle_event(event)
 
-            while self.accumulator >= self.dt:
-                self.scene_manager.update(self.dt * self.context.time_scale)
-                self.accumulator -= self.dt
-
-            self.screen.fill(const.BG_COLOR)
+            self.context.fast_forwarding = self.context.time_scale >= const.FAST_FORWARD_SCALE
+            self.advance()
 
-            self.scene_manager.render(self.screen)
-            pygame.display.flip()
+            if self._render_due():
+                self.screen.fill(const.BG_COLOR)
+                self.scene_manager.render(self.screen)
+                pygame.display.flip()
 
         pygame.quit()
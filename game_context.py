@@ -3,6 +3,8 @@
 # =========================
 import const
 from render.asset_manager import AssetManager
+from ecs.profiler import FrameProfiler
+from utils.rng import RngService
 from utils.jsonio import load_json
 import os
 
@@ -16,7 +18,14 @@ _BALANCING_DEFAULTS = {
     "state_speed_smoothing": 0.10,
     "idle_arrival_threshold": 6.0,
     "idle_bob_x_factor": 1.0,
-    "idle_bob_y_factor": 0.8
+    "idle_bob_y_factor": 0.8,
+    "physics_engine": "scalar",
+    "render_interpolation": True,
+    "metabolism_hz": 5.0,
+    "population_guard_hz": 4.0,
+    "ai_decision_budget": 64,
+    "ai_max_cohorts": 8,
+    "system_workers": 0
 }
 _PELLET_DEFAULTS = {
     "sprite": "pellet",
@@ -28,6 +37,12 @@ _PELLET_DEFAULTS = {
 }
 _UI_DEFAULTS = {
     "render_cache_limit": 256,
+    "render_cache_mb": 64,
+    "label_cache_mb": 2,
+    "thumb_cache_mb": 8,
+    "sprite_prewarm": True,
+    "sprite_atlas": True,
+    "sprite_atlas_mb": 16,
     "ui_font_size": 14,
     "ui_bar_height": 4,
     "ui_bar_gap": 6,
@@ -97,6 +112,19 @@ class GameContext:
         self.show_debug_overlay     = False
         self.fps = 0.0
 
+        # Fixed-step loop bookkeeping (Game.run): leftover step fraction for
+        # render interpolation, simulated seconds dropped by the substep cap,
+        # updates per fixed step (time_scale substepping), fast-forward mode
+        # and the seconds of metabolism it caught up in closed form
+        self.render_alpha = 1.0
+        self.sim_time_dropped = 0.0
+        self.sim_substeps = 1
+        self.fast_forwarding = False
+        self.sim_time_caught_up = 0.0
+
+        # Per-system timings (off until the F7 panel or a tool enables it)
+        self.profiler = FrameProfiler(window=120, enabled=False)
+
         # Data/config
         self.fish_defaults  = load_json(os.path.join("data", "fish_defaults.json"))
         self.species_config = load_json(os.path.join("data", "species.json"), default={})
@@ -118,6 +146,8 @@ class GameContext:
         })
         self.population_ok = True           # set by PopulationGuard
         self.test_seed = None
+        # Seeded named RNG streams (movement / ai / spawning / audio); reseed to replay a run
+        self.rng = RngService()
         # Assets
         self.assets = AssetManager()
 
@@ -143,3 +173,17 @@ class GameContext:
         else:
             self.time_scale = self._prev_time_scale if self._prev_time_scale > 0 else 1.0
             self.paused = False
+
+    def step_time_scale(self, direction: int) -> float:
+        """Move to the next faster (+1) / slower (-1) const.TIME_SCALE_STEPS preset."""
+        steps = const.TIME_SCALE_STEPS
+        current = self._prev_time_scale if self.paused else self.time_scale
+        if direction > 0:
+            scale = next((s for s in steps if s > current + 1e-9), steps[-1])
+        else:
+            scale = next((s for s in reversed(steps) if s < current - 1e-9), steps[0])
+        if self.paused:
+            self._prev_time_scale = scale  # applied on unpause
+        else:
+            self.time_scale = scale
+        return scale
@@ -29,8 +29,10 @@ class AudioManager:
         audio.play("pellet_drop")
         audio.play("ui_click", volume=0.4)
     """
-    def __init__(self, settings: dict):
+    def __init__(self, settings: dict, rng: Optional[random.Random] = None):
         self._settings = settings or {}
+        # clip picks draw from their own stream (GameContext.rng "audio")
+        self._rng = rng if rng is not None else random.Random()
         a = (self._settings.get("audio") or {})
         self.enabled       = bool(a.get("enabled", True))
         self.master_volume = float(a.get("master_volume", 0.8))
@@ -95,7 +97,7 @@ class AudioManager:
             # Silent fail is fine in games; keep logs minimal
             # print(f"⚠ Sound '{name}' not found or empty.")
             return
-        clip = random.choice(clips)
+        clip = self._rng.choice(clips)
         try:
             clip.set_volume(self._resolve_volume(name, volume))
             clip.play()
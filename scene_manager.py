@@ -10,6 +10,11 @@ class SceneManager:
     def handle_event(self, event):
         self.current_scene.handle_event(event)
 
+    def begin_step(self):
+        begin = getattr(self.current_scene, "begin_step", None)
+        if begin is not None:
+            begin()
+
     def update(self, dt):
         self.current_scene.update(dt)
 
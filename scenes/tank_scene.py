@@ -1,8 +1,8 @@
 # scenes/tank_scene.py
-import random
 import pygame
 from scenes.base_scene import BaseScene
 from world import World
+from ecs.columns import HAVE_NUMPY
 
 # Core/tank
 from ecs.components.core.position_component import Position
@@ -28,6 +28,7 @@ from ecs.components.fish.steering_intent_component import SteeringIntent
 from ecs.components.fish.speed_intent_component import SpeedIntent
 from ecs.components.fish.brain_component import Brain
 from ecs.components.fish.behavior_tuning import BehaviorTuning
+from ecs.components.tags.dead_component import DeadFlag
 
 # Input/UI
 from ecs.systems.ui.input_router import InputRouter
@@ -41,14 +42,17 @@ from ecs.systems.core.movement_system import MovementSystem
 from ecs.systems.core.collision_system import CollisionSystem
 from ecs.systems.core.avoidance_system import AvoidanceSystem
 from ecs.systems.physics.gravity_system import GravitySystem
+from ecs.systems.core.spatial_index_system import SpatialIndexSystem
 from ecs.systems.gameplay.hunger_system import HungerSystem
 from ecs.systems.gameplay.health_system import HealthSystem
 from ecs.systems.gameplay.aging_system import AgingSystem
+from ecs.systems.gameplay.metabolism import fast_forward_metabolism
 
 # Rendering
 from ecs.systems.rendering.tank_render_system import TankRenderSystem
 from ecs.systems.rendering.sprite_render_system import SpriteRenderSystem
 from ecs.systems.rendering.fish_overlay_system import FishOverlaySystem
+from ecs.systems.rendering.render_interpolation import RenderInterpolation
 from ecs.systems.ui.debug.debug_overlay_system import DebugOverlaySystem
 from ecs.systems.ui.debug.debug_menu import DebugMenu
 from ecs.systems.ui.ui_toolbar_system import UIToolbarSystem
@@ -57,15 +61,18 @@ from ecs.systems.ui.fish_window_system import FishWindowSystem
 from ecs.systems.ui.fish_inspector_system import FishInspectorSystem
 from ecs.systems.ui.widgets.panel_manager_system import PanelManagerSystem
 # AI
+from ecs.systems.ai.food_perception_system import FoodPerceptionSystem
 from ecs.systems.ai.behavior_system import BehaviorSystem
 from ecs.systems.ai.state_override_system import StateOverrideSystem
 from ecs.systems.ai.state_transition_system import StateTransitionSystem
 
 # Breeding
 from ecs.systems.gameplay.population_guard import PopulationGuard
+from ecs.schedule import components_changed, flag
 
 # Factories
 from ecs.factories.fish_factory import create_fish
+from utils.rng import SPAWNING
 
 
 class TankScene(BaseScene):
@@ -74,35 +81,59 @@ class TankScene(BaseScene):
       - Events → InputRouter → (KeyboardSystem / MouseSystem)
       - PlacementSystem spawns pellets/eggs each update
       - Breeding: PopulationGuard → Eligibility → MateSearch → Courtship
-      - AI: Behavior → Override → Transition (then movement/collision)
+      - AI: FoodPerception → Behavior → Override → Transition (then movement/collision)
+
+    headless=True builds only the simulation (world, update systems, AI
+    pipeline): no input or render systems, no screen, and the tank is laid
+    out at logical size. populate=False skips the default fish so a caller
+    (e.g. benchmarks/headless_sim.py) can stock the tank itself.
     """
-    def __init__(self, context, screen):
+    def __init__(self, context, screen=None, *, headless=False, populate=True):
         super().__init__()
         self.context = context
         self.screen = screen
-        self.world = World()
+        self.headless = bool(headless)
+        # "numpy" keeps the physics components in NumPy columns (batched movement)
+        engine = str(context.balancing.get("physics_engine", "scalar")).lower()
+        self.world = World(columns=(engine == "numpy" and HAVE_NUMPY),
+                           workers=int(context.balancing.get("system_workers", 0)))
+        # Dying cancels a fish's pending timed events (hatch, state deadlines)
+        self.world.cancel_timers_on(DeadFlag)
+        self.profiler = context.profiler
+        self.world.profiler = self.profiler
 
         # ---------- Input ----------
-        self.keyboard = KeyboardSystem(context)
-        self.mouse = MouseSystem(context, screen, context.assets)
         self.placement = PlacementSystem(context)
-        self.input_router = InputRouter(self.keyboard, self.mouse)
-        self.mouse.set_placement(self.placement)
+        if not self.headless:
+            self.keyboard = KeyboardSystem(context)
+            self.mouse = MouseSystem(context, screen, context.assets)
+            self.input_router = InputRouter(self.keyboard, self.mouse)
+            self.mouse.set_placement(self.placement)
         self.context.spawn_egg = self.placement.spawn_egg_at
 
-        # ---------- Systems (order matters) ----------
-        self.world.add_system(ResizeSystem(context), phase="update")
-
-        # Gameplay basics
-        self.world.add_system(HungerSystem(), phase="update")
-        self.world.add_system(HealthSystem(), phase="update")
-        self.world.add_system(AgingSystem(context), phase="update")
+        # ---------- Systems ----------
+        # Registration order is the tie-breaker; systems that declare READS /
+        # WRITES (ecs/schedule.py) run in dependency stages, undeclared ones
+        # (Resize, Placement) are barriers. world.describe_schedule() dumps it.
+        self.world.add_system(ResizeSystem(context), phase="update",
+                              run_if=flag(context, "needs_resize"))
+
+        # Gameplay basics: slow metabolism, run at a few Hz (staggered) with
+        # the elapsed time, not every tick
+        metabolism_hz = float(context.balancing.get("metabolism_hz", 5.0))
+        self.world.add_system(HungerSystem(), phase="update", rate=metabolism_hz)
+        self.world.add_system(HealthSystem(), phase="update", rate=metabolism_hz)
+        self.aging = AgingSystem(context)
+        self.world.add_system(self.aging, phase="update", rate=metabolism_hz)
 
         # Breeding loop
         self.population_guard = PopulationGuard(context)
-        self.world.add_system(self.population_guard, phase="update")
+        self.world.add_system(self.population_guard, phase="update",
+                              rate=float(context.balancing.get("population_guard_hz", 4.0)),
+                              run_if=components_changed(Brain, DeadFlag))
 
         # AI “sandwich” (Behavior is driven outside world.update to pass planned states)
+        self.perception = FoodPerceptionSystem(context)
         self.behavior = BehaviorSystem(context)
         self.override = StateOverrideSystem()
         self.transition = StateTransitionSystem(context, self.behavior)
@@ -114,29 +145,18 @@ class TankScene(BaseScene):
         self.world.add_system(GravitySystem(context), phase="update")
 
         # Spawners late
-        self.world.add_system(self.placement, phase="update")
+        self.world.add_system(self.placement, phase="update",
+                              run_if=flag(self.placement, "has_pending"))
 
-        # Rendering
-        self.tank_renderer = TankRenderSystem(screen, context.assets, context)
-        self.sprite_renderer = SpriteRenderSystem(screen, context.assets, context)
-        self.fish_overlay = FishOverlaySystem(screen, context.assets, context)
-        self.debug_overlay = DebugOverlaySystem(screen, context)
-        self.ui_toolbar = UIToolbarSystem(screen, context.assets, context)
-        self.cursor_system = CursorSystem(screen, context.assets, context)
-        self.fish_window = FishWindowSystem(screen, context.assets, context)
-        self.fish_inspector = FishInspectorSystem(screen, context.assets, context)
-        self.panel_manager = PanelManagerSystem(screen, context.assets, context)
+        # Proximity grid last: matches the positions the AI reads next tick
+        self.world.add_system(SpatialIndexSystem(context), phase="update")
 
-        self.world.add_system(self.tank_renderer, phase="render")
-        self.world.add_system(self.sprite_renderer, phase="render")
-        self.world.add_system(self.fish_overlay, phase="render")
-        self.world.add_system(self.debug_overlay, phase="render")
-        self.world.add_system(DebugMenu(screen, context), phase="render")
-        self.world.add_system(self.ui_toolbar, phase="render")
-        self.world.add_system(self.cursor_system, phase="render")
-        self.world.add_system(self.fish_window, phase="render")
-        self.world.add_system(self.fish_inspector, phase="render")
-        self.world.add_system(self.panel_manager, phase="render")
+        # Rendering
+        self.interpolation = None
+        if not self.headless:
+            self._add_render_systems(screen)
+            if context.balancing.get("render_interpolation", True):
+                self.interpolation = RenderInterpolation()
 
         # ---------- Tank ----------
         tank = self.world.create_entity()
@@ -146,24 +166,30 @@ class TankScene(BaseScene):
         self.world.add_component(tank, Bounds(1, 1))
         self.world.add_component(tank, TankStyle())
         self.world.add_component(tank, TankLabel(text="My Tank"))
-        self.keyboard.set_tank(tank)
-        self.mouse.set_tank(tank)
-        self.mouse.set_panel_manager(self.panel_manager)
-        self.mouse.set_world_ref(self.world)
         self.placement.set_tank(tank)
-        self.tank_entity = tank
-
-        # Spawn from config
-        for sid, data in (self.context.species_config or {}).items():
-            x = random.uniform(0, self.context.logical_tank_w)
-            y = random.uniform(0, self.context.logical_tank_h)
-            create_fish(self.world, self.context, tank, sid, data, x, y)
-
-        # EXTRA: adults for breeding + movement debug
-        self._spawn_debug_adults(tank)
-
-        # Initial resize once
-        if not self.context.needs_resize:
+        if not self.headless:
+            self.keyboard.set_tank(tank)
+            self.mouse.set_tank(tank)
+            self.mouse.set_panel_manager(self.panel_manager)
+            self.mouse.set_world_ref(self.world)
+
+        if populate:
+            # Spawn from config
+            rng = self.context.rng.stream(SPAWNING)
+            for sid, data in (self.context.species_config or {}).items():
+                x = rng.uniform(0, self.context.logical_tank_w)
+                y = rng.uniform(0, self.context.logical_tank_h)
+                create_fish(self.world, self.context, tank, sid, data, x, y)
+
+            # EXTRA: adults for breeding + movement debug
+            self._spawn_debug_adults(tank)
+
+        # Initial resize once (headless: lay the tank out 1:1 in logical units)
+        if self.headless:
+            self.context.new_screen_w = self.context.logical_tank_w
+            self.context.new_screen_h = self.context.logical_tank_h
+            self.context.needs_resize = True
+        elif not self.context.needs_resize:
             sw, sh = self.screen.get_size()
             self.context.new_screen_w = sw
             self.context.new_screen_h = sh
@@ -173,27 +199,65 @@ class TankScene(BaseScene):
 
     # ---------- Scene API ----------
     def handle_event(self, event):
+        if self.headless:
+            return
         self.input_router.handle_event(event)
         if event.type == pygame.VIDEORESIZE:
             self.context.new_screen_w = int(event.w)
             self.context.new_screen_h = int(event.h)
             self.context.needs_resize = True
 
+    def begin_step(self):
+        """Start of a fixed step (Game.advance, before its substeps): snapshot for interpolation."""
+        if self.interpolation is not None:
+            self.interpolation.snapshot(self.world)
+
     def update(self, dt):
         # Drive AI pipeline around world.update so intents are fresh
-        proposed = self.behavior.update(self.world, dt)
-        overridden = self.override.update(self.world, proposed)
-        self.transition.update(self.world, overridden, dt)
-
-        # Wire world ref for keyboard ops
-        self.keyboard.set_world_ref(self.world)
-        self.keyboard.update(self.world, dt)
-
-        self.mouse.update(self.world, dt)
+        prof = self.profiler
+        if prof is not None and prof.enabled:
+            w = self.world
+            prof.run("FoodPerceptionSystem", w, self.perception.update, w, dt)
+            proposed = prof.run("BehaviorSystem", w, self.behavior.update, w, dt)
+            overridden = prof.run("StateOverrideSystem", w, self.override.update, w, proposed)
+            prof.run("StateTransitionSystem", w, self.transition.update, w, overridden, dt)
+        else:
+            self.perception.update(self.world, dt)
+            proposed = self.behavior.update(self.world, dt)
+            overridden = self.override.update(self.world, proposed)
+            self.transition.update(self.world, overridden, dt)
+        # Sync point: apply pellets eaten / gravity added by the FSM
+        self.world.apply_commands()
+
+        if not self.headless:
+            # Wire world ref for keyboard ops
+            self.keyboard.set_world_ref(self.world)
+            self.keyboard.update(self.world, dt)
+
+            self.mouse.update(self.world, dt)
         self.world.update(dt)
 
+    def fast_forward(self, seconds):
+        """
+        Catch up `seconds` of hunger/health/aging in one closed-form step
+        (ecs/systems/gameplay/metabolism.py); motion and AI do not advance.
+        Returns the number of fish that died.
+        """
+        deaths = fast_forward_metabolism(self.world, self.context, seconds, self.aging)
+        self.world.apply_commands()
+        return deaths
+
     def render(self, screen):
-        self.world.render()
+        interp = self.interpolation
+        if interp is None:
+            self.world.render()
+            return
+        # Draw between the last two sim steps (context.render_alpha from Game.run)
+        interp.begin(self.world, getattr(self.context, "render_alpha", 1.0))
+        try:
+            self.world.render()
+        finally:
+            interp.end(self.world)
 
     def set_screen(self, new_screen):
         self.screen = new_screen
@@ -207,17 +271,43 @@ class TankScene(BaseScene):
         self.panel_manager.screen = new_screen
 
     # ---------- Helpers ----------
+    def _add_render_systems(self, screen):
+        context = self.context
+        self.tank_renderer = TankRenderSystem(screen, context.assets, context)
+        self.sprite_renderer = SpriteRenderSystem(screen, context.assets, context)
+        self.fish_overlay = FishOverlaySystem(screen, context.assets, context)
+        self.debug_overlay = DebugOverlaySystem(screen, context)
+        self.ui_toolbar = UIToolbarSystem(screen, context.assets, context)
+        self.cursor_system = CursorSystem(screen, context.assets, context)
+        self.fish_window = FishWindowSystem(screen, context.assets, context)
+        self.fish_inspector = FishInspectorSystem(screen, context.assets, context)
+        self.panel_manager = PanelManagerSystem(screen, context.assets, context)
+
+        self.world.add_system(self.tank_renderer, phase="render")
+        self.world.add_system(self.sprite_renderer, phase="render")
+        self.world.add_system(self.fish_overlay, phase="render",
+                              run_if=flag(context, *FishOverlaySystem.FLAGS))
+        self.world.add_system(self.debug_overlay, phase="render",
+                              run_if=flag(context, "show_swim_floor_debug"))
+        self.world.add_system(DebugMenu(screen, context), phase="render")
+        self.world.add_system(self.ui_toolbar, phase="render")
+        self.world.add_system(self.cursor_system, phase="render")
+        self.world.add_system(self.fish_window, phase="render")
+        self.world.add_system(self.fish_inspector, phase="render")
+        self.world.add_system(self.panel_manager, phase="render")
+
     def _spawn_debug_adults(self, tank):
         """Adult fish with full movement + AI + breeding toggle_on."""
         cfg = self.context.species_config.get("goldfish", {"sprite": "goldfish", "width": 60, "height": 40})
         W = float(self.context.logical_tank_w)
         H = float(self.context.logical_tank_h)
+        rng = self.context.rng.stream(SPAWNING)
 
         def rand_target():
             margin = 40
             return (
-                random.uniform(margin, max(margin, W - margin)),
-                random.uniform(margin, max(margin, H - margin)),
+                rng.uniform(margin, max(margin, W - margin)),
+                rng.uniform(margin, max(margin, H - margin)),
             )
 
         for i in range(6):
@@ -0,0 +1,64 @@
+# BehaviorSystem time slicing: cohorts decide in turn, with the elapsed time.
+from ecs.systems.ai.behavior_system import BehaviorSystem
+from ecs.fsm import FSM_STATES
+from ecs.components.fish.brain_component import Brain
+from ecs.components.tags.dead_component import DeadFlag
+
+
+class _Spy:
+    """Wraps CruiseState.decide and records (entity, dt) per call."""
+    def __init__(self, monkeypatch):
+        self.calls = []
+        cruise = FSM_STATES["Cruise"]
+        real = cruise.decide
+        def decide(fish, context, dt, world):
+            self.calls.append((fish.entity_id, dt))
+            return real(fish, context, dt, world)
+        monkeypatch.setattr(cruise, "decide", decide)
+
+
+def _setup(make_context, make_world, make_dummy_fish, n, budget):
+    ctx = make_context()
+    ctx.balancing = {**ctx.balancing, "ai_decision_budget": budget, "ai_max_cohorts": 8}
+    world = make_world()
+    fish = [make_dummy_fish(world, x=100 + i, y=200) for i in range(n)]
+    return ctx, world, fish
+
+
+def test_cohorts_decide_in_turn_with_elapsed_time(make_context, make_world, make_dummy_fish, monkeypatch, dt):
+    ctx, world, fish = _setup(make_context, make_world, make_dummy_fish, 8, budget=2)
+    behavior = BehaviorSystem(ctx)
+    behavior.update(world, dt)  # enter() + first decision for everyone
+    assert behavior.cohorts == 4
+    for _ in range(4):
+        behavior.update(world, dt)  # settle into the cohort cadence
+    spy = _Spy(monkeypatch)
+    timers = [world.get_component(e, Brain).state_timer for e in fish]
+    for _ in range(8):
+        behavior.update(world, dt)
+    # Every fish decided twice in 8 ticks, each time with 4 ticks' worth of dt
+    assert sorted(e for e, _ in spy.calls) == sorted(fish * 2)
+    assert all(abs(d - 4 * dt) < 1e-9 for _, d in spy.calls)
+    # The cheap per-tick part still ran every tick
+    for e, t0 in zip(fish, timers):
+        assert abs(world.get_component(e, Brain).state_timer - (t0 + 8 * dt)) < 1e-9
+
+
+def test_dead_flag_forces_an_immediate_decision(make_context, make_world, make_dummy_fish, monkeypatch, dt):
+    ctx, world, fish = _setup(make_context, make_world, make_dummy_fish, 8, budget=2)
+    behavior = BehaviorSystem(ctx)
+    behavior.update(world, dt)
+    spy = _Spy(monkeypatch)
+    world.add_component(fish[3], DeadFlag())
+    behavior.update(world, dt)
+    assert fish[3] in [e for e, _ in spy.calls]
+
+
+def test_no_budget_means_every_fish_every_tick(make_context, make_world, make_dummy_fish, monkeypatch, dt):
+    ctx, world, fish = _setup(make_context, make_world, make_dummy_fish, 8, budget=0)
+    behavior = BehaviorSystem(ctx)
+    behavior.update(world, dt)
+    spy = _Spy(monkeypatch)
+    behavior.update(world, dt)
+    assert behavior.cohorts == 1
+    assert sorted(e for e, _ in spy.calls) == sorted(fish)
@@ -0,0 +1,19 @@
+# tests/test_bench_suite.py
+from benchmarks.suite import CASES, compare
+
+
+def test_compare_flags_only_slowdowns_past_threshold():
+    base = {"a": {"us_per_op": 10.0}, "b": {"us_per_op": 10.0}, "c": {"us_per_op": 10.0}}
+    now = {"a": {"us_per_op": 12.9}, "b": {"us_per_op": 13.1}, "c": {"us_per_op": 5.0},
+           "new": {"us_per_op": 1.0}}
+    rows = {name: (pct, bad) for name, pct, bad in compare(now, base, threshold_pct=30.0)}
+    assert rows["a"][1] is False and rows["b"][1] is True
+    assert rows["c"][0] < 0 and rows["c"][1] is False
+    assert rows["new"] == (None, False)
+
+
+def test_suite_covers_requested_areas():
+    names = set(CASES)
+    for prefix in ("world.", "physics.movement", "physics.collision", "physics.avoidance",
+                   "fsm.", "sprite_cache.cold", "sprite_cache.warm", "render.frame"):
+        assert any(n.startswith(prefix) for n in names), prefix
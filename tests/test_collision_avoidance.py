@@ -70,3 +70,39 @@ def test_avoidance_pushes_away_from_wall(make_context):
         world.get_component(fish, Position).x += max(0.0, intent.dx) * 2.0  # crude push right
 
     assert world.get_component(fish, Position).x > pos0
+
+
+def test_columnar_walls_match_scalar(make_context):
+    import random
+    import pytest
+    from ecs.columns import HAVE_NUMPY
+    from ecs.components.tags.dead_component import DeadFlag
+    from ecs.systems.core.collision_system import CollisionSystem
+    if not HAVE_NUMPY:
+        pytest.skip("numpy not installed")
+
+    ctx = make_context(logical_w=300, logical_h=200)
+    worlds = (World(), World(columns=True))
+    for w in worlds:
+        rng = random.Random(5)
+        tank = _add_tank(w, 300, 200)
+        for i in range(60):
+            # Spread past every wall so all bands/clamps fire
+            e = _make_fish_at(w, tank, rng.uniform(-40, 340), rng.uniform(-40, 240),
+                              w=rng.choice((10, 40)), h=rng.choice((10, 30)))
+            vel = w.get_component(e, Velocity)
+            vel.dx, vel.dy = rng.uniform(-50, 50), rng.uniform(-50, 50)
+            if i % 6 == 0:
+                w.add_component(e, DeadFlag())
+
+    for w in worlds:
+        AvoidanceSystem(ctx).update(w, 0.016)
+        CollisionSystem(ctx).update(w, 0.016)
+
+    a = list(worlds[0].query(Position, Velocity, SteeringIntent))
+    b = list(worlds[1].query(Position, Velocity, SteeringIntent))
+    assert len(a) == len(b) == 60
+    for (_, pa, va, sa), (_, pb, vb, sb) in zip(a, b):
+        assert (pa.x, pa.y, va.dx, va.dy) == (pb.x, pb.y, vb.dx, vb.dy)
+        assert math.isclose(sa.dx, sb.dx, abs_tol=1e-12)
+        assert math.isclose(sa.dy, sb.dy, abs_tol=1e-12)
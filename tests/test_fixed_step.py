@@ -0,0 +1,109 @@
+# tests/test_fixed_step.py
+from types import SimpleNamespace
+
+from ecs.components.core.position_component import Position
+from ecs.components.core.tank_ref_component import TankRef
+from ecs.systems.rendering.render_interpolation import RenderInterpolation
+
+
+class _Scenes:
+    def __init__(self):
+        self.steps = []
+        self.begun = 0
+        self.caught_up = []
+        self.current_scene = self
+
+    def begin_step(self):
+        self.begun += 1
+
+    def update(self, dt):
+        self.steps.append(dt)
+
+    def fast_forward(self, seconds):
+        self.caught_up.append(seconds)
+
+
+def _game(dt=0.01, max_substeps=3):
+    from game import Game
+    g = Game.__new__(Game)  # loop state only; no window
+    g.dt = dt
+    g.max_substeps = max_substeps
+    g.accumulator = 0.0
+    g.scene_manager = _Scenes()
+    g.context = SimpleNamespace(time_scale=1.0, render_alpha=1.0, sim_time_dropped=0.0,
+                                fast_forwarding=False, sim_time_caught_up=0.0)
+    return g
+
+
+def test_substeps_are_capped_and_backlog_dropped():
+    g = _game()
+    g.accumulator = 0.105  # 10.5 steps behind
+    assert g.advance() == 3
+    assert len(g.scene_manager.steps) == 3
+    assert abs(g.context.sim_time_dropped - 0.07) < 1e-9
+    assert abs(g.context.render_alpha - 0.5) < 1e-6  # fraction kept for interpolation
+    g.accumulator += 0.012
+    assert g.advance() == 1 and g.context.sim_time_dropped < 0.0700001
+
+
+def test_high_time_scale_is_split_into_stable_substeps():
+    g = _game(dt=1 / 60, max_substeps=5)
+    g.frame_budget = 10.0  # no wall-clock cutoff in the test
+    g.context.time_scale = 100.0
+    g.accumulator = 2 / 60
+    assert g.advance() == 2
+    # 100/60 s per step, in updates of at most max_step_dt
+    assert g.context.sim_substeps == 50
+    assert len(g.scene_manager.steps) == 100
+    assert g.scene_manager.begun == 2  # interpolation snapshot once per step, not per update
+    assert max(g.scene_manager.steps) <= g.max_step_dt + 1e-12
+    assert abs(sum(g.scene_manager.steps) - 200 / 60) < 1e-9
+    # Normal speed is untouched
+    g.context.time_scale = 1.0
+    assert g.substeps(1.0) == 1
+
+
+def test_frame_budget_interrupts_a_step_and_carries_the_rest():
+    g = _game(dt=1 / 60, max_substeps=5)
+    g.frame_budget = 0.0  # out of time after the first update
+    g.context.time_scale = 100.0
+    g.accumulator = 1 / 60
+    assert g.advance() == 1
+    assert len(g.scene_manager.steps) == 1 and g.scene_manager.begun == 1
+    # Next frames finish the interrupted step before starting another
+    for _ in range(49):
+        assert g.advance() == 0
+    assert len(g.scene_manager.steps) == 50 and g.scene_manager.begun == 1
+    assert abs(sum(g.scene_manager.steps) - 100 / 60) < 1e-9
+    g.accumulator += 1 / 60
+    assert g.advance() == 1 and g.scene_manager.begun == 2
+
+
+def test_fast_forward_catches_up_the_backlog_in_closed_form():
+    g = _game(dt=0.01, max_substeps=3)
+    g.context.time_scale = 10.0
+    g.context.fast_forwarding = True
+    g.accumulator = 0.105
+    g.advance()
+    assert g.context.sim_time_dropped == 0.0
+    assert len(g.scene_manager.caught_up) == 1
+    assert abs(g.scene_manager.caught_up[0] - 0.7) < 1e-9  # 7 dropped steps at 10x
+
+
+def test_interpolation_draws_between_steps_and_restores(make_world, make_tank):
+    world = make_world()
+    tank = make_tank(world)
+    e = world.create_entity()
+    world.add_component(e, TankRef(tank))
+    pos = Position(10.0, 20.0)
+    world.add_component(e, pos)
+
+    interp = RenderInterpolation()
+    interp.snapshot(world)
+    pos.x, pos.y = 20.0, 40.0  # one sim step
+    interp.begin(world, 0.25)
+    assert (pos.x, pos.y) == (12.5, 25.0)
+    interp.end(world)
+    assert (pos.x, pos.y) == (20.0, 40.0)
+    # Tank itself (no TankRef) is never touched
+    assert world.get_component(tank, Position).x == 0
@@ -0,0 +1,75 @@
+import random
+
+import pytest
+
+from ecs.columns import HAVE_NUMPY
+from ecs.components.core.position_component import Position
+from ecs.components.core.sprite_component import Sprite
+from ecs.components.core.tank_ref_component import TankRef
+from ecs.components.fish.brain_component import Brain
+from ecs.components.fish.food_perception_component import FoodPerception
+from ecs.components.tags.food_pellet_component import FoodPellet
+from ecs.fsm.chase_food_state import ChaseFoodState
+from ecs.fsm.look_for_food_state import LookForFoodState
+from ecs.systems.ai.food_perception_system import FoodPerceptionSystem
+from utils.geometry import get_mouth_logical
+
+pytestmark = pytest.mark.skipif(not HAVE_NUMPY, reason="numpy not installed")
+
+
+def test_perception_matches_state_scans(make_world, make_context, make_dummy_fish):
+    world = make_world()
+    rng = random.Random(21)
+    fish = []
+    for i in range(12):
+        e = make_dummy_fish(world, x=rng.uniform(0, 700), y=rng.uniform(0, 500))
+        world.get_component(e, Brain).state = ("LookForFood", "ChaseFood", "Cruise")[i % 3]
+        fish.append(e)
+    tank = world.get_component(fish[0], TankRef).tank_entity
+    for _ in range(40):
+        p = world.create_entity()
+        world.add_component(p, TankRef(tank))
+        world.add_component(p, Position(rng.uniform(0, 800), rng.uniform(0, 600)))
+        world.add_component(p, Sprite("pellet", rng.choice((12, 16, 24)), 16))
+        world.add_component(p, FoodPellet(radius_scale=1.35))
+    # One pellet right at a fish's mouth so the eat test fires
+    pos0, spr0 = world.get_component(fish[1], Position), world.get_component(fish[1], Sprite)
+    world.get_component(p, Position).x = pos0.x + spr0.base_w
+    world.get_component(p, Position).y = pos0.y + spr0.base_h * 0.5 - 8
+
+    FoodPerceptionSystem(make_context()).update(world, 0.016)
+
+    eats = 0
+    for i, e in enumerate(fish):
+        rec = world.get_component(e, FoodPerception)
+        if i % 3 == 2:
+            assert rec is None  # Cruise fish are not sensed
+            continue
+        assert rec.valid
+        pos, spr = world.get_component(e, Position), world.get_component(e, Sprite)
+        fx, fy = pos.x + spr.base_w * 0.5, pos.y + spr.base_h * 0.5
+        assert rec.pellet == ChaseFoodState._nearest_pellet(world, fx, fy)
+        assert (rec.visible, rec.visible_cx, rec.visible_cy) == \
+            LookForFoodState()._nearest_visible_pellet(world, pos, spr, 250.0)
+        cx, cy, pr = ChaseFoodState._pellet_center_and_radius(world, rec.pellet)
+        assert (rec.cx, rec.cy) == (cx, cy) and rec.radius == pytest.approx(pr)
+        mx, my = get_mouth_logical(pos, spr, target_x=cx)
+        mouth_r = max(4.0, min(spr.base_w, spr.base_h) * 0.40 * 0.5)
+        assert rec.can_eat == (((cx - mx) ** 2 + (cy - my) ** 2) ** 0.5 <= pr + mouth_r + 8.0)
+        eats += rec.can_eat
+    assert eats >= 1
+
+
+def test_perception_invalidated_when_fish_stops_seeking(make_world, make_context, make_dummy_fish):
+    world = make_world()
+    e = make_dummy_fish(world)
+    brain = world.get_component(e, Brain)
+    brain.state = "LookForFood"
+    system = FoodPerceptionSystem(make_context())
+    system.update(world, 0.016)
+    rec = world.get_component(e, FoodPerception)
+    assert rec.valid and rec.pellet is None and rec.visible is None
+
+    brain.state = "Cruise"
+    system.update(world, 0.016)
+    assert not rec.valid
@@ -0,0 +1,24 @@
+# tests/test_headless_sim.py
+import pytest
+
+from benchmarks.headless_sim import allocate, parse_species_mix, run
+
+
+def test_species_mix_allocation_is_exact():
+    cfg = {"goldfish": {}, "guppy": {}, "betta": {}}
+    mix = parse_species_mix("goldfish:3,guppy", cfg)
+    assert mix == {"goldfish": 3.0, "guppy": 1.0}
+    assert allocate(10, mix) == {"goldfish": 8, "guppy": 2}
+    assert sum(allocate(7, parse_species_mix(None, cfg)).values()) == 7
+    with pytest.raises(ValueError):
+        parse_species_mix("shark", cfg)
+
+
+def test_headless_run_steps_the_simulation():
+    r = run(fish=12, species="goldfish:2,guppy:1", feed_rate=30.0, ticks=30, dt=1 / 60)
+    assert r["ticks"] == 30 and r["ticks_per_sec"] > 0
+    assert r["alive_fish"] == 12
+    assert r["pellets_dropped"] == 15
+    names = {s["name"] for s in r["systems"]}
+    assert {"BehaviorSystem", "MovementSystem", "CollisionSystem"} <= names
+    assert all(s["calls"] == 30 for s in r["systems"] if s["name"] == "BehaviorSystem")
@@ -0,0 +1,73 @@
+# Closed-form metabolism catch-up agrees with tick-by-tick integration.
+import pytest
+
+from world import World
+from ecs.components.fish.age_component import Age
+from ecs.components.fish.hunger_component import Hunger
+from ecs.components.fish.health_component import Health
+from ecs.components.fish.behavior_tuning import BehaviorTuning
+from ecs.components.tags.dead_component import DeadFlag
+from ecs.systems.gameplay.hunger_system import HungerSystem
+from ecs.systems.gameplay.health_system import HealthSystem
+from ecs.systems.gameplay.aging_system import AgingSystem
+from ecs.systems.gameplay.metabolism import fast_forward_metabolism
+
+TUNING = {"health_regen_factor": 0.1, "health_starve_factor": 0.1, "health_regen_threshold": 0.5}
+
+
+def _fish(world, age=0.0, lifespan=300.0, stage="Adult", hunger=80.0, rate=1.0, hp=60.0):
+    e = world.create_entity()
+    world.add_component(e, Age(age=age, lifespan=lifespan, stage=stage))
+    world.add_component(e, Hunger(hunger=hunger, hunger_rate=rate, hunger_max=100.0))
+    world.add_component(e, Health(value=hp, max_value=100.0))
+    world.add_component(e, BehaviorTuning(dict(TUNING)))
+    return e
+
+
+def _state(world, e):
+    age = world.get_component(e, Age)
+    return (world.get_component(e, Hunger).hunger, world.get_component(e, Health).value,
+            age.age, age.stage, world.get_component(e, DeadFlag) is not None)
+
+
+@pytest.mark.parametrize("seconds, fish", [
+    (50.0, {}),                                          # regen to cap, then hungry
+    (50.0, {"age": 200.0}),                              # elder decay vs regen
+    (120.0, {"hunger": 5.0}),                            # starvation death
+    (60.0, {"age": 280.0, "hp": 100.0}),                 # lifespan death
+    (50.0, {"stage": "Egg"}),                            # hatch mid-window
+    (500.0, {"hunger": 100.0, "rate": 0.2, "age": 100.0, "lifespan": 400.0, "hp": 20.0}),
+])
+def test_fast_forward_matches_tick_integration(make_context, seconds, fish):
+    ctx = make_context()
+    ticked, jumped = World(), World()
+    a, b = _fish(ticked, **fish), _fish(jumped, **fish)
+
+    ticked.add_system(HungerSystem())
+    ticked.add_system(HealthSystem())
+    ticked.add_system(AgingSystem(ctx))
+    dt = 1.0 / 60.0
+    for _ in range(int(round(seconds / dt))):
+        ticked.update(dt)
+    ticked.apply_commands()
+
+    fast_forward_metabolism(jumped, ctx, seconds)
+    jumped.apply_commands()
+
+    hunger_t, health_t, age_t, stage_t, dead_t = _state(ticked, a)
+    hunger_j, health_j, age_j, stage_j, dead_j = _state(jumped, b)
+    assert (stage_j, dead_j) == (stage_t, dead_t)
+    assert hunger_j == pytest.approx(hunger_t, abs=0.1)
+    assert health_j == pytest.approx(health_t, abs=0.5)
+    assert age_j == pytest.approx(age_t, abs=0.1)
+
+
+def test_fast_forward_is_one_step_for_hours(make_context):
+    ctx = make_context()
+    world = World()
+    e = _fish(world, lifespan=1e9, hunger=100.0, rate=0.0, hp=50.0)
+    fast_forward_metabolism(world, ctx, 6 * 3600.0)
+    world.apply_commands()
+    assert world.get_component(e, Health).value == pytest.approx(100.0)
+    assert world.get_component(e, Age).age == pytest.approx(6 * 3600.0)
+    assert world.get_component(e, DeadFlag) is None
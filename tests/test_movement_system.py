@@ -65,3 +65,53 @@ def test_hysteresis_facing_stability():
     target = TargetIntent(-300, 50)
     face_right, _ = choose_facing(spr, Velocity(0.0, 0.0), target, pos, True)
     assert face_right is False
+
+
+def _seed_movers(world, tank, n=40, seed=7):
+    import random
+    from ecs.components.fish.behavior_tuning import BehaviorTuning
+    from ecs.components.tags.dead_component import DeadFlag
+    rng = random.Random(seed)
+    for i in range(n):
+        e = world.create_entity()
+        world.add_component(e, TankRef(tank))
+        world.add_component(e, Position(rng.uniform(0, 800), rng.uniform(0, 600)))
+        # every 5th fish starts at rest (instant-turn branch)
+        v = (0.0, 0.0) if i % 5 == 0 else (rng.uniform(-60, 60), rng.uniform(-60, 60))
+        world.add_component(e, Velocity(*v))
+        world.add_component(e, Sprite("goldfish", base_w=60, base_h=40))
+        world.add_component(e, MotionParams(max_speed=rng.uniform(20, 120),
+                                            acceleration=rng.uniform(20, 300),
+                                            turn_speed=rng.uniform(0.5, 8.0)))
+        world.add_component(e, TargetIntent(rng.uniform(0, 800), rng.uniform(0, 600)))
+        world.add_component(e, SteeringIntent(rng.uniform(-0.3, 0.3), rng.uniform(-0.3, 0.3)))
+        world.add_component(e, SpeedIntent(rng.uniform(0, 150)))
+        world.add_component(e, BehaviorTuning({"noise": 0.05 if i % 3 == 0 else 0.0}))
+        if i % 7 == 3:
+            world.add_component(e, DeadFlag())
+
+
+def test_columnar_movement_matches_scalar(make_context, make_tank, dt):
+    import pytest
+    from ecs.columns import HAVE_NUMPY
+    if not HAVE_NUMPY:
+        pytest.skip("numpy not installed")
+
+    ctx = make_context()
+    scalar, batched = World(), World(columns=True)
+    for w in (scalar, batched):
+        _seed_movers(w, make_tank(w, w=800, h=600))
+
+    for w in (scalar, batched):
+        ctx.rng.reseed(99)  # same noise draws on both paths
+        system = MovementSystem(ctx)
+        for _ in range(30):
+            system.update(w, dt)
+
+    rows_a = list(scalar.query(Position, Velocity, SteeringIntent))
+    rows_b = list(batched.query(Position, Velocity, SteeringIntent))
+    assert len(rows_a) == len(rows_b) == 40
+    for (_, pa, va, sa), (_, pb, vb, sb) in zip(rows_a, rows_b):
+        assert abs(pa.x - pb.x) < 1e-6 and abs(pa.y - pb.y) < 1e-6
+        assert abs(va.dx - vb.dx) < 1e-6 and abs(va.dy - vb.dy) < 1e-6
+        assert (sa.dx, sa.dy) == (sb.dx, sb.dy)
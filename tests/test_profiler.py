@@ -0,0 +1,62 @@
+# Frame profiler: opt-in per-system timings + entity counts, F7 panel rows.
+from world import World
+from ecs.profiler import FrameProfiler
+from ecs.components.core.position_component import Position
+from ecs.systems.ui.debug import debug_controller as dbg
+from ecs.systems.ui.debug.debug_menu import DebugMenu
+
+
+class _Touch:
+    def update(self, world, dt):
+        for _e, _pos in world.query(Position):
+            pass
+
+
+def test_profiler_records_only_when_enabled():
+    world = World()
+    for i in range(5):
+        e = world.create_entity()
+        world.add_component(e, Position(i, 0))
+    world.add_system(_Touch())
+    world.profiler = FrameProfiler(window=10)
+
+    world.update(0.016)
+    assert world.profiler.summaries() == []
+
+    world.profiler.enabled = True
+    for _ in range(3):
+        world.update(0.016)
+    (s,) = world.profiler.summaries("update")
+    assert s.name == "_Touch" and s.calls == 3 and s.entities == 5
+    assert s.min_ms <= s.mean_ms <= s.p95_ms <= s.max_ms
+
+
+def test_perf_tab_toggles_profiler_and_builds_rows(make_context):
+    import pygame
+    ctx = make_context()
+    dbg.select_tab(ctx, "perf")
+    assert ctx.profiler.enabled
+    ctx.profiler.record("MovementSystem", 0.002, 12)
+    menu = DebugMenu(pygame.Surface((800, 600)), ctx)
+    rows = menu._perf_rows()
+    assert any(r.startswith("MovementSystem") for r in rows)
+
+    dbg.select_tab(ctx, "perf")  # same key again closes + stops timing
+    assert not ctx.profiler.enabled
+
+
+class _SlowTouch(_Touch):
+    pass
+
+
+def test_frame_mean_weights_reduced_rate_systems():
+    world = World()
+    world.add_system(_Touch())
+    world.add_system(_SlowTouch(), rate=15.0)  # every 4th tick at 60 Hz
+    world.profiler = FrameProfiler(window=60, enabled=True)
+    for _ in range(60):
+        world.update(1.0 / 60.0)
+    slow = [s for s in world.profiler.summaries("update") if s.name == "_SlowTouch"]
+    assert abs(slow[0].per_frame - 0.25) < 0.05
+    assert abs(slow[0].frame_ms - slow[0].mean_ms * slow[0].per_frame) < 1e-12
+    assert world.profiler.total_mean_ms("update") < sum(s.mean_ms for s in world.profiler.summaries("update"))
@@ -0,0 +1,135 @@
+# Dependency stages from READS/WRITES, and the threaded update path.
+import pytest
+
+from world import World
+from ecs.schedule import COMMANDS, build_stages
+from ecs.components.core.position_component import Position
+from ecs.components.core.velocity_component import Velocity
+
+
+class _Sys:
+    def __init__(self, name, reads=(), writes=(), log=None):
+        self.name = name
+        self.READS = reads
+        self.WRITES = writes
+        self.log = log
+    def update(self, world, dt):
+        if self.log is not None:
+            self.log.append(self.name)
+
+
+class _Barrier:
+    def update(self, world, dt):
+        pass
+
+
+def test_independent_systems_share_a_stage_and_conflicts_serialize():
+    a = _Sys("a", writes=("hunger",))
+    b = _Sys("b", writes=("steer",), reads=("pos",))
+    c = _Sys("c", reads=("hunger",), writes=("health",))   # after a (read/write)
+    d = _Sys("d", writes=("pos",))                         # after b (write/read)
+    e = _Sys("e", writes=("health",))                      # after c (write/write)
+    assert build_stages([a, b, c, d, e]) == [[0, 1], [2, 3], [4]]
+
+
+def test_undeclared_system_is_a_barrier():
+    a = _Sys("a", writes=("x",))
+    b = _Sys("b", writes=("y",))
+    assert build_stages([a, _Barrier(), b]) == [[0], [1], [2]]
+
+
+def test_threaded_update_matches_serial_and_keeps_order():
+    def run(workers):
+        world = World(workers=workers)
+        log = []
+        world.add_system(_Sys("writer", writes=(Position,), log=log))
+        world.add_system(_Sys("other", writes=(Velocity,), log=log))
+        world.add_system(_Sys("reader", reads=(Position,), writes=(COMMANDS,), log=log))
+        world.add_system(_Sys("slow", writes=("slow",), log=log), rate=30.0, offset=0.0)
+        for _ in range(4):
+            world.update(1.0 / 60.0)
+        world.set_workers(0)
+        return world, log
+
+    serial_world, serial = run(0)
+    threaded_world, threaded = run(4)
+    assert sorted(serial) == sorted(threaded)
+    assert threaded.count("slow") == 2
+    # "reader" always runs after "writer" within each tick
+    w = [i for i, n in enumerate(threaded) if n == "writer"]
+    r = [i for i, n in enumerate(threaded) if n == "reader"]
+    assert all(wi < ri for wi, ri in zip(w, r))
+    assert "stage 0 (parallel)" in threaded_world.describe_schedule()
+
+
+def test_threaded_update_reraises_system_errors():
+    class _Boom(_Sys):
+        def update(self, world, dt):
+            raise RuntimeError("boom")
+    world = World(workers=2)
+    world.add_system(_Sys("ok", writes=("a",)))
+    world.add_system(_Boom("boom", writes=("b",)))
+    with pytest.raises(RuntimeError, match="boom"):
+        world.update(0.016)
+    world.set_workers(0)
+
+
+def test_run_conditions_skip_idle_systems():
+    from types import SimpleNamespace
+    from ecs.schedule import components_changed, flag, resource_changed
+
+    ctx = SimpleNamespace(on=False, size=100)
+    world = World()
+    flagged = _Sys("flagged", log=[])
+    watcher = _Sys("watcher", log=[])
+    resized = _Sys("resized", log=[])
+    drawn = _Sys("drawn", log=[])
+    world.add_system(flagged, run_if=flag(ctx, "on"))
+    world.add_system(watcher, run_if=components_changed(Position))
+    world.add_system(resized, run_if=resource_changed(lambda: ctx.size))
+    world.add_system(drawn, phase="render", run_if=[flag(ctx, "on")])
+
+    for _ in range(3):
+        world.update(0.016)
+        world.render()
+    assert (flagged.log, drawn.log) == ([], [])
+    assert len(watcher.log) == 1 and len(resized.log) == 1   # first check only
+
+    ctx.on = True
+    ctx.size = 200
+    world.add_component(world.create_entity(), Position(0, 0))
+    world.update(0.016)
+    world.render()
+    assert len(flagged.log) == 1 and len(drawn.log) == 1
+    assert len(watcher.log) == 2 and len(resized.log) == 2
+
+
+def test_periodic_system_skipped_by_condition_keeps_elapsed_time():
+    from types import SimpleNamespace
+    from ecs.schedule import flag
+
+    gate = SimpleNamespace(open=False)
+    world = World()
+    rec = []
+
+    class _Rec:
+        def update(self, world, dt):
+            rec.append(dt)
+    world.add_system(_Rec(), rate=10.0, offset=0.0, run_if=flag(gate, "open"))
+    for _ in range(30):
+        world.update(0.01)
+    assert rec == []
+    gate.open = True
+    for _ in range(10):
+        world.update(0.01)
+    assert len(rec) == 1 and abs(rec[0] - 0.4) < 1e-9
+
+
+def test_movement_declares_the_steering_it_zeroes():
+    # MovementSystem consumes SteeringIntent, so it can't share a stage with
+    # another reader of it even if that system comes first
+    from ecs.components.fish.steering_intent_component import SteeringIntent
+    from ecs.systems.core.movement_system import MovementSystem
+    assert SteeringIntent in MovementSystem.WRITES
+    reader = _Sys("reader", reads=(SteeringIntent,))
+    assert build_stages([reader, MovementSystem]) == [[0], [1]]
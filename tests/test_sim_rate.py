@@ -0,0 +1,70 @@
+# tests/test_sim_rate.py
+from types import SimpleNamespace
+
+import pytest
+
+from ecs.components.core.velocity_component import Velocity
+from ecs.components.fish.motion_component import MotionParams
+from ecs.fsm.base_state import BaseState
+from ecs.systems.core.movement_system import MovementSystem
+from utils.timestep import blend_factor, decay_factor, step_chance
+
+
+def test_factors_are_identity_at_reference_rate_and_compose():
+    assert blend_factor(0.1, 1 / 60) == pytest.approx(0.1)
+    assert decay_factor(0.995, 1 / 60) == pytest.approx(0.995)
+    assert step_chance(0.01, 1 / 60) == pytest.approx(0.01)
+    # three 60 Hz ticks == one 20 Hz tick
+    assert 1 - (1 - 0.1) ** 3 == pytest.approx(blend_factor(0.1, 1 / 20))
+    assert blend_factor(0.1, 0.0) == 0.0 and step_chance(0.5, 0.0) == 0.0
+
+
+@pytest.mark.parametrize("hz", [10, 20, 60])
+def test_speed_smoothing_matches_across_rates(make_context, hz):
+    ctx = make_context()
+    fish = SimpleNamespace(brain=SimpleNamespace(current_desired_speed=0.0, _speed_factor=0.5),
+                           motion=SimpleNamespace(max_speed=100.0))
+    intent = SimpleNamespace(desired_speed=0.0)
+    for _ in range(hz):  # one simulated second
+        BaseState().approach_speed(fish, intent, ctx, 1.0 / hz)
+    smooth = float(ctx.balancing.get("state_speed_smoothing", 0.10))
+    expected = 50.0 * (1 - (1 - smooth) ** 60)
+    assert intent.desired_speed == pytest.approx(expected, rel=1e-9)
+
+
+@pytest.mark.parametrize("hz", [10, 20, 60])
+def test_coasting_damping_matches_across_rates(make_context, make_world, make_dummy_fish, hz):
+    ctx = make_context()
+    world = make_world()
+    e = make_dummy_fish(world, x=300, y=300)
+    world.get_component(e, MotionParams).acceleration = 0.0  # no drive: pure damping
+    vel = world.get_component(e, Velocity)
+    vel.dx = 50.0
+    system = MovementSystem(ctx)
+    for _ in range(hz):
+        system.update(world, 1.0 / hz)
+    assert vel.dx == pytest.approx(50.0 * system.damping ** 60, rel=1e-9)
+
+
+def test_idle_bob_target_matches_across_rates(make_context):
+    from ecs.fsm.idle_state import IdleState
+    targets = []
+    for hz in (10, 20, 60):
+        ctx = make_context()
+        ctx.rng.reseed(3)
+        fish = SimpleNamespace(
+            brain=SimpleNamespace(current_desired_speed=0.0),
+            tuning={"idle_min_time": 1.0, "idle_max_time": 5.0, "idle_speed_factor": 0.05,
+                    "idle_bob_amplitude": 20.0, "idle_bob_frequency": 1.0},
+            pos=SimpleNamespace(x=200.0, y=150.0), target=SimpleNamespace(tx=0.0, ty=0.0),
+            motion=SimpleNamespace(max_speed=100.0))
+        intent = SimpleNamespace(desired_speed=0.0)
+        state = IdleState()
+        state.enter(fish, ctx)
+        for _ in range(2 * hz):  # two simulated seconds
+            state.tick(fish, intent, ctx, 1.0 / hz, None)
+        targets.append((fish.target.tx, fish.target.ty))
+        # Never drifts more than the bob radius from where Idle settled
+        b = fish.brain
+        assert abs(fish.target.tx - b.idle_anchor_x) <= 5.0 and abs(fish.target.ty - b.idle_anchor_y) <= 5.0
+    assert targets[1] == pytest.approx(targets[0]) and targets[2] == pytest.approx(targets[0])
@@ -0,0 +1,168 @@
+import random
+from math import hypot
+
+from ecs.components.core.position_component import Position
+from ecs.components.core.sprite_component import Sprite
+from ecs.components.core.tank_ref_component import TankRef
+from ecs.components.tags.food_pellet_component import FoodPellet
+from ecs.systems.core.spatial_index_system import SpatialIndexSystem
+from utils.spatial import LAYER_EGGS, LAYER_FISH, LAYER_PELLETS, UniformGrid
+
+
+def _scatter(grid, n=300, seed=3):
+    rng = random.Random(seed)
+    boxes = {}
+    for i in range(n):
+        x, y = rng.uniform(0, 1000), rng.uniform(0, 600)
+        hw, hh = rng.uniform(2, 30), rng.uniform(2, 20)
+        grid.update(i, x, y, hw, hh)
+        boxes[i] = (x, y, hw, hh)
+    return boxes
+
+
+def test_grid_queries_match_brute_force():
+    grid = UniformGrid(cell_size=64)
+    boxes = _scatter(grid)
+    # Move a third of them (some across cells) and drop a few
+    rng = random.Random(9)
+    for i in range(0, 300, 3):
+        x, y, hw, hh = boxes[i]
+        boxes[i] = (x + rng.uniform(-100, 100), y + rng.uniform(-100, 100), hw, hh)
+        grid.update(i, *boxes[i])
+    for i in range(1, 300, 17):
+        assert grid.remove(i)
+        del boxes[i]
+    assert len(grid) == len(boxes)
+
+    for qx, qy, r in ((500, 300, 120), (10, 10, 40), (990, 590, 250)):
+        want = {i for i, (x, y, hw, hh) in boxes.items() if hypot(x - qx, y - qy) <= r + max(hw, hh)}
+        assert set(grid.query_radius(qx, qy, r)) == want
+
+        want = {i for i, (x, y, hw, hh) in boxes.items()
+                if x + hw >= qx - r and x - hw <= qx + r and y + hh >= qy - r and y - hh <= qy + r}
+        assert set(grid.query_rect(qx - r, qy - r, qx + r, qy + r)) == want
+
+        ranked = sorted((hypot(x - qx, y - qy), i) for i, (x, y, _, _) in boxes.items())
+        got = grid.nearest(qx, qy, k=5)
+        assert [i for _, i in got] == [i for _, i in ranked[:5]]
+        odd = grid.nearest(qx, qy, k=1, accept=lambda i: i % 2 == 1)
+        assert odd[0][1] == next(i for _, i in ranked if i % 2 == 1)
+
+
+def test_index_system_tracks_layers(make_world, make_context, make_dummy_fish):
+    from ecs.components.fish.age_component import Age
+    world = make_world()
+    fish = make_dummy_fish(world, x=100, y=200)
+    egg = make_dummy_fish(world, x=400, y=200)
+    world.get_component(egg, Age).stage = "Egg"
+    tank = world.get_component(fish, TankRef).tank_entity
+    pellet = world.create_entity()
+    world.add_component(pellet, TankRef(tank))
+    world.add_component(pellet, Position(300, 100))
+    world.add_component(pellet, Sprite("pellet", 16, 16))
+    world.add_component(pellet, FoodPellet())
+
+    system = SpatialIndexSystem(make_context())
+    system.update(world, 0.016)
+    idx = world.spatial
+    assert list(idx[LAYER_FISH]) == [fish]
+    assert list(idx[LAYER_EGGS]) == [egg]
+    assert idx[LAYER_PELLETS].nearest(0, 0)[0][1] == pellet
+    assert idx[LAYER_PELLETS].position(pellet) == (308, 108)
+
+    # Hatch moves layers; eaten pellet is swept
+    world.get_component(egg, Age).stage = "Juvenile"
+    world.destroy_entity(pellet)
+    system.update(world, 0.016)
+    assert set(idx[LAYER_FISH]) == {fish, egg} and len(idx[LAYER_EGGS]) == 0
+    assert len(idx[LAYER_PELLETS]) == 0
+
+
+def test_food_search_same_with_and_without_grid(make_world, make_context, make_dummy_fish):
+    from ecs.fsm.chase_food_state import ChaseFoodState
+    from ecs.fsm.look_for_food_state import LookForFoodState
+    world = make_world()
+    fish = make_dummy_fish(world, x=100, y=200)
+    tank = world.get_component(fish, TankRef).tank_entity
+    rng = random.Random(11)
+    for _ in range(80):
+        p = world.create_entity()
+        world.add_component(p, TankRef(tank))
+        world.add_component(p, Position(rng.uniform(0, 800), rng.uniform(0, 600)))
+        world.add_component(p, Sprite("pellet", 16, 16))
+        world.add_component(p, FoodPellet())
+    pos, spr = world.get_component(fish, Position), world.get_component(fish, Sprite)
+
+    def search():
+        out = []
+        for x, y, r in ((100, 200, 60), (400, 300, 250), (790, 10, 30)):
+            pos.x, pos.y = x, y
+            out.append(LookForFoodState()._nearest_visible_pellet(world, pos, spr, r))
+            out.append(ChaseFoodState._nearest_pellet(world, x, y))
+        return out
+
+    brute = search()
+    SpatialIndexSystem(make_context()).update(world, 0.016)
+    assert world.spatial is not None
+    assert search() == brute
+
+
+def test_chase_ranks_grid_candidates_by_current_position(make_world, make_context, make_dummy_fish):
+    from ecs.fsm.chase_food_state import ChaseFoodState
+    world = make_world()
+    fish = make_dummy_fish(world, x=100, y=200)
+    tank = world.get_component(fish, TankRef).tank_entity
+    pellets = []
+    for x in (300.0, 304.0):
+        p = world.create_entity()
+        world.add_component(p, TankRef(tank))
+        world.add_component(p, Position(x, 100))
+        world.add_component(p, Sprite("pellet", 16, 16))
+        world.add_component(p, FoodPellet())
+        pellets.append(p)
+    SpatialIndexSystem(make_context()).update(world, 0.016)
+    # The nearer pellet drifts a few px this tick: the grid still has it closer
+    world.get_component(pellets[0], Position).x += 6.0
+    assert world.spatial[LAYER_PELLETS].nearest(0, 0)[0][1] == pellets[0]
+    assert ChaseFoodState._nearest_pellet(world, 0, 0) == pellets[1]
+    world.spatial = None
+    assert ChaseFoodState._nearest_pellet(world, 0, 0) == pellets[1]
+
+
+
+def test_look_for_food_ranks_grid_candidates_by_current_position(make_world, make_context, make_dummy_fish):
+    from ecs.fsm.look_for_food_state import LookForFoodState
+    look = LookForFoodState()
+
+    def setup(xs, moves):
+        world = make_world()
+        fish = make_dummy_fish(world, x=100, y=200)
+        tank = world.get_component(fish, TankRef).tank_entity
+        pellets = []
+        for x in xs:
+            p = world.create_entity()
+            world.add_component(p, TankRef(tank))
+            world.add_component(p, Position(x, 100))
+            world.add_component(p, Sprite("pellet", 16, 16))
+            world.add_component(p, FoodPellet())
+            pellets.append(p)
+        SpatialIndexSystem(make_context()).update(world, 0.016)
+        for p, dx in zip(pellets, moves):
+            world.get_component(p, Position).x += dx
+        return world, world.get_component(fish, Position), world.get_component(fish, Sprite), pellets
+
+    def both(world, pos, spr, radius):
+        grid = look._nearest_visible_pellet(world, pos, spr, radius)[0]
+        spatial, world.spatial = world.spatial, None
+        scan = look._nearest_visible_pellet(world, pos, spr, radius)[0]
+        world.spatial = spatial
+        return grid, scan
+
+    # Same drift as the ChaseFood case: the grid still has pellet 0 closer
+    world, pos, spr, pellets = setup((300.0, 304.0), (6.0, 0.0))
+    pos.x, pos.y = -30, -20  # fish center at the origin
+    assert both(world, pos, spr, 1000.0) == (pellets[1], pellets[1])
+    # A pellet whose stale center is just out of vision but has drifted in
+    world, pos, spr, pellets = setup((400.0,), (-5.0,))
+    pos.x, pos.y = 108 - 30, 108 - 20  # center 300 px left of the pellet's old center
+    assert both(world, pos, spr, 300.0 - 8 - 2.0) == (pellets[0], pellets[0])
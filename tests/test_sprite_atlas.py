@@ -0,0 +1,136 @@
+# SpriteAtlas: packed areas reproduce the variant pixels; batched render matches per-sprite blits.
+import random
+
+import pygame
+import pytest
+
+from ecs.components.fish.age_component import Age
+from ecs.systems.renderers.atlas import SpriteAtlas
+from ecs.systems.renderers.cache import SpriteCache
+from ecs.systems.rendering.sprite_render_system import SpriteRenderSystem
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _pygame_boot():
+    # convert_alpha() in the variant builds needs a display mode
+    pygame.init()
+    try:
+        pygame.display.set_mode((1, 1))
+        yield
+    finally:
+        pygame.quit()
+
+
+def _noise_sprite(w, h, seed=5):
+    rng = random.Random(seed)
+    surf = pygame.Surface((w, h), pygame.SRCALPHA)
+    for x in range(w):
+        for y in range(h):
+            a = rng.choice((0, 0, 255, rng.randrange(256)))
+            surf.set_at((x, y), (rng.randrange(256), rng.randrange(256), rng.randrange(256), a))
+    return surf
+
+
+def _backdrop():
+    screen = pygame.Surface((200, 150))
+    screen.fill((20, 60, 110))
+    return screen
+
+
+def test_atlas_area_blits_like_the_variant_surface():
+    atlas = SpriteAtlas(page_size=64)
+    sprites = [_noise_sprite(w, h, seed=w) for w, h in ((30, 20), (20, 30), (17, 9), (40, 12))]
+    assert atlas.pack(enumerate(sprites)) == 4
+    assert atlas.pack(enumerate(sprites)) == 0  # packed once
+    direct, batched = _backdrop(), _backdrop()
+    draws = []
+    for i, surf in enumerate(sprites):
+        page, area = atlas.get(i)
+        assert area.size == surf.get_size()
+        direct.blit(surf, (i * 45, 10 + i * 20))
+        draws.append((page, (i * 45, 10 + i * 20), area))
+    batched.blits(draws, doreturn=False)
+    assert pygame.image.tobytes(direct, "RGB") == pygame.image.tobytes(batched, "RGB")
+    stats = atlas.stats()
+    assert stats["entries"] == 4 and not stats["full"]
+
+
+def test_released_slots_are_reused_and_full_is_reported():
+    atlas = SpriteAtlas(page_size=32, max_bytes=32 * 32 * 4)  # one page
+    assert atlas.pack([("a", _noise_sprite(32, 20, seed=1))]) == 1
+    assert atlas.pack([("b", _noise_sprite(32, 20, seed=2))]) == 0 and atlas.full
+    assert atlas.get("b") is None
+    atlas.release("a")
+    assert not atlas.full and "a" not in atlas
+    replacement = _noise_sprite(30, 18, seed=3)
+    assert atlas.pack([("c", replacement)]) == 1
+    page, area = atlas.get("c")
+    assert area.topleft == (0, 0) and area.size == (30, 18)
+    # The reused slot holds only the new pixels
+    out = pygame.Surface((30, 18), pygame.SRCALPHA)
+    out.blit(page, (0, 0), area, special_flags=pygame.BLEND_RGBA_MAX)
+    assert pygame.image.tobytes(out, "RGBA") == pygame.image.tobytes(replacement, "RGBA")
+    assert atlas.pack([("big", _noise_sprite(40, 4))]) == 0  # bigger than a page
+
+
+def test_cache_evictions_release_atlas_regions():
+    cache = SpriteCache(cache_limit=2)
+    atlas = SpriteAtlas(page_size=64)
+    cache.add_drop_listener(atlas.release)
+    img = _noise_sprite(40, 20)
+    keys = []
+    for w in (20, 30):
+        cache.get(img, w, 10)
+        keys.append(cache.key(img, w, 10))
+    atlas.pack((k, cache.peek(k)) for k in keys)
+    assert len(atlas) == 2
+    cache.touch(keys[:1])  # drawn from the atlas: stays recent
+    cache.get(img, 10, 5)  # evicts keys[1]
+    assert keys[0] in atlas and keys[1] not in atlas
+    cache.clear()
+    assert len(atlas) == 0
+    del atlas  # listeners are weak: a dead atlas is just skipped
+    cache.get(img, 20, 10)
+    cache.clear()
+
+
+def test_render_with_atlas_matches_per_sprite_blits(make_context, make_world, make_dummy_fish):
+    frames = []
+    for use_atlas in (False, True):
+        ctx = make_context()
+        ctx.ui = {**(ctx.ui or {}), "sprite_atlas": use_atlas}
+        ctx.tank_scale = 1.0
+        world = make_world()
+        fish = [make_dummy_fish(world, x=10 + 23 * i, y=15 + 9 * i) for i in range(6)]
+        world.get_component(fish[1], Age).stage = "Senior"
+        world.get_component(fish[2], Age).stage = "Juvenile"
+        screen = _backdrop()
+        renderer = SpriteRenderSystem(screen, {"goldfish": _noise_sprite(60, 40)}, ctx)
+        renderer.sprite_cache.clear()
+        renderer.update(world, 0.016)
+        renderer.update(world, 0.016)
+        assert (renderer.atlas is not None) == use_atlas
+        assert [e for e, _ in ctx.fish_screen_rects] == fish
+        if use_atlas:
+            assert len(renderer.atlas) >= 4  # adult both ways, senior, juvenile (from the job list)
+        frames.append(pygame.image.tobytes(screen, "RGB"))
+    assert frames[0] == frames[1]
+
+
+def test_atlas_is_rebuilt_from_the_prewarm_jobs(make_context, make_world, make_dummy_fish):
+    ctx = make_context()
+    ctx.tank_scale = 1.0
+    world = make_world()
+    make_dummy_fish(world, x=40, y=30)
+    renderer = SpriteRenderSystem(_backdrop(), {"goldfish": _noise_sprite(60, 40)}, ctx)
+    renderer.sprite_cache.clear()
+    renderer.update(world, 0.016)
+    assert len(renderer.atlas) > 0
+    ctx.tank_scale = 1.5  # resize: rebuilt in the background
+    renderer.update(world, 0.016)
+    cache = renderer.sprite_cache
+    cache.wait_prewarm()
+    renderer.update(world, 0.016)
+    assert cache.prewarming == 0 and len(renderer.atlas) > 0
+    # Every rebuilt variant (job list) landed in the atlas at the new size
+    assert all(area.w in (90, 45) for _, area in renderer.atlas._regions.values())
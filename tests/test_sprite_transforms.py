@@ -0,0 +1,48 @@
+# SpriteCache variants: the surfarray path must match the per-pixel loops exactly.
+import random
+
+import pygame
+import pytest
+
+from ecs.systems.renderers.cache import SpriteCache
+
+pytest.importorskip("numpy")
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _pygame_boot():
+    # convert_alpha() in the variant builds needs a display mode
+    pygame.init()
+    try:
+        pygame.display.set_mode((1, 1))
+        yield
+    finally:
+        pygame.quit()
+
+
+def _noise_sprite(w, h):
+    rng = random.Random(5)
+    surf = pygame.Surface((w, h), pygame.SRCALPHA)
+    for x in range(w):
+        for y in range(h):
+            a = rng.choice((0, 0, 255, rng.randrange(256)))
+            surf.set_at((x, y), (rng.randrange(256), rng.randrange(256), rng.randrange(256), a))
+    return surf
+
+
+@pytest.mark.parametrize("kw", [
+    dict(dead=True),
+    dict(variant="senior"),
+    dict(variant="senior", hflip=True,
+         senior_style={"desaturate": 0.33, "tint": (200, 180, 255), "outline_px": 2}),
+    dict(variant="senior", senior_style={"outline_color": (10, 20, 30, 128)}),
+    dict(variant="senior", senior_style={"desaturate": 0.0, "outline": False}),
+])
+def test_surfarray_matches_pixel_loops(kw):
+    img = _noise_sprite(37, 23)
+    out = []
+    for use_numpy in (True, False):
+        cache = SpriteCache()
+        cache.use_numpy = use_numpy
+        out.append(pygame.image.tobytes(cache.get(img, 40, 30, **kw), "RGBA"))
+    assert out[0] == out[1]
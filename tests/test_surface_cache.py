@@ -0,0 +1,103 @@
+# SurfaceLRU: true LRU order, byte budget by pitch * height, counters.
+import pygame
+import pytest
+
+from ecs.systems.renderers.cache import SpriteCache, SurfaceLRU, surface_bytes
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _pygame_boot():
+    # convert_alpha() in the variant builds needs a display mode
+    pygame.init()
+    try:
+        pygame.display.set_mode((1, 1))
+        yield
+    finally:
+        pygame.quit()
+
+
+def _surf(w, h=10):
+    return pygame.Surface((w, h), pygame.SRCALPHA)
+
+
+def test_evicts_least_recently_used_not_oldest():
+    lru = SurfaceLRU("t", max_entries=2)
+    lru.put("a", _surf(4))
+    lru.put("b", _surf(4))
+    assert lru.get("a") is not None  # a is now the most recent
+    lru.put("c", _surf(4))
+    assert "a" in lru and "c" in lru and "b" not in lru
+    assert (lru.hits, lru.misses, lru.evictions) == (1, 0, 1)
+
+
+def test_byte_budget_counts_surface_size():
+    small, big = _surf(8), _surf(200, 100)
+    lru = SurfaceLRU("t", max_bytes=surface_bytes(big) + 4 * surface_bytes(small))
+    for i in range(4):
+        lru.put(i, _surf(8))
+    lru.put("big", big)
+    assert len(lru) == 5 and lru.bytes == lru.max_bytes
+    lru.put("one_more", small)  # the oldest small surface makes room
+    assert 0 not in lru and "big" in lru and lru.evictions == 1
+    # Too big for the whole budget: handed back by the caller, never kept
+    lru.put("huge", _surf(400, 400))
+    assert "huge" not in lru and "big" in lru
+
+
+def test_sprite_cache_counts_hits_and_keeps_entry_limit():
+    cache = SpriteCache(cache_limit=2)
+    img = _surf(40, 20)
+    cache.get(img, 20, 10)
+    cache.get(img, 20, 10)
+    cache.get(img, 10, 5)
+    cache.get(img, 30, 15)
+    stats = cache._cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"], stats["entries"]) == (1, 3, 1, 2)
+    cache.cache_limit = 1
+    assert len(cache._cache) == 1
+
+
+def test_rescale_serves_placeholders_then_swaps_in_prewarmed_builds():
+    img = _surf(60, 40)
+    img.fill((200, 120, 40, 255))
+    cache = SpriteCache()
+    old = cache.get(img, 60, 40, variant="senior")
+    jobs = [(img, 90, 60, False, False, "senior", None), (img, 90, 60, True, False, "normal", None)]
+    assert cache.rescale(jobs) == 2
+    quick = cache.get(img, 90, 60, variant="senior", placeholder=True)
+    assert quick.get_size() == (90, 60) and quick is not old
+    cache.wait_prewarm()
+    assert cache.apply_prewarmed() == 2 and cache.prewarming == 0
+    final = cache.get(img, 90, 60, variant="senior", placeholder=True)
+    assert final is not quick
+    expected = SpriteCache().get(img, 90, 60, variant="senior")
+    assert pygame.image.tobytes(final, "RGBA") == pygame.image.tobytes(expected, "RGBA")
+    # Results of a superseded rescale are dropped
+    cache.rescale([(img, 30, 20, False, False, "normal", None)])
+    cache.clear()
+    cache.wait_prewarm()
+    assert cache.apply_prewarmed() == 0
+
+
+def test_prewarm_works_on_private_copies_and_skips_keys_built_on_demand():
+    img = _surf(60, 40)
+    img.fill((10, 200, 90, 255))
+    cache = SpriteCache()
+    calls = []
+    build = cache._build
+
+    def spy(src, *args, **kw):
+        calls.append((src is img, kw.get("convert", True)))
+        return build(src, *args, **kw)
+
+    cache._build = spy
+    # No stale surface for this variant: a placeholder get builds it right away
+    jobs = [(img, 30, 20, False, False, "normal", None), (img, 30, 20, False, True, "normal", None)]
+    assert cache.rescale(jobs) == 2
+    now = cache.get(img, 30, 20, placeholder=True)
+    cache.wait_prewarm()
+    assert cache.apply_prewarmed() == 1  # only the flipped one came from the worker
+    assert cache.get(img, 30, 20) is now
+    worker = [c for c in calls if not c[1]]
+    assert len(worker) <= 2 and not any(is_orig for is_orig, _ in worker)
+    assert (True, True) in calls  # the on-demand build used the original, converted
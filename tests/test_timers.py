@@ -0,0 +1,149 @@
+# Timer wheel and its World integration: deadline order, cancellation, hatching.
+import heapq
+import random
+
+from world import World
+from ecs.timers import TimerWheel
+from ecs.systems.gameplay.aging_system import AgingSystem
+from ecs.systems.ai.behavior_system import BehaviorSystem
+from ecs.components.fish.age_component import Age
+from ecs.components.fish.brain_component import Brain
+from ecs.components.tags.affected_by_gravity import AffectedByGravity
+from ecs.components.tags.dead_component import DeadFlag
+
+
+def test_fires_in_deadline_order_never_early():
+    wheel = TimerWheel(resolution=0.01)
+    fired = []
+    for at in (0.5, 0.05, 3.0, 0.05, 1.25):
+        wheel.schedule(at, lambda at=at: fired.append(at))
+    wheel.advance(0.04)
+    assert fired == []
+    wheel.advance(1.0)
+    assert fired == [0.05, 0.05, 0.5]
+    wheel.advance(10.0)
+    assert fired == [0.05, 0.05, 0.5, 1.25, 3.0]
+    assert len(wheel) == 0
+
+
+def test_matches_a_heap_across_levels_and_overflow():
+    # Deadlines from one tick to past the top level (cascades + overflow)
+    rng = random.Random(7)
+    wheel = TimerWheel(resolution=1.0)
+    expected = []
+    fired = []
+    for n in range(400):
+        at = float(rng.choice((rng.randint(1, 300), rng.randint(300, 20000),
+                               rng.randint(20000, 2_000_000), rng.randint(60_000_000, 80_000_000))))
+        wheel.schedule(at, fired.append, None, (at, n))
+        heapq.heappush(expected, (at, n))
+    cancelled = set(rng.sample(range(400), 50))
+    for handle in cancelled:
+        assert wheel.cancel(handle + 1)
+    expected = sorted(x for x in expected if x[1] not in cancelled)
+    now = 0.0
+    while now < 90_000_000:
+        now += rng.choice((0.5, 37.0, 5000.0, 4_000_000.0))
+        wheel.advance(now)
+        assert all(at <= now for at, _ in fired)
+        assert fired == expected[:len(fired)]
+    assert fired == expected
+
+
+def test_cancel_entity_and_reschedule_from_callback():
+    wheel = TimerWheel(resolution=0.1)
+    log = []
+
+    def ping(e, n):
+        log.append((e, n))
+        if n < 3:
+            wheel.schedule(wheel.now + 1.0, ping, e, n + 1)
+
+    wheel.schedule(1.0, ping, 1, 0)
+    wheel.schedule(1.0, ping, 2, 0)
+    wheel.advance(2.05)
+    assert log == [(1, 0), (2, 0), (1, 1), (2, 1)]
+    assert wheel.cancel_entity(2) == 1
+    wheel.advance(10.0)
+    assert log[4:] == [(1, 2), (1, 3)]
+    assert wheel.pending(1) == 0
+
+
+def test_world_destroy_and_death_cancel_timers():
+    world = World()
+    world.cancel_timers_on(DeadFlag)
+    a, b, c = (world.create_entity() for _ in range(3))
+    fired = []
+    for e in (a, b, c):
+        world.timers.schedule(0.5, fired.append, e)
+    world.destroy_entity(a)
+    world.add_component(b, DeadFlag())
+    for _ in range(40):
+        world.update(0.016)
+    assert fired == [c]
+    assert abs(world.time - 40 * 0.016) < 1e-9
+
+
+def test_egg_hatches_on_its_timer(make_context, dt):
+    ctx = make_context()
+    ctx.aging = {**(ctx.aging or {}), "egg_duration_sec": 0.5}
+    world = World()
+    aging = AgingSystem(ctx)
+    world.add_system(aging, rate=5.0)
+    egg = world.create_entity()
+    world.add_component(egg, Age(lifespan=100.0, stage="Egg"))
+    world.add_component(egg, AffectedByGravity(speed=55.0))
+    t = 0.0
+    while world.get_component(egg, Age).stage == "Egg":
+        world.update(dt)
+        t += dt
+        assert t < 1.0
+    assert t >= 0.5
+    assert world.get_component(egg, AffectedByGravity) is None
+    assert len(world.timers) == 0
+
+
+def test_sliced_cruise_leaves_on_its_deadline(make_context, make_world, make_dummy_fish, dt):
+    # cruise_max_time 0.3 s with 8 cohorts: the deadline timer, not the
+    # cohort turn, decides when the fish is told to go Idle
+    ctx = make_context()
+    ctx.balancing = {**ctx.balancing, "ai_decision_budget": 1, "ai_max_cohorts": 8}
+    world = make_world()
+    fish = [make_dummy_fish(world, x=100 + i, y=200) for i in range(8)]
+    behavior = BehaviorSystem(ctx)
+    assert len(world.timers) == 0
+    late = []
+    for _ in range(40):
+        proposed = behavior.update(world, dt)
+        for e in fish:
+            brain = world.get_component(e, Brain)
+            if proposed.get(e) == "Idle" and brain.state == "Cruise":
+                late.append(brain.state_timer - brain._cruise_max)
+                brain.state = "Idle"
+        world.update(dt)
+    assert len(late) == len(fish)
+    assert max(late) <= 2 * dt + 1e-9
+
+
+def test_eggs_are_not_stepped_and_fast_forward_sees_their_age(make_context, dt):
+    from ecs.systems.gameplay.metabolism import fast_forward_metabolism
+    ctx = make_context()
+    ctx.aging = {**(ctx.aging or {}), "egg_duration_sec": 1.0}
+    world = World()
+    aging = AgingSystem(ctx)
+    world.add_system(aging)
+    egg = world.create_entity()
+    age = Age(lifespan=100.0, stage="Egg")
+    world.add_component(egg, age)
+    for _ in range(30):
+        world.update(dt)
+    assert age.pre_hatch == 0.0 and age.stage == "Egg"  # only the timer is pending
+    assert abs(aging.egg_elapsed(world, egg, age) - 30 * dt) < 1e-9
+    # 0.3 s of catch-up on top of 0.48 s incubated: still an egg, timer rescheduled
+    fast_forward_metabolism(world, ctx, 0.3, aging)
+    assert abs(age.pre_hatch - (30 * dt + 0.3)) < 1e-9 and age.stage == "Egg"
+    t = 0.0
+    while age.stage == "Egg":
+        world.update(dt)
+        t += dt
+    assert 1.0 - (30 * dt + 0.3) <= t < 1.0 - (30 * dt + 0.3) + 2 * dt
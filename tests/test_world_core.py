@@ -25,3 +25,161 @@ def test_destroy_entity_cleans_indices():
     assert e not in world.entities
     assert e not in set(world.entities_with(Position))
     assert e not in set(world.entities_with(Velocity))
+
+def test_destroy_preserves_creation_order_and_compacts():
+    world = World()
+    ents = [world.create_entity() for _ in range(100)]
+    for e in ents:
+        world.add_component(e, Position(e, 0))
+    for e in ents[::2]:
+        world.destroy_entity(e)
+    world.maintain()
+    assert list(world.entities_with(Position)) == ents[1::2]
+    assert list(world.entities) == ents[1::2]
+    assert world.get_component(ents[1], Position).x == ents[1]
+
+def test_destroy_during_query_is_safe():
+    world = World()
+    ents = [world.create_entity() for _ in range(10)]
+    for e in ents:
+        world.add_component(e, Position(0, 0))
+    seen = []
+    for e in world.entities_with(Position):
+        seen.append(e)
+        if e == ents[2]:
+            world.destroy_entity(ents[3])
+    assert ents[3] not in seen
+    assert seen == [e for e in ents if e != ents[3]]
+
+def test_query_rows_track_structural_changes():
+    world = World()
+    e1 = world.create_entity(); world.add_component(e1, Position(1, 2))
+    q = world.query(Position, Velocity)
+    assert len(q) == 0
+    world.add_component(e1, Velocity(3, 4))
+    e2 = world.create_entity(); world.add_component(e2, Velocity(0, 0)); world.add_component(e2, Position(5, 6))
+    rows = list(q)
+    assert [r[0] for r in rows] == [e1, e2]
+    e, pos, vel = rows[0]
+    assert (pos.x, vel.dx) == (1, 3)
+
+    # Replacing a component refreshes the row; removal/destroy drop it
+    world.add_component(e1, Position(9, 9))
+    assert q.get(e1)[1].x == 9
+    world.remove_component(e1, Velocity)
+    world.destroy_entity(e2)
+    assert list(q) == []
+    assert world.query(Position, Velocity) is q
+
+def test_recycled_slot_gets_new_generation():
+    from ecs.entity import EntityTable, entity_index
+    world = World()
+    old = world.create_entity()
+    world.add_component(old, Position(1, 1))
+    side = EntityTable()
+    side[old] = "stale"
+
+    world.destroy_entity(old)
+    new = world.create_entity()
+    assert entity_index(new) == entity_index(old) and new != old
+    assert world.is_alive(new) and not world.is_alive(old)
+    assert world.get_component(new, Position) is None
+    assert side.get(new) is None and side.get(old) == "stale"
+    world.add_component(old, Position(2, 2))  # stale handle is ignored
+    assert list(world.entities_with(Position)) == []
+
+def test_commands_are_deferred_until_sync_point():
+    world = World()
+    e = world.create_entity(); world.add_component(e, Position(0, 0))
+    doomed = world.create_entity(); world.add_component(doomed, Position(1, 1))
+
+    class Spawner:
+        def update(self, w, dt):
+            for ent in w.entities_with(Position):
+                w.commands.add_component(ent, Velocity(1, 0))
+            w.commands.destroy_entity(doomed)
+            # Nothing changed mid-system
+            assert list(w.entities_with(Position, Velocity)) == []
+            assert w.commands.is_pending_destroy(doomed)
+
+    seen = []
+
+    class Reader:
+        def update(self, w, dt):
+            seen.extend(w.entities_with(Position, Velocity))
+
+    world.add_system(Spawner())
+    world.add_system(Reader())
+    world.update(0.016)
+    assert seen == [e]
+    assert not world.is_alive(doomed)
+    assert len(world.commands) == 0
+
+
+def test_columnar_components_are_views_onto_rows():
+    import pytest
+    from ecs.columns import HAVE_NUMPY
+    from ecs.components.core.velocity_component import Velocity
+    if not HAVE_NUMPY:
+        pytest.skip("numpy not installed")
+
+    w = World(columns=True)
+    e = w.create_entity()
+    pos = Position(3.0, 4.0)
+    w.add_component(e, pos)
+    w.add_component(e, Velocity(1.0, 2.0))
+    row = w.columns.row_of(e)
+
+    # Writes through the object land in the columns and vice versa
+    pos.x += 1.0
+    assert w.columns.pos_x[row] == 4.0
+    w.columns.pos_y[row] = 9.0
+    assert pos.y == 9.0
+    assert isinstance(pos, Position) and pos == Position(4.0, 9.0)
+    assert w.get_component(e, Position) is pos
+    assert list(w.query(Position, Velocity)) == [(e, pos, w.get_component(e, Velocity))]
+
+    # Replacing / destroying detaches: the old object keeps its last values
+    w.add_component(e, Position(7.0, 7.0))
+    assert (pos.x, pos.y) == (4.0, 9.0) and w.columns.pos_x[row] == 7.0
+    w.destroy_entity(e)
+    assert len(w.columns) == 0
+    assert type(pos) is Position
+
+class _Recorder:
+    def __init__(self):
+        self.calls = []
+    def update(self, world, dt):
+        self.calls.append(dt)
+
+def test_rate_limited_system_gets_elapsed_time():
+    world = World()
+    every, slow = _Recorder(), _Recorder()
+    world.add_system(every)
+    world.add_system(slow, rate=5.0, offset=0.0)
+    for _ in range(60):
+        world.update(1.0 / 60.0)
+    assert len(every.calls) == 60
+    assert len(slow.calls) == 5
+    assert all(abs(dt - 0.2) < 1e-9 for dt in slow.calls)
+    world.update(0.0)  # paused ticks never fire a periodic system
+    assert len(slow.calls) == 5
+
+def test_periodic_systems_are_staggered_and_account_all_time():
+    world = World()
+    recs = [_Recorder() for _ in range(3)]
+    ticks_fired = [[] for _ in recs]
+    for r in recs:
+        world.add_system(r, period=0.5)
+    for tick in range(120):
+        before = [len(r.calls) for r in recs]
+        world.update(1.0 / 60.0)
+        for i, r in enumerate(recs):
+            if len(r.calls) > before[i]:
+                ticks_fired[i].append(tick)
+    # Different first ticks → the three never all land on one frame
+    assert len({fired[0] for fired in ticks_fired}) == 3
+    for r in recs:
+        # Whatever the phase, dts seen + time still pending == simulated time
+        pending = 2.0 - sum(r.calls)
+        assert 0.0 <= pending < 0.5 + 1e-9
@@ -0,0 +1,138 @@
+# utils/rng.py
+"""
+Seeded random-number service with named, independent streams.
+
+Every consumer draws from its own stream so one subsystem's draws never
+shift another's: audio clips picked only in windowed runs, for instance,
+leave movement and AI identical to a headless run with the same seed.
+
+    rng = RngService(seed=1234)
+    ai = rng.stream(AI)
+    ai.uniform(0.0, 10.0)          # scalar draws (random.Random API)
+    rng.stream(MOVEMENT).uniforms(512)   # block of U[0, 1) for batched paths
+
+Each stream is seeded from (service seed, stream name) through a stable hash,
+so adding a stream does not reseed the others. A stream has two sequences:
+
+* the `random.Random` one behind uniform/choice/random/... (scalar callers);
+* a block sequence of U[0, 1) floats, pre-generated `block_size` at a time
+  with NumPy (plain `random` without it). `uniforms(n)` and `next_uniform()`
+  read the same sequence, so a scalar loop and a vectorized pass that
+  consume it in the same order see identical numbers regardless of how the
+  requests are chunked.
+
+A service built without a seed takes one from the module-level `random`
+(so `random.seed(...)` still pins it, e.g. in tests) and keeps it in
+`RngService.seed` for replaying the run.
+"""
+from __future__ import annotations
+
+import hashlib
+import random
+from typing import Dict, Optional
+
+try:
+    import numpy as np
+    HAVE_NUMPY = True
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+    HAVE_NUMPY = False
+
+__all__ = ["RngService", "RngStream", "MOVEMENT", "AI", "SPAWNING", "AUDIO", "derive_seed"]
+
+# Stream names used by the game
+MOVEMENT = "movement"
+AI = "ai"
+SPAWNING = "spawning"
+AUDIO = "audio"
+
+_DEFAULT_BLOCK = 4096
+
+
+def derive_seed(seed: int, name: str, salt: str = "") -> int:
+    """Stable 64-bit seed for (seed, name[, salt]) (hash() is salted per process)."""
+    digest = hashlib.blake2b(f"{int(seed)}:{name}:{salt}".encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+class RngStream(random.Random):
+    """One named stream: `random.Random` draws plus a pre-generated U[0, 1) block sequence."""
+
+    def __init__(self, name: str, seed: int, block_size: int = _DEFAULT_BLOCK) -> None:
+        self.name = name
+        self.block_size = max(1, int(block_size))
+        super().__init__()
+        self.restart(seed)
+
+    def restart(self, seed: int) -> None:
+        """Re-derive both sequences from the service seed (in place)."""
+        self.seed(derive_seed(seed, self.name))
+        self._block_seed = derive_seed(seed, self.name, "block")
+        self._reset_block()
+
+    def _reset_block(self) -> None:
+        if HAVE_NUMPY:
+            self._gen = np.random.Generator(np.random.PCG64(self._block_seed))
+        else:
+            self._gen = random.Random(self._block_seed)
+        self._buf = np.empty(0) if HAVE_NUMPY else []
+        self._pos = 0
+
+    def _refill(self) -> None:
+        if HAVE_NUMPY:
+            self._buf = self._gen.random(self.block_size)
+        else:
+            self._buf = [self._gen.random() for _ in range(self.block_size)]
+        self._pos = 0
+
+    def next_uniform(self) -> float:
+        """Next U[0, 1) float of the block sequence."""
+        if self._pos >= len(self._buf):
+            self._refill()
+        u = self._buf[self._pos]
+        self._pos += 1
+        return float(u)
+
+    def uniforms(self, n: int):
+        """Next `n` U[0, 1) floats of the block sequence (ndarray with NumPy, else list)."""
+        n = int(n)
+        avail = len(self._buf) - self._pos
+        if n <= avail:
+            out = self._buf[self._pos:self._pos + n]
+            self._pos += n
+            return out.copy() if HAVE_NUMPY else out
+        parts = [self._buf[self._pos:]]
+        need = n - avail
+        while need > 0:
+            self._refill()
+            take = min(need, len(self._buf))
+            parts.append(self._buf[:take])
+            self._pos = take
+            need -= take
+        if HAVE_NUMPY:
+            return np.concatenate(parts)
+        return [u for part in parts for u in part]
+
+
+class RngService:
+    """Owns the named streams for one game/simulation run."""
+
+    def __init__(self, seed: Optional[int] = None, block_size: int = _DEFAULT_BLOCK) -> None:
+        self.block_size = int(block_size)
+        self._streams: Dict[str, RngStream] = {}
+        self.seed = 0
+        self.reseed(seed)
+
+    def reseed(self, seed: Optional[int] = None) -> None:
+        """Restart every stream from `seed` (None → a fresh seed from `random`)."""
+        self.seed = int(seed) if seed is not None else random.getrandbits(63)
+        for s in self._streams.values():
+            s.restart(self.seed)  # in place: callers may hold on to a stream
+
+    def stream(self, name: str) -> RngStream:
+        s = self._streams.get(name)
+        if s is None:
+            s = self._streams[name] = RngStream(name, self.seed, self.block_size)
+        return s
+
+    __getitem__ = stream
@@ -0,0 +1,257 @@
+# utils/spatial.py
+"""
+Uniform-grid spatial hash over logical tank coordinates.
+
+Each item is an axis-aligned box given by its center (x, y) and half
+extents (hw, hh), filed under the cell that holds its center. `update()`
+moves an item and only touches the cell dicts when it crosses a cell
+border, so keeping the grid in sync costs O(1) per moved item.
+
+Queries scan only the cells that can overlap the query, padded by the
+largest half extent ever inserted (so boxes whose center sits in a
+neighbouring cell are still found):
+
+    grid.query_radius(x, y, r)        # boxes whose radius circle meets the disc
+    grid.query_rect(x0, y0, x1, y1)   # boxes overlapping the rect
+    grid.nearest(x, y, k=3)           # [(distance, item), ...] by center distance
+
+`SpatialIndex` bundles one grid per layer ("fish", "pellets", "eggs").
+"""
+from __future__ import annotations
+
+from heapq import heappush, heappushpop
+from math import floor, hypot, inf
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+__all__ = ["UniformGrid", "SpatialIndex", "LAYER_FISH", "LAYER_PELLETS", "LAYER_EGGS"]
+
+LAYER_FISH = "fish"
+LAYER_PELLETS = "pellets"
+LAYER_EGGS = "eggs"
+
+Cell = Tuple[int, int]
+
+
+class UniformGrid:
+    def __init__(self, cell_size: float = 64.0) -> None:
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = float(cell_size)
+        self._inv = 1.0 / self.cell_size
+        # cell -> {item: None} (dicts keep insertion order → deterministic scans)
+        self._cells: Dict[Cell, Dict[Hashable, None]] = {}
+        # item -> [x, y, hw, hh, cell]
+        self._items: Dict[Hashable, list] = {}
+        self._max_half = 0.0
+        # Grow-only [min_cx, min_cy, max_cx, max_cy] of cells ever filed (bounds nearest())
+        self._bounds: Optional[List[int]] = None
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._items
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._items)
+
+    def _cell(self, x: float, y: float) -> Cell:
+        inv = self._inv
+        return (floor(x * inv), floor(y * inv))
+
+    # ---- maintenance ---------------------------------------------------------
+    def update(self, item: Hashable, x: float, y: float, hw: float = 0.0, hh: float = 0.0) -> None:
+        """Insert `item` or move it to a new center/extent."""
+        cell = self._cell(x, y)
+        rec = self._items.get(item)
+        if rec is None:
+            self._items[item] = [x, y, hw, hh, cell]
+            self._file(item, cell)
+        else:
+            if rec[4] != cell:
+                self._unfile(item, rec[4])
+                self._file(item, cell)
+                rec[4] = cell
+            rec[0] = x; rec[1] = y; rec[2] = hw; rec[3] = hh
+        half = hw if hw > hh else hh
+        if half > self._max_half:
+            self._max_half = half
+
+    insert = update
+
+    def remove(self, item: Hashable) -> bool:
+        rec = self._items.pop(item, None)
+        if rec is None:
+            return False
+        self._unfile(item, rec[4])
+        return True
+
+    def _file(self, item: Hashable, cell: Cell) -> None:
+        bucket = self._cells.get(cell)
+        if bucket is None:
+            bucket = self._cells[cell] = {}
+            b = self._bounds
+            cx, cy = cell
+            if b is None:
+                self._bounds = [cx, cy, cx, cy]
+            else:
+                if cx < b[0]: b[0] = cx
+                if cy < b[1]: b[1] = cy
+                if cx > b[2]: b[2] = cx
+                if cy > b[3]: b[3] = cy
+        bucket[item] = None
+
+    def _unfile(self, item: Hashable, cell: Cell) -> None:
+        bucket = self._cells[cell]
+        del bucket[item]
+        if not bucket:
+            del self._cells[cell]
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._items.clear()
+        self._max_half = 0.0
+        self._bounds = None
+
+    @property
+    def max_half_extent(self) -> float:
+        """Largest max(hw, hh) inserted since the last clear()."""
+        return self._max_half
+
+    def position(self, item: Hashable) -> Optional[Tuple[float, float]]:
+        rec = self._items.get(item)
+        return None if rec is None else (rec[0], rec[1])
+
+    # ---- queries -------------------------------------------------------------
+    def _buckets(self, x0: float, y0: float, x1: float, y1: float) -> Iterable[Dict[Hashable, None]]:
+        """Buckets of every cell overlapping the (padded) rect."""
+        pad = self._max_half
+        cx0, cy0 = self._cell(x0 - pad, y0 - pad)
+        cx1, cy1 = self._cell(x1 + pad, y1 + pad)
+        cells = self._cells
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(cells):
+            # Sparse grid: cheaper to filter the occupied cells
+            return [b for (cx, cy), b in cells.items() if cx0 <= cx <= cx1 and cy0 <= cy <= cy1]
+        out = []
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                b = cells.get((cx, cy))
+                if b:
+                    out.append(b)
+        return out
+
+    def query_radius(self, x: float, y: float, r: float) -> List[Hashable]:
+        """Items whose center lies within r + max(hw, hh) of (x, y)."""
+        items = self._items
+        out: List[Hashable] = []
+        for bucket in self._buckets(x - r, y - r, x + r, y + r):
+            for item in bucket:
+                ix, iy, hw, hh, _ = items[item]
+                reach = r + (hw if hw > hh else hh)
+                if hypot(ix - x, iy - y) <= reach:
+                    out.append(item)
+        return out
+
+    def query_rect(self, x0: float, y0: float, x1: float, y1: float) -> List[Hashable]:
+        """Items whose box overlaps [x0, x1] × [y0, y1] (edges inclusive)."""
+        items = self._items
+        out: List[Hashable] = []
+        for bucket in self._buckets(x0, y0, x1, y1):
+            for item in bucket:
+                ix, iy, hw, hh, _ = items[item]
+                if ix + hw >= x0 and ix - hw <= x1 and iy + hh >= y0 and iy - hh <= y1:
+                    out.append(item)
+        return out
+
+    def query_point(self, x: float, y: float, pad: float = 0.0) -> List[Hashable]:
+        return self.query_rect(x - pad, y - pad, x + pad, y + pad)
+
+    def nearest(
+        self,
+        x: float,
+        y: float,
+        k: int = 1,
+        max_dist: float = inf,
+        accept: Optional[Callable[[Hashable], bool]] = None,
+    ) -> List[Tuple[float, Hashable]]:
+        """
+        Up to k (center distance, item) pairs closest to (x, y), nearest first.
+        Scans rings of cells outward and stops once no unscanned cell can beat
+        the current k-th best. `accept(item)` filters candidates (e.g. doomed).
+        """
+        if k <= 0 or not self._items:
+            return []
+        cells = self._cells
+        items = self._items
+        size = self.cell_size
+        ccx, ccy = self._cell(x, y)
+        # Ring limit: enough rings to cover every cell ever occupied
+        b = self._bounds
+        reach = max(0, ccx - b[0], ccy - b[1], b[2] - ccx, b[3] - ccy)
+        # Distance from (x, y) to the nearest edge of its own cell
+        ox = x * self._inv - ccx; oy = y * self._inv - ccy
+        edge = min(ox, 1.0 - ox, oy, 1.0 - oy) * size
+        heap: List[Tuple[float, int, Hashable]] = []  # max-heap via negated distance
+        seq = 0
+        for ring in range(reach + 1):
+            # Everything in this ring or beyond is at least this far away
+            if ring > 0:
+                bound = (ring - 1) * size + edge
+                if bound > max_dist or (len(heap) >= k and bound > -heap[0][0]):
+                    break
+            for cell in _ring(ccx, ccy, ring):
+                bucket = cells.get(cell)
+                if not bucket:
+                    continue
+                for item in bucket:
+                    ix, iy = items[item][0], items[item][1]
+                    d = hypot(ix - x, iy - y)
+                    if d > max_dist or (len(heap) >= k and d >= -heap[0][0]):
+                        continue
+                    if accept is not None and not accept(item):
+                        continue
+                    seq += 1
+                    if len(heap) < k:
+                        heappush(heap, (-d, -seq, item))
+                    else:
+                        heappushpop(heap, (-d, -seq, item))
+        heap.sort(key=lambda t: (-t[0], -t[1]))
+        return [(-nd, item) for nd, _s, item in heap]
+
+
+def _ring(cx: int, cy: int, r: int) -> Iterator[Cell]:
+    """Cells at Chebyshev distance exactly r from (cx, cy)."""
+    if r == 0:
+        yield (cx, cy)
+        return
+    for dx in range(-r, r + 1):
+        yield (cx + dx, cy - r)
+        yield (cx + dx, cy + r)
+    for dy in range(-r + 1, r):
+        yield (cx - r, cy + dy)
+        yield (cx + r, cy + dy)
+
+
+class SpatialIndex:
+    """One UniformGrid per layer, all in logical tank coordinates."""
+
+    def __init__(self, cell_size: float = 64.0, layers: Iterable[str] = (LAYER_FISH, LAYER_PELLETS, LAYER_EGGS)) -> None:
+        self.cell_size = float(cell_size)
+        self.layers: Dict[str, UniformGrid] = {name: UniformGrid(cell_size) for name in layers}
+
+    def __getitem__(self, layer: str) -> UniformGrid:
+        return self.layers[layer]
+
+    def layer(self, name: str) -> UniformGrid:
+        grid = self.layers.get(name)
+        if grid is None:
+            grid = self.layers[name] = UniformGrid(self.cell_size)
+        return grid
+
+    def remove(self, item: Any) -> None:
+        for grid in self.layers.values():
+            grid.remove(item)
+
+    def clear(self) -> None:
+        for grid in self.layers.values():
+            grid.clear()
@@ -0,0 +1,37 @@
+# utils/timestep.py
+"""
+Tick-rate independence helpers.
+
+Per-step tuning values (smoothing factors, damping, per-tick chances) were
+authored for a 60 Hz simulation. These helpers rescale them to the actual
+step `dt`, so behavior is the same at 10, 20 or 60 Hz (and under time_scale):
+
+    blend_factor(s, dt)   1 - (1 - s) ** (dt * 60)   lerp weight toward a target
+    decay_factor(f, dt)   f ** (dt * 60)             multiplicative damping
+    step_chance(p, dt)    1 - (1 - p) ** (dt * 60)   "p per tick" event chance
+
+At dt == 1/60 each returns its input; at dt == 0 (paused) nothing changes.
+"""
+from __future__ import annotations
+
+import const
+
+REFERENCE_HZ = float(const.SIM_REFERENCE_HZ)
+
+
+def blend_factor(s: float, dt: float) -> float:
+    if s >= 1.0:
+        return 1.0
+    return 1.0 - (1.0 - s) ** (dt * REFERENCE_HZ)
+
+
+def decay_factor(f: float, dt: float) -> float:
+    return f ** (dt * REFERENCE_HZ)
+
+
+def step_chance(p: float, dt: float) -> float:
+    if p >= 1.0:
+        return 1.0
+    if p <= 0.0:
+        return 0.0
+    return 1.0 - (1.0 - p) ** (dt * REFERENCE_HZ)
@@ -1,8 +1,61 @@
 # world.py
 from __future__ import annotations
 
-from collections import defaultdict
-from typing import Any, DefaultDict, Dict, Generator, Iterable, List, Optional, Set, Tuple, Type
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Deque, Dict, Generator, List, Optional, Set, Tuple, Type
+
+from ecs.columns import PhysicsColumns
+from ecs.commands import CommandBuffer
+from ecs.entity import INDEX_MASK, make_handle
+from ecs.query import Query
+from ecs.schedule import all_of, build_stages, describe
+from ecs.storage import SparseSet
+from ecs.timers import TimerWheel
+
+# Golden-ratio step: successive periodic systems get well-spread phase offsets
+_STAGGER_STEP = 0.6180339887498949
+
+
+class _ScheduledSystem:
+    """
+    A registered system plus its cadence and run condition.
+
+    period == 0 → every tick. Otherwise `elapsed` accumulates dt and
+    `countdown` counts to the next call, which receives the whole elapsed
+    time (so the sum of dts a system sees always equals simulated time,
+    whatever its phase offset). `run_if(world)` is checked once the system is
+    due; while it is False the system is skipped and a periodic system keeps
+    accumulating its elapsed time.
+    """
+    __slots__ = ("system", "period", "elapsed", "countdown", "run_if")
+
+    def __init__(self, system: Any, period: float = 0.0, offset: float = 0.0,
+                 run_if: Any = None) -> None:
+        self.system = system
+        self.period = period
+        self.elapsed = 0.0
+        self.countdown = period * (1.0 - offset)
+        self.run_if = run_if
+
+    def step(self, world: "World", dt: float) -> Optional[float]:
+        """dt to run the system with this tick, or None to skip it."""
+        if not self.period:
+            if self.run_if is not None and not self.run_if(world):
+                return None
+            return dt
+        self.elapsed += dt
+        self.countdown -= dt
+        if self.countdown > 1e-9:
+            return None
+        self.countdown += self.period
+        if self.countdown <= 0.0:  # dt spanned several periods: restart the cadence
+            self.countdown = self.period
+        if self.run_if is not None and not self.run_if(world):
+            return None
+        step, self.elapsed = self.elapsed, 0.0
+        return step
 
 
 class World:
@@ -10,146 +63,393 @@ class World:
     PHASE_UPDATE = "update"
     PHASE_RENDER = "render"
 
-    def __init__(self) -> None:
-        # Monotonic entity id source
-        self._next_entity_id: int = 1
+    def __init__(self, columns: bool = False, workers: int = 0) -> None:
+        # Generational handles: per-slot generation + FIFO free list of slots.
+        # Slot 0 is reserved so handles are never 0 (see ecs/entity.py).
+        self._generations: List[int] = [0]
+        self._free_slots: Deque[int] = deque()
+
+        # Live entity handles in creation order (O(1) membership + removal).
+        # Iterating it yields handles; `e in world.entities` is a set lookup.
+        self._entities: SparseSet[None] = SparseSet()
+
+        # Per-component-type sparse sets (dense packed storage):
+        # {ComponentClass: SparseSet(entity_id -> component_instance)}
+        self._pools: Dict[Type[Any], SparseSet[Any]] = {}
+
+        # Registered queries, and the queries each component type feeds:
+        # {(ComponentClass, ...): Query}, {ComponentClass: [Query, ...]}
+        self._queries: Dict[Tuple[Type[Any], ...], Query] = {}
+        self._queries_by_type: Dict[Type[Any], List[Query]] = {}
+
+        # Optional NumPy columns for the physics components (ecs/columns.py).
+        # When set, those components are views onto rows of these arrays.
+        self.columns: Optional[PhysicsColumns] = PhysicsColumns() if columns else None
+
+        # Optional spatial index (utils/spatial.SpatialIndex), published by
+        # SpatialIndexSystem; None → callers fall back to brute-force scans.
+        self.spatial = None
 
-        # Per-entity component storage:
-        # {entity_id: {ComponentClass: component_instance}}
-        self._components: Dict[int, Dict[Type[Any], Any]] = {}
+        # Deferred structural changes, applied at sync points in update()
+        self.commands = CommandBuffer(self)
 
-        # Creation order of entities; used to produce stable iteration order
-        self.entities: List[int] = []
+        # Simulated seconds (sum of update dts) and timed events against it
+        # (ecs/timers.py). A destroyed entity's timers are cancelled, as are
+        # those of an entity gaining a type registered with cancel_timers_on().
+        self.time = 0.0
+        self.timers = TimerWheel()
+        self._timer_cancel_types: Set[Type[Any]] = set()
 
-        # Reverse index for fast queries:
-        # {ComponentClass: set(entity_id, ...)}
-        self._component_index: DefaultDict[Type[Any], Set[int]] = defaultdict(set)
+        # Optional FrameProfiler (ecs/profiler.py); None/disabled → untimed loops.
+        # While a profiled section runs, query() adds each query's size here.
+        self.profiler = None
+        self._rows_touched: Optional[int] = None
 
-        # Systems are callables with `update(world, dt)`; separated by phase
-        self._update_systems: List[Any] = []
-        self._render_systems: List[Any] = []
+        # Systems are callables with `update(world, dt)`; separated by phase.
+        # Update systems carry their cadence (see add_system).
+        self._update_systems: List[_ScheduledSystem] = []
+        self._render_systems: List[_ScheduledSystem] = []
+        self._periodic_count = 0
+
+        # Parallel update phase (ecs/schedule.py): with workers > 1, systems
+        # in the same stage run on a thread pool. 0/1 → plain serial loop.
+        self.workers = 0
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._stages: Optional[List[List[int]]] = None
+        self._query_lock = threading.Lock()
+        self.set_workers(workers)
+
+    @property
+    def entities(self) -> SparseSet[None]:
+        """Live entity ids in creation order (iterable, supports `in` and len())."""
+        return self._entities
 
     # -------------------------------------------------------------------------
     # Entity management
     # -------------------------------------------------------------------------
     def create_entity(self) -> int:
-        """Create an empty entity and return its id."""
-        eid = self._next_entity_id
-        self._next_entity_id += 1
-        self.entities.append(eid)
-        self._components[eid] = {}  # empty component map
+        """Create an empty entity and return its handle (recycles freed slots)."""
+        if self._free_slots:
+            slot = self._free_slots.popleft()
+        else:
+            slot = len(self._generations)
+            if slot > INDEX_MASK:
+                raise RuntimeError("World entity slots exhausted")
+            self._generations.append(0)
+        eid = make_handle(slot, self._generations[slot])
+        self._entities.add(eid, None)
         return eid
 
     def destroy_entity(self, entity: int) -> None:
-        """Remove an entity, all its components, and update indices."""
-        comps = self._components.pop(entity, None)
-        if comps:
-            # Remove the entity from all component indices it participated in
-            for ctype in comps:
-                idx = self._component_index.get(ctype)
-                if idx is not None:
-                    idx.discard(entity)
-                    if not idx:
-                        # Keep the reverse index tidy (optional)
-                        self._component_index.pop(ctype, None)
-        # Remove from stable order list
-        try:
-            self.entities.remove(entity)
-        except ValueError:
-            # Already absent (defensive)
-            pass
+        """Remove an entity and all its components. O(number of component types)."""
+        if entity not in self._entities:
+            return  # already absent or a stale handle (defensive)
+        for query in self._queries.values():
+            query._discard(entity)
+        cols = self.columns
+        for ctype, pool in self._pools.items():
+            comp = pool.remove(entity)
+            if cols is not None and comp is not None and ctype in cols:
+                cols.unbind(comp)  # outstanding references keep their last values
+        if cols is not None:
+            cols.release(entity)
+        self.timers.cancel_entity(entity)
+        self._entities.remove(entity)
+        # Invalidate every outstanding copy of this handle, then recycle the slot
+        slot = entity & INDEX_MASK
+        self._generations[slot] += 1
+        self._free_slots.append(slot)
+
+    def is_alive(self, entity: Optional[int]) -> bool:
+        """True while this exact handle is live (stale generations → False)."""
+        return entity in self._entities
 
     # -------------------------------------------------------------------------
     # Component management
     # -------------------------------------------------------------------------
     def add_component(self, entity: int, component: Any) -> None:
-        """Attach/replace a component and update the reverse index."""
-        bucket = self._components.get(entity)
-        if bucket is None:
+        """Attach/replace a component (O(1)) and refresh the affected queries."""
+        if entity not in self._entities:
             # Unknown entity: ignore (or raise if you prefer strictness)
             return
         ctype = type(component)
-        bucket[ctype] = component
-        self._component_index[ctype].add(entity)
+        cols = self.columns
+        if cols is not None:
+            ctype = cols.component_type(ctype)  # a bound view still files under its dataclass
+        pool = self._pools.get(ctype)
+        if cols is not None and ctype in cols:
+            old = None if pool is None else pool.get(entity)
+            if old is not None and old is not component:
+                cols.unbind(old)
+            cols.bind(entity, component)
+        if pool is None:
+            pool = self._pools[ctype] = SparseSet()
+        is_new = pool.add(entity, component)
+        if ctype in self._timer_cancel_types:
+            self.timers.cancel_entity(entity)
+        for query in self._queries_by_type.get(ctype, ()):
+            if is_new:
+                row = self._row_for(entity, query.types)
+                if row is not None:
+                    query._set(entity, row)
+            elif entity in query:
+                # Replaced instance: rebuild the row so it holds the new object
+                query._set(entity, self._row_for(entity, query.types))
 
     def remove_component(self, entity: int, component_type: Type[Any]) -> None:
-        """Detach a component and update the reverse index (if present)."""
-        bucket = self._components.get(entity)
-        if not bucket or component_type not in bucket:
+        """Detach a component (if present) and drop the entity from its queries."""
+        pool = self._pools.get(component_type)
+        comp = None if pool is None else pool.remove(entity)
+        if comp is None:
             return
-        del bucket[component_type]
-        idx = self._component_index.get(component_type)
-        if idx is not None:
-            idx.discard(entity)
-            if not idx:
-                self._component_index.pop(component_type, None)
+        cols = self.columns
+        if cols is not None and component_type in cols:
+            cols.unbind(comp)
+        for query in self._queries_by_type.get(component_type, ()):
+            query._discard(entity)
 
     def get_component(self, entity: int, component_type: Type[Any]) -> Optional[Any]:
         """Fetch a single component; returns None if missing."""
-        bucket = self._components.get(entity)
-        return None if bucket is None else bucket.get(component_type)
+        pool = self._pools.get(component_type)
+        return None if pool is None else pool.get(entity)
 
     def has_components(self, entity: int, *component_types: Type[Any]) -> bool:
         """Quick check that an entity has all of the given components."""
-        bucket = self._components.get(entity)
-        if not bucket:
-            return False
-        return all(ct in bucket for ct in component_types)
+        pools = self._pools
+        for ct in component_types:
+            pool = pools.get(ct)
+            if pool is None or entity not in pool:
+                return False
+        return entity in self._entities
 
     # -------------------------------------------------------------------------
     # Queries
     # -------------------------------------------------------------------------
+    def query(self, *component_types: Type[Any]) -> Query:
+        """
+        Return the registered Query for these component types (created on first
+        use, then maintained incrementally). Iterating it yields
+        `(entity, comp_a, comp_b, ...)` rows in the requested type order.
+        """
+        query = self._queries.get(component_types)
+        if query is not None:
+            if self._rows_touched is not None:
+                self._rows_touched += len(query)
+            return query
+        if not component_types:
+            raise ValueError("query() needs at least one component type")
+        with self._query_lock:  # parallel stages may ask for the same new query
+            return self._create_query(component_types)
+
+    def _create_query(self, component_types: Tuple[Type[Any], ...]) -> Query:
+        query = self._queries.get(component_types)
+        if query is not None:
+            return query
+        query = Query(component_types)
+        # Seed from current state in creation order (stable updates)
+        for eid in self._entities:
+            row = self._row_for(eid, component_types)
+            if row is not None:
+                query._set(eid, row)
+
+        self._queries[component_types] = query
+        for ct in set(component_types):
+            self._queries_by_type.setdefault(ct, []).append(query)
+        if self._rows_touched is not None:
+            self._rows_touched += len(query)
+        return query
+
     def entities_with(self, *component_types: Type[Any]) -> Generator[int, None, None]:
         """
         Yield entity ids that have all requested component types.
-        Uses the reverse index to intersect sets (fast), then yields
-        in entity creation order (stable updates).
+        Backed by the cached query for these types: O(matches) per call,
+        in the order entities joined the query (stable between frames).
         """
         if not component_types:
             # No filter — rare but supported
-            yield from self.entities
+            yield from self._entities
             return
+        yield from self.query(*component_types).entities()
 
-        # Pull the per-component index sets; short-circuit on missing/empty
-        sets: List[Set[int]] = []
-        get = self._component_index.get
+    def _row_for(self, entity: int, component_types: Tuple[Type[Any], ...]) -> Optional[Tuple[Any, ...]]:
+        """Build a query row, or None if the entity lacks any of the types."""
+        pools = self._pools
+        row: List[Any] = [entity]
         for ct in component_types:
-            s = get(ct)
-            if not s:
-                return  # nothing matches at all
-            sets.append(s)
-
-        # Intersect smallest → largest for speed
-        sets.sort(key=len)
-        result: Set[int]
-        if len(sets) == 1:
-            # Single-component fast path: avoid copying into a new set
-            result = sets[0]
-        else:
-            result = sets[0].intersection(*sets[1:])
+            pool = pools.get(ct)
+            comp = None if pool is None else pool.get(entity)
+            if comp is None:
+                return None
+            row.append(comp)
+        return tuple(row)
 
-        # Yield in deterministic creation order (important for stability)
-        for eid in self.entities:
-            if eid in result:
-                yield eid
+    # -------------------------------------------------------------------------
+    # Maintenance
+    # -------------------------------------------------------------------------
+    def maintain(self) -> None:
+        """Squeeze tombstones out of storage. Sync point: never call mid-query."""
+        if self._entities.needs_compact():
+            self._entities.compact()
+        for pool in self._pools.values():
+            if pool.needs_compact():
+                pool.compact()
+        for query in self._queries.values():
+            query._compact()
 
     # -------------------------------------------------------------------------
     # Systems
     # -------------------------------------------------------------------------
-    def add_system(self, system: Any, phase: str = PHASE_UPDATE) -> None:
-        """Register a system for the given phase ('update' or 'render')."""
+    def add_system(self, system: Any, phase: str = PHASE_UPDATE, *,
+                   rate: Optional[float] = None, period: Optional[float] = None,
+                   offset: Optional[float] = None, run_if: Any = None) -> None:
+        """
+        Register a system for the given phase ('update' or 'render').
+
+        Update systems run every tick by default. Pass `rate` (Hz) or
+        `period` (seconds) to run one less often: it is called once per
+        period with dt = the simulated time since its previous call. `offset`
+        (fraction of a period in [0, 1)) shifts its first call; when omitted,
+        periodic systems get staggered offsets so they fire on different ticks.
+
+        `run_if` (either phase) is a condition `cond(world) -> bool` or a list
+        of them (ecs/schedule.py: flag, components_changed, resource_changed);
+        the system is only entered while it holds.
+        """
+        run_if = all_of(run_if)
         if phase == self.PHASE_RENDER:
-            self._render_systems.append(system)
-        else:
-            # Default / anything else routes to update phase
-            self._update_systems.append(system)
+            self._render_systems.append(_ScheduledSystem(system, run_if=run_if))
+            return
+        # Default / anything else routes to update phase
+        if rate is not None:
+            if rate <= 0:
+                raise ValueError("rate must be > 0")
+            period = 1.0 / float(rate)
+        period = float(period or 0.0)
+        if period < 0:
+            raise ValueError("period must be >= 0")
+        if period > 0 and offset is None:
+            offset = (self._periodic_count * _STAGGER_STEP) % 1.0
+        if period > 0:
+            self._periodic_count += 1
+        self._update_systems.append(_ScheduledSystem(system, period, float(offset or 0.0) % 1.0, run_if))
+        self._stages = None
+
+    # -------------------------------------------------------------------------
+    # Parallel scheduling
+    # -------------------------------------------------------------------------
+    def set_workers(self, workers: int) -> None:
+        """Run independent update systems on `workers` threads (<= 1 → serial)."""
+        workers = max(0, int(workers))
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        self.workers = workers
+        if workers > 1:
+            self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="world")
+
+    def schedule(self) -> List[List[Any]]:
+        """Update systems grouped into dependency stages (see ecs/schedule.py)."""
+        if self._stages is None:
+            self._stages = build_stages([entry.system for entry in self._update_systems])
+        entries = self._update_systems
+        return [[entries[i].system for i in stage] for stage in self._stages]
+
+    def describe_schedule(self) -> str:
+        """Debug dump of the resolved update schedule."""
+        entries = self._update_systems
+        self.schedule()
+        notes = []
+        for e in entries:
+            parts = []
+            if e.period:
+                parts.append(f"{1.0 / e.period:g} Hz")
+            if e.run_if is not None:
+                parts.append(f"if {getattr(e.run_if, '__name__', 'run_if')}")
+            notes.append(", ".join(parts))
+        mode = f"{self.workers} workers" if self._pool is not None else "serial"
+        return f"update schedule ({mode})\n" + describe([e.system for e in entries], self._stages, notes)
+
+    # -------------------------------------------------------------------------
+    # Timers
+    # -------------------------------------------------------------------------
+    def cancel_timers_on(self, *component_types: Type[Any]) -> None:
+        """Adding any of these components cancels the entity's pending timers (e.g. DeadFlag)."""
+        self._timer_cancel_types.update(component_types)
+
+    def apply_commands(self) -> int:
+        """Sync point: apply queued structural commands. Never call mid-query."""
+        return self.commands.flush()
 
     def update(self, dt: float) -> None:
-        """Run all update-phase systems."""
-        for system in self._update_systems:
-            system.update(self, dt)
+        """
+        Run the update-phase systems that are due this tick (all of them
+        unless some were registered with a rate). Sync points: commands queued
+        before the phase are applied first, then after each system that
+        queued any.
+
+        `time` advances by dt first and timers that came due fire before the
+        systems run (their commands are applied right away).
+        """
+        commands = self.commands
+        commands.flush()
+        self.maintain()
+        self.time += dt
+        if self.timers:
+            self.timers.advance(self.time)
+            if commands:
+                commands.flush()
+        prof = self.profiler
+        profiled = prof is not None and prof.enabled
+        if profiled:
+            prof.mark(self.PHASE_UPDATE)
+        if self._pool is not None and not profiled:  # profiler timing is single-threaded
+            self._update_stages(dt)
+            return
+        for entry in self._update_systems:
+            step = entry.step(self, dt)
+            if step is None:
+                continue
+            if profiled:
+                prof.run_system(self, entry.system, step)
+            else:
+                entry.system.update(self, step)
+            if commands:
+                commands.flush()
+
+    def _update_stages(self, dt: float) -> None:
+        """Parallel update: stage by stage, commands applied between stages."""
+        if self._stages is None:
+            self.schedule()
+        commands = self.commands
+        entries = self._update_systems
+        pool = self._pool
+        for stage in self._stages:
+            due = []
+            for i in stage:
+                entry = entries[i]
+                step = entry.step(self, dt)
+                if step is not None:
+                    due.append((entry.system, step))
+            if len(due) == 1:
+                system, step = due[0]
+                system.update(self, step)
+            elif due:
+                futures = [pool.submit(system.update, self, step) for system, step in due]
+                for future in futures:
+                    future.result()  # re-raises a system's exception here
+            if commands:
+                commands.flush()
 
     def render(self) -> None:
         """Run all render-phase systems (dt usually unused → pass 0.0)."""
-        for system in self._render_systems:
-            system.update(self, 0.0)
+        prof = self.profiler
+        profiled = prof is not None and prof.enabled
+        if profiled:
+            prof.mark(self.PHASE_RENDER)
+        for entry in self._render_systems:
+            if entry.run_if is not None and not entry.run_if(self):
+                continue
+            if profiled:
+                prof.run_system(self, entry.system, 0.0, phase=self.PHASE_RENDER)
+            else:
+                entry.system.update(self, 0.0)